@@ -1,15 +1,11 @@
 import pytest
-import yaml
 import os
+import html
 import glob
 import time
 import webbrowser
 import logging
 from pytest_html import extras
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options as ChromeOptions
-from selenium.webdriver.firefox.options import Options as FirefoxOptions
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
@@ -17,8 +13,6 @@ from selenium.common.exceptions import TimeoutException
 # If using webdriver-manager, uncomment the next two lines:
 # from webdriver_manager.chrome import ChromeDriverManager
 # from webdriver_manager.firefox import GeckoDriverManager
-from pathlib import Path
-from urllib.parse import urlparse
 
 # Import page objects and helpers to use in fixtures and hooks
 from pages.base_page import BasePage
@@ -29,7 +23,29 @@ from pages.employee_page import EmployeePage
 from pages.department_page import DepartmentPage
 from pages.timesheet_page import TimesheetPage
 from pages.project_page import ProjectPage
-from utils.helpers import TestHelpers
+from utils.driver_factory import DriverFactory
+from utils.driver_pool import DriverPool
+from utils.warm_browsers import WarmBrowserFactory
+from utils.driver_service import DriverServices
+from utils.asset_proxy import AssetProxy
+from utils.profile_template import ProfileTemplate
+from utils.session_cache import AuthSessionCache
+from utils.alerts import AlertMonitor
+from utils.dom_settle import DomSettle
+from utils.app_idle import AppIdle
+from utils.animations import InteractionTimings
+from utils.resource_policy import ResourcePolicy
+from utils.wait_policy import WaitPolicy
+from utils.test_data_store import TestDataStore
+from utils.config_loader import ConfigLoader, ConfigError
+from utils.api_client import ApiClient
+from utils.seeding import DataSeeder
+from utils.stub_server import StubApiServer
+from utils.entity_registry import EntityRegistry
+from utils.entity_pool import EntityPool
+from utils.data_source import DataSource, parse_shard
+from utils.combinatorics import FilterDomains, covering_array, case_id
+from utils.thread_runner import ThreadedRunner
 
 # ---------------- Logging Setup ----------------
 # Set up the root logger for pytest; log messages go to console, HTML, and captured log.
@@ -49,98 +65,161 @@ _auto_open_report = False   # Controls auto-opening of HTML report after tests
 @pytest.fixture(scope="session")
 def config():
     """
-    Loads YAML configuration for the framework from config/config.yaml.
-    Provides access to browser, base_url, waits, etc. for all tests.
+    Effective framework configuration (defaults, config/config.yaml,
+    config/config.<env>.yaml, TRACKORA_* variables, --tk-* options), loaded
+    once per process in pytest_configure. Read-only; provides browser,
+    base_url, waits, etc. for all tests.
     """
-    config_path = Path(__file__).parent / "config" / "config.yaml"
-    with open(config_path, "r") as file:
-        return yaml.safe_load(file)
+    return ConfigLoader.get()
 
 @pytest.fixture(scope="session")
-def test_data():
+def test_data(config):
     """
-    Loads test data and credentials from data/testdata.json.
-    Returns dict for test parametrization and user login.
+    Loads test data and credentials from data/testdata.json, overlaid with
+    data/testdata.<env>.json for the configured env (if present).
+    Returns a read-only mapping for test parametrization and user login.
     """
-    return TestHelpers.load_test_data()
+    TestDataStore.configure(env=config.get("env"))
+    return TestDataStore.get()
 
 # ---------------- Browser Setup Fixtures ----------------
 
-@pytest.fixture
-def setup(config, logger):
-    """
-    Responsible for browser initialization and cleanup for each test:
-      - Loads settings from config.yaml
-      - Starts Chrome or Firefox, with incognito/private based on clear_cache
-      - Navigates to base_url and waits for page to load
-      - Yields driver instance for the test
-    On teardown, closes the browser.
-    """
-    browser = config["browser"].lower()
-    base_url = config["base_url"]
-    implicit_wait = config.get("implicit_wait", 10)
-    clear_cache = config.get("clear_cache", True)
-
-    # --- Browser selection ---
-    if browser == "chrome":
-        chrome_options = ChromeOptions()
-
-        # Disable data breach warnings for passwords
-        chrome_options.add_argument("--disable-features=PasswordManager,CredentialsEnableService,PasswordStore")
-
-        chrome_options.add_argument("--ignore-certificate-errors")
-        chrome_options.add_argument("--allow-insecure-localhost")
-        chrome_options.add_argument("--ignore-ssl-errors")
-        
-        base_url = config["base_url"]
-        parsed_url = urlparse(base_url)
-        origin = f"{parsed_url.scheme}://{parsed_url.netloc}"
-
-        chrome_options.add_argument(f"--unsafely-treat-insecure-origin-as-secure={origin}")
-
-        # Disable Chrome password manager popups and infobars
-        prefs = {
-            "credentials_enable_service": False,
-            "profile.password_manager_enabled": False,
-            # "profile.default_content_setting_values.notifications": 2  # Optional: block notifications
-        }
-        chrome_options.add_experimental_option("prefs", prefs)
-
-        if clear_cache:
-            chrome_options.add_argument("--incognito")
-            logger.info("Launching Chrome in incognito mode (clear_cache=true).")
-        else:
-            logger.info("Launching Chrome in normal mode (clear_cache=false).")
-        # By default, uses system chromedriver. Uncomment for webdriver-manager usage.
-        driver = webdriver.Chrome(
-            service=Service(),
-            options=chrome_options
-        )
-    elif browser == "firefox":
-        firefox_options = FirefoxOptions()
-        if clear_cache:
-            firefox_options.add_argument("--private")
-            logger.info("Launching Firefox in private mode (clear_cache=true).")
-        else:
-            logger.info("Launching Firefox in normal mode (clear_cache=false).")
-        driver = webdriver.Firefox(
-            service=Service(),
-            options=firefox_options
-        )
-    else:
-        raise ValueError(f"Browser {browser} not supported")
+@pytest.fixture(scope="session", autouse=True)
+def configure_waits(config):
+    """
+    Applies wait settings from config.yaml (implicit/explicit waits, dom_settle,
+    app_idle) to the wait helpers.
+    """
+    WaitPolicy.configure(
+        implicit_wait=config.get("implicit_wait", 0),
+        default_timeout=config.get("explicit_wait", 10),
+    )
+    settle_settings = config.get("dom_settle", {}) or {}
+    DomSettle.configure(
+        quiet_ms=settle_settings.get("quiet_window_ms"),
+        timeout=settle_settings.get("timeout"),
+    )
+    idle_settings = config.get("app_idle", {}) or {}
+    AppIdle.configure(
+        quiet_ms=idle_settings.get("quiet_window_ms"),
+        timeout=idle_settings.get("timeout"),
+        timer_threshold_ms=idle_settings.get("timer_threshold_ms"),
+    )
+
+@pytest.fixture(scope="session")
+def driver_services(config):
+    """
+    Session-scoped driver service manager (one shared chromedriver per xdist
+    worker). Reaps browser/driver processes left by crashed runs first and
+    stops the service, killing anything it left running, at session end.
+    """
+    settings = config.get("driver_service") or {}
+    DriverServices.configure(settings)
+    if settings.get("reap_orphans", True):
+        try:
+            DriverServices.reap_orphans()
+        except Exception as e:
+            logging.warning(f"Could not reap orphaned browser processes: {e}")
+    yield DriverServices
+    DriverServices.shutdown()
+
+@pytest.fixture(scope="session")
+def asset_proxy(config):
+    """
+    Session-scoped caching proxy for static frontend assets (one per xdist
+    worker, on-disk cache shared by all), or None when asset_proxy.enabled is false.
+    Browsers launched while it runs are routed through it.
+    """
+    proxy = AssetProxy.from_config(config)
+    if proxy is None:
+        yield None
+        return
+    proxy.start()
+    yield proxy
+    proxy.stop()
+
+@pytest.fixture(scope="session")
+def profile_template(config, driver_services, asset_proxy):
+    """
+    Session-scoped warm Chrome profile template (built once per run, shared by
+    xdist workers), or None when profile_template.enabled is false.
+    Every Chrome launched while it is active runs on its own clone of it.
+    """
+    template = ProfileTemplate.from_config(config)
+    if template is None:
+        yield None
+        return
+    template.start()
+    yield template
+    template.shutdown()
+
+@pytest.fixture(scope="session")
+def warm_browsers(config, driver_services, asset_proxy, profile_template):
+    """
+    Session-scoped background launcher that keeps spare browsers ready
+    (one per xdist worker), or None when warm_browsers.enabled is false.
+    """
+    warm_settings = config.get("warm_browsers", {}) or {}
+    if not warm_settings.get("enabled", True):
+        yield None
+        return
+    factory = WarmBrowserFactory(config, spares=warm_settings.get("spares", 1)).start()
+    yield factory
+    factory.shutdown()
 
-    # --- Driver common setup ---
-    driver.maximize_window()
-    driver.implicitly_wait(implicit_wait)
-    driver.get(base_url)
-    logger.info(f"Navigated to {base_url}")
-    TestHelpers.wait_for_page_load(driver)
+@pytest.fixture(scope="session")
+def driver_pool(config, driver_services, asset_proxy, profile_template, warm_browsers):
+    """
+    Session-scoped pool of browsers (one pool per xdist worker).
+    Browsers are reused across tests and recycled after N tests or on crash.
+    New browsers come from the warm browser factory when enabled.
+    All pooled browsers are closed when the session ends.
+    """
+    pool_settings = config.get("driver_pool", {}) or {}
+    pool = DriverPool(config, recycle_after=pool_settings.get("recycle_after", 25),
+                      launcher=warm_browsers.get if warm_browsers else None)
+    yield pool
+    pool.shutdown()
 
+@pytest.fixture
+def setup(request, config, driver_pool, warm_browsers, logger):
+    """
+    Provides a browser on the login page (base_url) for each test:
+      - By default, borrows a browser from the worker's driver pool; its
+        cookies, storage and extra tabs are reset when the test finishes
+      - Tests marked with @pytest.mark.cold_browser (or driver_pool.enabled: false)
+        get a freshly launched browser that is quit afterwards
+      - Resource blocking (resource_policy) is lifted for tests marked
+        @pytest.mark.allow_resources
+    Yields driver instance for the test.
+    """
+    allow_resources = request.node.get_closest_marker("allow_resources")
+    pool_settings = config.get("driver_pool", {}) or {}
+    use_pool = pool_settings.get("enabled", True) and not request.node.get_closest_marker("cold_browser")
+
+    if not use_pool:
+        logger.info("Launching a cold browser for this test.")
+        driver = warm_browsers.get() if warm_browsers else DriverFactory.create_driver(config)
+        ResourcePolicy.begin_test(driver, allow_resources)
+        yield driver  # Pass browser instance to the test
+        driver.quit()
+        return
+
+    driver = driver_pool.acquire()
+    AlertMonitor.for_driver(driver).clear()  # Alert log covers this test only
+    ResourcePolicy.begin_test(driver, allow_resources)
     yield driver  # Pass browser instance to the test
 
-    # Cleanup after test
-    driver.quit()
+    # Reset and return the browser to the pool after the test
+    driver_pool.release(driver)
+
+@pytest.fixture
+def alert_log(setup):
+    """
+    Provides the AlertMonitor of the test's browser.
+    Use alert_log.collect() / alert_log.texts() to assert on alerts seen during the test.
+    """
+    return AlertMonitor.for_driver(setup)
 
 @pytest.fixture
 def logger(request):
@@ -159,47 +238,59 @@ def login_page(setup):
     """
     return LoginPage(setup)
 
+@pytest.fixture(scope="session")
+def session_cache(config):
+    """
+    Session-scoped cache of authenticated sessions, keyed by user type.
+    Each role logs in through the UI once per worker; later tests reuse the
+    captured cookies and storage tokens until they expire.
+    """
+    cache_settings = config.get("session_cache", {}) or {}
+    return AuthSessionCache(config, expiry_margin=cache_settings.get("expiry_margin", 60))
+
+def _login_as(user_type, config, driver, login_page, session_cache, logger):
+    """
+    Shared body of the role login fixtures.
+    Uses the session cache when enabled, otherwise logs in through the login form.
+    """
+    cache_settings = config.get("session_cache", {}) or {}
+    if cache_settings.get("enabled", True):
+        credentials = session_cache.login(driver, user_type)
+    else:
+        credentials = login_page.login_as_user_type(user_type)
+        # Let the app redirect before looking for the welcome alert
+        if not session_cache.wait_until_authenticated(driver):
+            logger.warning(f"Login as {user_type} did not leave the login page.")
+        base_page = BasePage(driver)  # Use the BasePage with your driver
+        alert_text = base_page.handle_login_popup_alert()
+        if alert_text:
+            logger.info(f"Login popup alert dismissed with text: {alert_text}")
+    logger.info(f"Logged in as {user_type}: {credentials['username']}")
+    return driver, DashboardPage(driver)
+
 @pytest.fixture
-def admin_login(setup, login_page, logger):
+def admin_login(setup, config, login_page, session_cache, logger):
     """
     Logs in using admin user credentials before starting a test.
     Returns driver and DashboardPage object for further actions.
     """
-    credentials = login_page.login_as_user_type("admin")
-    logger.info(f"Logged in as admin: {credentials['username']}")
-    base_page = BasePage(setup)  # Use the BasePage with your driver
-    alert_text = base_page.handle_login_popup_alert(timeout=5)
-    if alert_text:
-        logger.info(f"Login popup alert dismissed with text: {alert_text}")
-    return setup, DashboardPage(setup)
+    return _login_as("admin", config, setup, login_page, session_cache, logger)
 
 @pytest.fixture
-def manager_login(setup, login_page, logger):
+def manager_login(setup, config, login_page, session_cache, logger):
     """
     Logs in using manager user credentials before starting a test.
     Returns driver and DashboardPage object for further actions.
     """
-    credentials = login_page.login_as_user_type("manager")
-    logger.info(f"Logged in as manager: {credentials['username']}")
-    base_page = BasePage(setup)  # Use the BasePage with your driver
-    alert_text = base_page.handle_login_popup_alert(timeout=5)
-    if alert_text:
-        logger.info(f"Login popup alert dismissed with text: {alert_text}")
-    return setup, DashboardPage(setup)
+    return _login_as("manager", config, setup, login_page, session_cache, logger)
 
 @pytest.fixture
-def employee_login(setup, login_page, logger):
+def employee_login(setup, config, login_page, session_cache, logger):
     """
     Logs in using employee user credentials before starting a test.
     Returns driver and DashboardPage object for further actions.
     """
-    credentials = login_page.login_as_user_type("employee")
-    logger.info(f"Logged in as employee: {credentials['username']}")
-    base_page = BasePage(setup)  # Use the BasePage with your driver
-    alert_text = base_page.handle_login_popup_alert(timeout=5)
-    if alert_text:
-        logger.info(f"Login popup alert dismissed with text: {alert_text}")
-    return setup, DashboardPage(setup)
+    return _login_as("employee", config, setup, login_page, session_cache, logger)
 
 # ---------------- Page Object Fixtures ----------------
 
@@ -289,6 +380,194 @@ def project_test_data(test_data):
     """
     return test_data["test_data"]["projects"]
 
+@pytest.fixture
+def data_record(request):
+    """
+    The dataset record of a @pytest.mark.data_source test, read from disk
+    only when the test runs (see pytest_generate_tests).
+    """
+    return request.param.load()
+
+@pytest.fixture
+def filter_case(request):
+    """
+    The filter combination ({filter: value or None}) of a @pytest.mark.combinatorial test.
+    """
+    return dict(request.param)
+
+# ---------------- Seeding Fixtures ----------------
+
+@pytest.fixture(scope="session")
+def seeder(config):
+    """
+    Session-scoped DataSeeder (one per xdist worker) creating entities through
+    the REST API over a shared keep-alive connection pool.
+    With seeding.backend: stub, a local in-memory API is started instead.
+    Entities recorded so far are cleaned up before the API client (and stub) close.
+    """
+    seeding_settings = config.get("seeding", {}) or {}
+    stub = None
+    base_url = None
+    if seeding_settings.get("backend", "http") == "stub":
+        auth = (config.get("api", {}) or {}).get("auth", {}) or {}
+        stub = StubApiServer(login_path=auth.get("login_path", "/auth/login"),
+                             token_field=auth.get("token_field", "token")).start()
+        base_url = stub.base_url
+    data_seeder = DataSeeder.for_config(config, base_url)
+    yield data_seeder
+    cleanup_created_entities(config, EntityRegistry.active, data_seeder.backend)
+    ApiClient.close_all()
+    if stub:
+        stub.stop()
+
+def cleanup_created_entities(config, registry, backend):
+    """
+    Deletes the entities recorded in `registry` through `backend` (batched),
+    keeping the journal for the next run if that fails. No-op without entries.
+    """
+    if registry is None or not registry.pending():
+        return
+    batch_size = (config.get("cleanup", {}) or {}).get("batch_size", 50)
+    try:
+        deleted = registry.cleanup(backend, batch_size=batch_size)
+        logging.info(f"Cleaned up {deleted} entities created during this session.")
+    except Exception as e:
+        registry.close()
+        logging.warning(f"Entity cleanup failed; journal kept at {registry.path}: {e}")
+
+@pytest.fixture(scope="session", autouse=True)
+def entity_registry(config, request):
+    """
+    Records every entity tests create (API seeding and Add* modals) in a
+    crash-safe per-worker journal and deletes them in batches at session end.
+    Journals left by killed runs are cleaned up first.
+    The API is only used when there is something to clean up: runs that create
+    nothing (e.g. UI-only) never start the seeder.
+    """
+    cleanup_settings = config.get("cleanup", {}) or {}
+    if not cleanup_settings.get("enabled", True):
+        yield None
+        return
+
+    started = []  # Seeder started here for recovery; it is torn down after this fixture
+
+    def recovery_backend():
+        started.append(request.getfixturevalue("seeder"))
+        return started[0].backend
+
+    try:
+        recovered = EntityRegistry.recover(recovery_backend,
+                                           stale_after_hours=cleanup_settings.get("stale_after_hours", 12),
+                                           batch_size=cleanup_settings.get("batch_size", 50))
+        if recovered:
+            logging.info(f"Cleaned up {recovered} entities left by earlier runs.")
+    except Exception as e:
+        logging.warning(f"Could not clean up journals of earlier runs: {e}")
+
+    registry = EntityRegistry().open()
+    EntityRegistry.active = registry
+    yield registry
+    EntityRegistry.active = None
+    # A seeder started by tests has cleaned up already (its teardown runs first);
+    # entities created only through the UI need an API client now
+    if registry.pending() and not registry.closed:
+        if started:
+            cleanup_created_entities(config, registry, started[0].backend)
+        else:
+            cleanup_created_entities(config, registry, DataSeeder.for_config(config).backend)
+            ApiClient.close_all()
+    registry.close(remove=not registry.pending())
+
+@pytest.fixture
+def seeded_department(seeder):
+    """
+    A department created through the API for tests that only need one to exist.
+    """
+    return seeder.department()
+
+@pytest.fixture
+def seeded_project(seeder):
+    """
+    A project created through the API for tests that only need one to exist.
+    """
+    return seeder.project()
+
+@pytest.fixture
+def seeded_employee(seeder):
+    """
+    An employee created through the API for tests that only need one to exist.
+    """
+    return seeder.employee()
+
+@pytest.fixture(scope="session")
+def entity_pool(config, seeder, entity_registry):
+    """
+    Run-wide pool of pre-created, read-only entities shared by all workers
+    (file-lock coordinated leases), plus per-worker queues of fresh entities
+    refilled in the background.
+    """
+    pool_settings = config.get("entity_pool", {}) or {}
+    try:
+        EntityPool.recover(seeder.backend,
+                           stale_after_hours=(config.get("cleanup", {}) or {}).get("stale_after_hours", 12))
+    except Exception as e:
+        logging.warning(f"Could not clean up entity pools of earlier runs: {e}")
+    pool = EntityPool(
+        seeder,
+        sizes=pool_settings.get("size", {}),
+        refill=pool_settings.get("refill", {}),
+        lease_timeout=pool_settings.get("lease_timeout", 30),
+    ).attach()
+    yield pool
+    pool.detach()
+
+def _lease(entity_pool, entity_type):
+    entity = entity_pool.lease(entity_type)
+    yield entity
+    entity_pool.release(entity_type, entity)
+
+@pytest.fixture
+def pooled_department(entity_pool):
+    """
+    An existing department leased from the pool. Read-only: do not edit or delete it.
+    """
+    yield from _lease(entity_pool, "department")
+
+@pytest.fixture
+def pooled_project(entity_pool):
+    """
+    An existing project leased from the pool. Read-only: do not edit or delete it.
+    """
+    yield from _lease(entity_pool, "project")
+
+@pytest.fixture
+def pooled_employee(entity_pool):
+    """
+    An existing employee leased from the pool. Read-only: do not edit or delete it.
+    """
+    yield from _lease(entity_pool, "employee")
+
+@pytest.fixture
+def fresh_department(entity_pool):
+    """
+    A new department the test may modify or delete (from the refill queue).
+    """
+    return entity_pool.fresh("department")
+
+@pytest.fixture
+def fresh_project(entity_pool):
+    """
+    A new project the test may modify or delete (from the refill queue).
+    """
+    return entity_pool.fresh("project")
+
+@pytest.fixture
+def fresh_employee(entity_pool):
+    """
+    A new employee the test may modify or delete (from the refill queue).
+    """
+    return entity_pool.fresh("employee")
+
 # ---------------- Utility Fixtures ----------------
 
 @pytest.fixture
@@ -320,15 +599,73 @@ def pytest_addoption(parser):
         default=False,
         help="Automatically open the HTML report in a browser after test run",
     )
+    group = parser.getgroup("trackora", "Trackora configuration overrides (take precedence over TRACKORA_* variables)")
+    group.addoption("--tk-env", default=None, help="Environment name (also selects config/config.<env>.yaml)")
+    group.addoption("--tk-browser", default=None, help="Browser to launch (chrome | firefox)")
+    group.addoption("--tk-browser-profile", default=None, help="Browser profile from config.yaml (e.g. fast-headless)")
+    group.addoption("--tk-base-url", default=None, help="Base URL of the application under test")
+    group.addoption("--tk-implicit-wait", default=None, help="Implicit wait in seconds")
+    group.addoption("--tk-explicit-wait", default=None, help="Default explicit wait timeout in seconds")
+    group.addoption(
+        "--tk-set",
+        action="append",
+        default=[],
+        metavar="KEY=VALUE",
+        help="Override any config value by dotted key, e.g. --tk-set driver_pool.enabled=false (repeatable)",
+    )
+    parser.addoption(
+        "--tk-threads",
+        type=int,
+        default=1,
+        help="Run tests on N threads in this process, each with its own browser (default: 1)",
+    )
+    parser.addoption(
+        "--tk-sample",
+        type=float,
+        default=None,
+        help="Fraction (0-1] of data_source records to run, selected deterministically",
+    )
+    parser.addoption(
+        "--tk-sample-seed",
+        default="0",
+        help="Seed for --tk-sample; the same seed selects the same records",
+    )
+    parser.addoption(
+        "--tk-shard",
+        default=None,
+        help="Run only shard INDEX/COUNT (e.g. 2/4) of data_source records",
+    )
     parser.addini(
         "auto_open_report",
         help="Enable/Disable auto open report (true/false)",
         default="false",
     )
 
+def cli_config_overrides(config):
+    """
+    Collects --tk-* configuration options as {dotted key: value}.
+    """
+    overrides = {
+        "env": config.getoption("--tk-env"),
+        "browser": config.getoption("--tk-browser"),
+        "browser_profile": config.getoption("--tk-browser-profile"),
+        "base_url": config.getoption("--tk-base-url"),
+        "implicit_wait": config.getoption("--tk-implicit-wait"),
+        "explicit_wait": config.getoption("--tk-explicit-wait"),
+    }
+    for assignment in config.getoption("--tk-set"):
+        key, separator, value = assignment.partition("=")
+        if not separator:
+            raise pytest.UsageError(f"--tk-set expects KEY=VALUE, got '{assignment}'")
+        overrides[key.strip()] = value
+    return overrides
+
+@pytest.hookimpl(tryfirst=True)
 def pytest_configure(config):
     """
     Pytest hook called to configure the test run before tests start:
+      - Loads the effective framework configuration (once per process)
+      - Checks --tk-threads can run (output capturing disabled)
       - Creates reports/ directory
       - Determines whether to auto-open the report based on CLI or ini
       - Sets up HTML report filename and location
@@ -336,6 +673,15 @@ def pytest_configure(config):
     """
     global _auto_open_report, _latest_report_path
 
+    try:
+        ConfigLoader.load(cli_config_overrides(config))
+    except ConfigError as e:
+        raise pytest.UsageError(f"Invalid configuration: {e}")
+
+    # Threads share sys.stdout, so per-test output capturing cannot work with --tk-threads
+    if config.getoption("--tk-threads") > 1 and config.getoption("capture") != "no":
+        raise pytest.UsageError("--tk-threads needs output capturing disabled (-s, set in pytest.ini addopts)")
+
     reports_dir = os.path.join(os.getcwd(), "reports")
     os.makedirs(reports_dir, exist_ok=True)
 
@@ -364,6 +710,17 @@ def pytest_sessionfinish(session, exitstatus):
     """
     global _latest_report_path, _auto_open_report
 
+    # Interaction timings of this run, for the suppressed vs. animated comparison
+    for mode in InteractionTimings.modes():
+        InteractionTimings.save(mode)
+    # Resource sizes learned from loaded resources, for the next run's saved-bytes estimate
+    try:
+        ResourcePolicy.save_sizes()
+    except (OSError, TimeoutError) as e:
+        logging.warning(f"Could not save resource sizes: {e}")
+    # Workers that never used the entity pool still count towards deleting it
+    finish_entity_pool(session.config)
+
     if _latest_report_path and os.path.exists(_latest_report_path):
         print(f"\nTest Report Generated: {_latest_report_path}\n")
         if _auto_open_report:
@@ -378,6 +735,32 @@ def pytest_sessionfinish(session, exitstatus):
     else:
         print("Report file not found after test run.")
 
+def finish_entity_pool(pytest_config):
+    """
+    Reports this worker to the run's entity pool if it never attached, so the
+    last worker to finish deletes the pooled entities. Skipped on the xdist
+    controller and for --collect-only runs.
+    """
+    if pytest_config.option.collectonly or EntityPool.attached:
+        return
+    if getattr(pytest_config.option, "numprocesses", None) and not hasattr(pytest_config, "workerinput"):
+        return
+    try:
+        config = ConfigLoader.get()
+    except ConfigError:
+        return
+    if (config.get("seeding", {}) or {}).get("backend", "http") == "stub":
+        backend = None  # Pooled entities lived in the workers' stub APIs, gone by now
+    else:
+        def backend():
+            return DataSeeder.for_config(config).backend
+    try:
+        EntityPool.finish_unattached(backend)
+    except Exception as e:
+        logging.warning(f"Could not report to the entity pool: {e}")
+    finally:
+        ApiClient.close_all()
+
 def cleanup_old_reports(reports_dir):
     """
     Deletes oldest HTML reports so that only MAX_REPORTS are retained.
@@ -400,13 +783,11 @@ def cleanup_old_reports(reports_dir):
 def pytest_metadata(metadata):
     """
     Adds custom project, environment, and run metadata to the pytest-html report.
-    Pulls data from config.yaml if available.
+    Uses the effective configuration loaded in pytest_configure.
     """
     try:
-        cfg_path = Path(__file__).parent / "config" / "config.yaml"
-        with open(cfg_path, "r") as f:
-            cfg = yaml.safe_load(f)
-    except Exception:
+        cfg = ConfigLoader.get()
+    except ConfigError:
         cfg = {}
 
     # Inject custom metadata from YAML config
@@ -414,8 +795,10 @@ def pytest_metadata(metadata):
     metadata["Application"] = "Trackora"
     metadata["Environment"] = cfg.get("env", "Unknown")
     metadata["Browser"] = cfg.get("browser", "Chrome")
+    metadata["Browser Profile"] = cfg.get("browser_profile", "default")
     metadata["Base URL"] = cfg.get("base_url", "https://example.com")
     metadata["Clear Cache"] = str(cfg.get("clear_cache", False))
+    metadata["Animations"] = "suppressed" if (cfg.get("animations") or {}).get("suppress", False) else "on"
     metadata["Start Time"] = time.strftime("%Y-%m-%d %H:%M:%S")
 
     # Add OS username for traceability
@@ -428,6 +811,10 @@ def pytest_metadata(metadata):
 def pytest_runtest_makereport(item, call):
     """
     Pytest hook called after each test phase (setup/call/teardown):
+      - Attach the wait ledger (explicit waits, timeouts, implicit wait check)
+      - Attach DOM settle wait savings (time saved vs. replaced fixed sleeps)
+      - Attach the log of browser alerts seen during the test (if any)
+      - Attach blocked-resource counts and saved bytes (resource_policy)
       - If the test fails, capture screenshot (if browser available)
       - Attach screenshot to HTML report for easy debugging
       - Log screenshot path using the logger fixture
@@ -435,13 +822,58 @@ def pytest_runtest_makereport(item, call):
     outcome = yield
     report = outcome.get_result()
 
+    if report.when == "call":
+        driver = item.funcargs.get("setup", None)
+        test_logger = item.funcargs.get("logger", logging.getLogger(item.name))
+
+        # Report time saved by DOM settle waits versus the fixed sleeps they replaced
+        settle_summary = DomSettle.stats.summary()
+        if settle_summary["calls"]:
+            test_logger.info(
+                f"DOM settle waits: {settle_summary['calls']} call(s), waited {settle_summary['waited_s']}s "
+                f"instead of {settle_summary['sleep_budget_s']}s fixed sleep (saved {settle_summary['saved_s']}s)"
+            )
+            report.user_properties.append(("dom_settle", settle_summary))
+            add_report_extra(report, extras.json(settle_summary, name="DOM Settle Savings"))
+
+        # Report whether the test's browser launch came warm from the background thread
+        warm_summary = WarmBrowserFactory.stats.summary()
+        if warm_summary["hits"] or warm_summary["misses"]:
+            report.user_properties.append(("warm_browsers", warm_summary))
+            add_report_extra(report, extras.json(warm_summary, name="Warm Browser"))
+
+        # Attach wait accounting and prove no implicit wait was active
+        if driver:
+            if not WaitPolicy(driver).verify_no_implicit_wait():
+                test_logger.warning(f"Implicit wait is {WaitPolicy.ledger.implicit_wait}s; expected 0.")
+            wait_summary = WaitPolicy.ledger.summary()
+            report.user_properties.append(("waits", wait_summary))
+            add_report_extra(report, extras.json(wait_summary, name="Wait Ledger"))
+
+        # Attach every browser alert seen during the test (collected without waiting)
+        if driver:
+            monitor = AlertMonitor.for_driver(driver)
+            monitor.collect()
+            if monitor.entries:
+                test_logger.info(f"Alerts seen during test: {monitor.texts()}")
+                add_report_extra(report, extras.json(monitor.entries, name="Browser Alerts"))
+
+        # Attach requests blocked by the resource policy and the bytes they would have cost
+        resource_summary = ResourcePolicy.collect(driver)
+        if resource_summary:
+            report.user_properties.append(("blocked_resources", resource_summary))
+            add_report_extra(report, extras.json(resource_summary, name="Blocked Resources"))
+
     if report.when == "call" and report.failed:
         driver = item.funcargs.get("setup", None)
         test_logger = item.funcargs.get("logger", logging.getLogger(item.name))
 
         if driver:
-            # Prepare screenshots directory
+            # Prepare screenshots directory (one subfolder per thread with --tk-threads)
             screenshots_dir = os.path.join(os.getcwd(), "reports", "screenshots")
+            thread_name = ThreadedRunner.current_thread_name()
+            if thread_name:
+                screenshots_dir = os.path.join(screenshots_dir, thread_name)
             os.makedirs(screenshots_dir, exist_ok=True)
 
             # Save screenshot with test name + timestamp
@@ -452,13 +884,87 @@ def pytest_runtest_makereport(item, call):
             try:
                 driver.save_screenshot(destination)
                 test_logger.error(f"Screenshot saved to: {destination}")
-                if hasattr(report, "extra"):
-                    report.extra.append(extras.png(destination, name="Failure Screenshot"))
-                else:
-                    report.extras = [extras.png(destination, name="Failure Screenshot")]
+                add_report_extra(report, extras.png(destination, name="Failure Screenshot"))
             except Exception as e:
                 test_logger.error(f"Failed to capture screenshot: {e}")
 
+def add_report_extra(report, extra):
+    """
+    Appends an extra (screenshot, JSON, text) to a test report for pytest-html.
+    """
+    if hasattr(report, "extra"):
+        report.extra.append(extra)
+    else:
+        report.extras = getattr(report, "extras", []) + [extra]
+
+def pytest_runtest_setup(item):
+    """
+    Resets per-test wait and warm-browser statistics before each test starts and tags entities
+    created from now on with the test's node id (all per thread with --tk-threads).
+    """
+    DomSettle.stats.reset()
+    WaitPolicy.ledger.reset()
+    WarmBrowserFactory.stats.reset()
+    if EntityRegistry.active is not None:
+        EntityRegistry.active.current_test = item.nodeid
+
+# ---------------- Threaded Execution ----------------
+
+def pytest_runtestloop(session):
+    """
+    Runs the tests on --tk-threads threads inside this process, each thread
+    with its own browser, fixtures, log capture and screenshot folder
+    (see utils/thread_runner.py). With one thread (default) or --collect-only,
+    pytest's own loop runs the tests.
+    """
+    threads = session.config.getoption("--tk-threads")
+    if threads <= 1 or session.config.option.collectonly:
+        return None
+    return ThreadedRunner(session, threads).run()
+
+# ---------------- Data-Driven Parametrization ----------------
+
+def pytest_generate_tests(metafunc):
+    """
+    Parametrizes tests marked @pytest.mark.data_source(name, id_field=None, sample=None, limit=None)
+    with one case per selected dataset record. Only byte offsets are kept at
+    collection time; the `data_record` fixture loads the record when the test runs.
+    --tk-sample overrides the marker's sample fraction; --tk-shard selects a shard.
+    """
+    if metafunc.definition.get_closest_marker("combinatorial"):
+        parametrize_combinatorial(metafunc)
+    marker = metafunc.definition.get_closest_marker("data_source")
+    if marker is None:
+        return
+    if "data_record" not in metafunc.fixturenames:
+        raise pytest.UsageError(f"{metafunc.definition.nodeid}: data_source tests must use the data_record fixture")
+    options = metafunc.config.option
+    source = DataSource(marker.args[0], id_field=marker.kwargs.get("id_field"))
+    refs = source.select(
+        sample=options.tk_sample if options.tk_sample is not None else marker.kwargs.get("sample"),
+        shard=parse_shard(options.tk_shard),
+        seed=options.tk_sample_seed,
+        limit=marker.kwargs.get("limit"),
+    )
+    metafunc.parametrize("data_record", refs, ids=[str(ref.case_id) for ref in refs], indirect=True)
+
+def parametrize_combinatorial(metafunc):
+    """
+    Parametrizes tests marked @pytest.mark.combinatorial(name, strength=2, seed=0)
+    with an n-wise covering array over the filter domains `name` declared in
+    testdata.json instead of the full cartesian product. Each case reaches the test through the `filter_case` fixture.
+    """
+    marker = metafunc.definition.get_closest_marker("combinatorial")
+    if "filter_case" not in metafunc.fixturenames:
+        raise pytest.UsageError(f"{metafunc.definition.nodeid}: combinatorial tests must use the filter_case fixture")
+    domains, constraints = FilterDomains.load(marker.args[0])
+    cases = covering_array(domains, strength=marker.kwargs.get("strength", 2),
+                           constraints=constraints, seed=marker.kwargs.get("seed", 0))
+    logging.getLogger(__name__).debug(
+        f"{metafunc.definition.nodeid}: {len(cases)} cases cover "
+        f"{FilterDomains.exhaustive_size(domains)} combinations {marker.kwargs.get('strength', 2)}-wise")
+    metafunc.parametrize("filter_case", cases, ids=[case_id(case) for case in cases], indirect=True)
+
 # ---------------- Test Collection Ordering Hook ----------------
 
 def pytest_collection_modifyitems(items):
@@ -498,3 +1004,42 @@ def pytest_html_results_summary(prefix, summary, postfix):
     prefix.extend([
         f"Framework: Trackora Selenium-Pytest | Generated at {time.strftime('%Y-%m-%d %H:%M:%S')}"
     ])
+    # Browser launches served warm vs. launched synchronously (this process)
+    warm_summary = WarmBrowserFactory.stats.summary("session")
+    if warm_summary["hits"] or warm_summary["misses"]:
+        prefix.append(f"Warm browsers: {warm_summary['hits']} hit(s), {warm_summary['misses']} miss(es), "
+                      f"{warm_summary['wait_s']}s spent waiting for a browser")
+    # Static assets served from the proxy cache instead of the server (this process)
+    if AssetProxy.active is not None:
+        proxy_summary = AssetProxy.active.stats.summary()
+        if proxy_summary["hit_rate"] is not None:
+            prefix.append(f"Asset proxy: {proxy_summary['hits']} hit(s), {proxy_summary['misses']} miss(es) "
+                          f"(hit rate {proxy_summary['hit_rate']:.0%}), "
+                          f"~{proxy_summary['bytes_saved'] / 1024:.0f} KiB served from cache")
+    # Browsers started on clones of the warm profile template (this process)
+    if ProfileTemplate.active is not None:
+        template_summary = ProfileTemplate.active.summary()
+        if template_summary["clones"]:
+            prefix.append(f"Profile template: {template_summary['clones']} clone(s), "
+                          f"{template_summary['avg_clone_ms']} ms per clone on average "
+                          f"({template_summary['reflinked']} file(s) reflinked, {template_summary['copied']} copied)")
+    # Requests blocked by the resource policy (this process)
+    resource_summary = ResourcePolicy.session_summary()
+    if resource_summary["blocked"]:
+        prefix.append(f"Blocked resources: {resource_summary['blocked']} request(s) in {resource_summary['tests']} test(s), "
+                      f"~{resource_summary['saved_bytes'] / 1024:.0f} KiB saved "
+                      f"({resource_summary['unsized']} of unknown size)")
+    # Interaction timings of this run per animation mode (a mode without any: latest run that has one)
+    modes = InteractionTimings.modes()
+    if modes:
+        suppressed, animated = (InteractionTimings.durations(mode) if mode in modes
+                                else InteractionTimings.load_latest(mode) for mode in ("suppressed", "animated"))
+        comparison = InteractionTimings.compare(suppressed, animated)
+        prefix.append("<details><summary>Interaction timings (median s, animations suppressed vs. on)</summary>"
+                      f"<pre>{html.escape(InteractionTimings.format_table(comparison))}</pre></details>")
+    # Effective configuration, each value annotated with the layer that set it
+    try:
+        prefix.append("<details><summary>Effective configuration</summary>"
+                      f"<pre>{html.escape(ConfigLoader.get().dump())}</pre></details>")
+    except ConfigError:
+        pass
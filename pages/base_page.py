@@ -3,10 +3,12 @@ Base page class containing common functionality for all pages.
 Provides reusable actions and checks for Selenium page objects.
 """
 
-from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException, NoAlertPresentException
-from utils.helpers import TestHelpers
+from selenium.common.exceptions import TimeoutException
+from utils.helpers import TestHelpers, WaitHelpers
+from utils.wait_policy import WaitPolicy
+from utils.alerts import AlertMonitor
+from utils.batch_reader import BatchReader
 
 class BasePage:
     """
@@ -22,21 +24,18 @@ class BasePage:
         - driver: Selenium WebDriver instance (provided by fixture)
         """
         self.driver = driver
-        self.wait = WebDriverWait(driver, 10)  # Default 10s for explicit waits
+        self.waits = WaitPolicy(driver)        # Explicit-only wait policy (implicit wait is 0)
         self.helpers = TestHelpers()           # Utility helpers (static methods)
 
-    def handle_login_popup_alert(self, timeout=5):
+    def handle_login_popup_alert(self, timeout=0):
         """
-        Detect and accept any browser alert popup present.
+        Detect and accept any browser alert popup raised so far.
+        Does not block by default: alerts are recorded by the alert shim as they
+        happen, so only a positive timeout waits for one that has not fired yet.
         Returns alert text if alert was present, else None.
         """
-        try:
-            alert = WebDriverWait(self.driver, timeout).until(lambda d: d.switch_to.alert)
-            alert_text = alert.text
-            alert.accept()
-            return alert_text
-        except (NoAlertPresentException, TimeoutException):
-            return None
+        entry = AlertMonitor.for_driver(self.driver).wait_for_alert(timeout)
+        return entry["text"] if entry else None
 
     def wait_for_element(self, locator, timeout=10):
         """
@@ -84,6 +83,57 @@ class BasePage:
         """
         return self.helpers.is_element_present(self.driver, locator)
 
+    def no_wait(self):
+        """
+        Context manager for instant presence checks (implicit wait forced to 0).
+        Usage:
+            with page.no_wait():
+                rows = page.driver.find_elements(*page.locators.ROWS)
+        """
+        return self.waits.no_wait()
+
+    def find_all(self, locator, timeout=0):
+        """
+        Returns all elements matching locator without implicit waiting.
+        With timeout > 0, waits explicitly for the first match (empty list on timeout).
+        Usage: cards = page.find_all(page.locators.CARDS, timeout=5)
+        """
+        return self.waits.find_all(locator, timeout)
+
+    def read_many(self, locators, attributes=(), styles=(), wait_for=(), timeout=5):
+        """
+        Reads several elements in one browser round trip.
+
+        Args:
+            locators: Dict of {name: locator}.
+            attributes: Attribute names to read from every element.
+            styles: Computed CSS properties to read from every element.
+            wait_for: Names that must be visible first; re-reads (explicitly, up to
+                timeout seconds) until they are, then returns the last snapshot.
+            timeout: Maximum seconds to wait for the `wait_for` names.
+
+        Returns:
+            Dict of {name: {"present", "visible", "text", "attributes", "styles"}}.
+
+        Usage:
+            cards = page.read_many({"title": page.locators.TITLE}, wait_for=["title"])
+            if cards["title"]["visible"]: ...
+        """
+        snapshot = BatchReader.read_many(self.driver, locators, attributes, styles)
+        if not wait_for or all(snapshot[name]["visible"] for name in wait_for):
+            return snapshot
+
+        def all_visible(driver):
+            nonlocal snapshot
+            snapshot = BatchReader.read_many(driver, locators, attributes, styles)
+            return all(snapshot[name]["visible"] for name in wait_for)
+
+        try:
+            self.waits.until(all_visible, timeout, "read_many", ", ".join(wait_for))
+        except TimeoutException:
+            pass
+        return snapshot
+
     def is_element_visible(self, locator, timeout=5):
         """
         Checks if the element is visible. Waits up to timeout seconds.
@@ -104,6 +154,14 @@ class BasePage:
         """
         self.helpers.scroll_to_element(self.driver, locator)
 
+    def wait_for_dom_to_settle(self, locator=None, timeout=None, replaces=0.0):
+        """
+        Waits until the page (or the element's subtree) stops changing.
+        Replaces fixed sleeps after actions that trigger re-rendering.
+        Usage: page.wait_for_dom_to_settle(page.locators.MODAL)
+        """
+        return WaitHelpers.wait_for_dom_to_settle(self.driver, locator, timeout=timeout, replaces=replaces)
+
     def select_dropdown_by_text(self, dropdown_locator, option_text):
         """
         Select option by visible text in a native <select> dropdown.
@@ -139,6 +197,14 @@ class BasePage:
         """
         self.driver.refresh()
 
+    def wait_until_idle(self, timeout=None):
+        """
+        Waits until the app has no requests, short timers or animations pending.
+        Call after filter, submit and navigation actions instead of spinner checks.
+        Usage: page.wait_until_idle()
+        """
+        return self.helpers.wait_until_idle(self.driver, timeout)
+
     def wait_for_page_load(self, timeout=30):
         """
         Waits for the entire page (document.readyState == 'complete').
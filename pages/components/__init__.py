@@ -0,0 +1 @@
+# Components package
@@ -0,0 +1,171 @@
+"""
+Paginator component for Trackora application.
+Walks every page of a paginated listing lazily: rows are read one page at a
+time (one script call per page) and yielded through a generator, so whole
+datasets can be validated without holding every row in memory.
+"""
+
+import logging
+from selenium.common.exceptions import TimeoutException, WebDriverException
+from utils.batch_reader import BatchReader
+from utils.helpers import TestHelpers, WaitHelpers
+from utils.wait_policy import WaitPolicy
+
+logger = logging.getLogger(__name__)
+
+
+class Paginator:
+    """
+    Generator-based pagination over a listing.
+
+    - A page counts as rendered once the active-page indicator shows the new number
+    - Optional direct page jumps (page number links)
+    - Opt-in prefetch: 'Next' is clicked before the current page's rows are
+      handed to the consumer, so the app loads that page while they are checked;
+      a consumer that stops early then leaves the listing one page further on
+    - Stops as soon as the consumer stops iterating
+
+    Usage:
+        for row in page.iter_rows():
+            assert row["Name"]
+    """
+
+    def __init__(self, driver, read_rows, next_locator, active_page_locator,
+                 page_link=None, page_timeout=10):
+        """
+        Args:
+            driver: Selenium WebDriver instance.
+            read_rows: Callable returning the rows of the page currently shown (a list).
+            next_locator: Locator of the 'Next' control.
+            active_page_locator: Locator of the active page number indicator.
+            page_link: Optional callable(page_number) -> locator of a direct page link.
+            page_timeout: Seconds to wait for a page change to render.
+        """
+        self.driver = driver
+        self.read_rows = read_rows
+        self.next_locator = next_locator
+        self.active_page_locator = active_page_locator
+        self.page_link = page_link
+        self.page_timeout = page_timeout
+        self.pages_read = 0
+
+    def current_page(self):
+        """
+        Returns the active page number, or None if no indicator is shown.
+        """
+        texts = BatchReader.read_texts(self.driver, self.active_page_locator)
+        if not texts or not texts[0].isdigit():
+            return None
+        return int(texts[0])
+
+    def has_next(self):
+        """
+        Returns True if a visible, enabled 'Next' control is present.
+        """
+        button = BatchReader.read_many(
+            self.driver, {"next": self.next_locator}, attributes=("aria-disabled", "class", "disabled")
+        )["next"]
+        if not button["visible"]:
+            return False
+        attributes = button["attributes"]
+        return (attributes["aria-disabled"] != "true" and attributes["disabled"] is None
+                and "disabled" not in (attributes["class"] or "").lower())
+
+    def go_to_next(self):
+        """
+        Clicks 'Next' and waits for the active page number to change.
+        Returns True if a new page rendered, False at the end of the listing.
+        """
+        requested, previous = self._request_next()
+        return requested and self._wait_for_page_change(previous)
+
+    def jump_to(self, page_number):
+        """
+        Opens page_number directly through its page link (when page_link is set).
+        Returns True if that page is now active.
+        """
+        if self.current_page() == page_number:
+            return True
+        if not self.page_link:
+            return False
+        link = self.page_link(page_number)
+        if not WaitPolicy(self.driver).is_present(link):
+            return False
+        previous = self.current_page()
+        TestHelpers.safe_click(self.driver, link)
+        return self._wait_for_page_change(previous) and self.current_page() == page_number
+
+    def iter_pages(self, start_page=1, max_pages=None, prefetch=False):
+        """
+        Yields (page number, rows) for every page, one page at a time.
+
+        Args:
+            start_page: First page to read; jumped to directly when page links exist,
+                otherwise reached with 'Next'.
+            max_pages: Stop after this many pages (None for all).
+            prefetch: Click 'Next' before yielding the current rows. Only for
+                consumers that read to the end (or max_pages): stopping early
+                leaves the listing on the page after the last one yielded.
+        """
+        if start_page > 1 and not self.jump_to(start_page):
+            while (self.current_page() or 1) < start_page:
+                if not self.go_to_next():
+                    return
+
+        self.pages_read = 0
+        rows = self.read_rows()
+        page_number = self.current_page() or start_page
+        while True:
+            self.pages_read += 1
+            if max_pages is not None and self.pages_read >= max_pages:
+                yield page_number, rows
+                return
+            if prefetch:
+                # Click 'Next' first: the app loads that page while the consumer checks these rows
+                requested, previous = self._request_next()
+                yield page_number, rows
+            else:
+                yield page_number, rows
+                requested, previous = self._request_next()
+            if not requested or not self._wait_for_page_change(previous):
+                return
+            rows = self.read_rows()
+            page_number = self.current_page() or page_number + 1
+
+    def iter_rows(self, start_page=1, max_pages=None, prefetch=False):
+        """
+        Yields rows across all pages lazily (see iter_pages for the arguments).
+        """
+        for _, rows in self.iter_pages(start_page, max_pages, prefetch):
+            for row in rows:
+                yield row
+
+    def _request_next(self):
+        """
+        Clicks 'Next' without waiting for the new page.
+        Returns (clicked, page number before the click).
+        """
+        if not self.has_next():
+            return False, None
+        previous = self.current_page()
+        TestHelpers.safe_click(self.driver, self.next_locator)
+        return True, previous
+
+    def _wait_for_page_change(self, previous):
+        """
+        Waits until the active page indicator differs from `previous`.
+        Listings without an indicator fall back to waiting for the DOM to settle.
+        """
+        if previous is None:
+            TestHelpers.wait_for_loading_overlay_to_disappear(self.driver, self.page_timeout)
+            return WaitHelpers.wait_for_dom_to_settle(self.driver, timeout=self.page_timeout)
+        try:
+            WaitPolicy(self.driver).until(
+                lambda driver: self.current_page() not in (None, previous),
+                self.page_timeout, "page_change", self.active_page_locator
+            )
+        except (TimeoutException, WebDriverException):
+            logger.warning(f"Page did not change from {previous} within {self.page_timeout}s")
+            return False
+        TestHelpers.wait_for_loading_overlay_to_disappear(self.driver, self.page_timeout)
+        return True
@@ -0,0 +1,189 @@
+"""
+Table reader component for Trackora application.
+Extracts a whole HTML table (plain <table> or Ant Design ant-table-wrapper)
+in one script call into columnar data, so validations run over full columns
+instead of one WebDriver round trip per cell.
+"""
+
+import logging
+from selenium.common.exceptions import WebDriverException
+from utils.batch_reader import LOCATOR_JS
+from utils.wait_policy import WaitPolicy
+
+logger = logging.getLogger(__name__)
+
+# Arguments: locator strategy, locator value, computed style names.
+# The locator may point at the <table> itself or at a container (e.g. the
+# ant-table-wrapper, whose header and body can live in separate tables).
+READ_TABLE_SCRIPT = LOCATOR_JS + """
+var root = tkFindAll(arguments[0], arguments[1])[0];
+var styles = arguments[2];
+if (!root) { return null; }
+var text = function (cell) { return (cell.innerText || '').trim(); };
+var headerRow = root.querySelector('thead tr:last-child');
+var rows = Array.prototype.slice.call(root.querySelectorAll('tbody tr')).filter(function (row) {
+    return !row.classList.contains('ant-table-measure-row') &&
+           !row.classList.contains('ant-table-placeholder') &&
+           row.getAttribute('aria-hidden') !== 'true';
+});
+if (!headerRow && rows.length && rows[0].querySelector('th')) { headerRow = rows.shift(); }
+var headers = headerRow ? Array.prototype.map.call(headerRow.children, text) : [];
+var width = rows.reduce(function (max, row) { return Math.max(max, row.children.length); }, headers.length);
+var cells = [], computed = {}, keys = [];
+for (var c = 0; c < width; c++) { cells.push([]); }
+styles.forEach(function (name) {
+    computed[name] = [];
+    for (var c = 0; c < width; c++) { computed[name].push([]); }
+});
+rows.forEach(function (row, r) {
+    keys.push(row.getAttribute('data-row-key') || String(r));
+    for (var c = 0; c < width; c++) {
+        var cell = row.children[c];
+        cells[c].push(cell ? text(cell) : null);
+        if (styles.length) {
+            var style = cell ? window.getComputedStyle(cell) : null;
+            styles.forEach(function (name) { computed[name][c].push(style ? style.getPropertyValue(name) : null); });
+        }
+    }
+});
+return {headers: headers, cells: cells, styles: computed, row_keys: keys};
+"""
+
+
+class TableData:
+    """
+    Columnar table snapshot.
+
+    - headers: header texts in column order
+    - columns: {column name: [cell text per row]}
+    - styles: {css property: {column name: [value per row]}}
+    - row_index: row keys (data-row-key when present, else the row position)
+    Columns without a header text are named "column_<n>" (1-based).
+    """
+
+    def __init__(self, headers, cells, styles, row_keys):
+        self.headers = headers
+        self.names = self._column_names(headers, len(cells))
+        self.columns = dict(zip(self.names, cells))
+        self.styles = {prop: dict(zip(self.names, values)) for prop, values in styles.items()}
+        self.row_index = row_keys
+
+    @staticmethod
+    def _column_names(headers, width):
+        names = []
+        for position in range(width):
+            name = headers[position] if position < len(headers) else ""
+            if not name or name in names:
+                name = f"column_{position + 1}"
+            names.append(name)
+        return names
+
+    @property
+    def row_count(self):
+        return len(self.row_index)
+
+    def visible_headers(self):
+        """
+        Returns header texts, skipping empty ones (checkbox/action columns).
+        """
+        return [header for header in self.headers if header]
+
+    def column(self, name):
+        """
+        Returns the cell texts of a column. Raises KeyError for unknown columns.
+        """
+        return self.columns[name]
+
+    def column_styles(self, name, prop):
+        """
+        Returns the computed `prop` values of a column (read with styles=[prop]).
+        """
+        return self.styles[prop][name]
+
+    def row(self, position):
+        """
+        Returns one row as {column name: cell text}.
+        """
+        return {name: values[position] for name, values in self.columns.items()}
+
+    def rows(self):
+        """
+        Yields rows one at a time as {column name: cell text}.
+        """
+        for position in range(self.row_count):
+            yield self.row(position)
+
+    def find_mismatches(self, name, predicate):
+        """
+        Runs predicate over a whole column.
+
+        Returns:
+            List of (row key, cell text) for cells where predicate returned False.
+        """
+        return [
+            (key, value)
+            for key, value in zip(self.row_index, self.columns[name])
+            if not predicate(value)
+        ]
+
+
+class TableReader:
+    """
+    Reads a table identified by a locator into TableData with one execute_script call.
+    Usage:
+        table = TableReader(driver).read(locators.PROJECT_DATA_TABLE, styles=["color"])
+        bad_dates = table.find_mismatches("Start Date", is_valid_date)
+    """
+
+    def __init__(self, driver):
+        self.driver = driver
+
+    def read(self, table_locator, styles=(), timeout=10):
+        """
+        Args:
+            table_locator: Locator of the <table> or of a container holding it.
+            styles: Computed CSS properties to read for every cell.
+            timeout: Seconds to wait (explicitly) for the table to be present.
+
+        Returns:
+            TableData, or None if the table did not appear in time.
+        """
+        if not WaitPolicy(self.driver).find_all(table_locator, timeout):
+            return None
+        by, value = table_locator
+        try:
+            result = self.driver.execute_script(READ_TABLE_SCRIPT, by, value, list(styles))
+        except WebDriverException as e:
+            logger.debug(f"Table script failed, reading cells one by one: {e}")
+            result = self._read_each(table_locator, styles)
+        if result is None:
+            return None
+        return TableData(result["headers"], result["cells"], result["styles"], result["row_keys"])
+
+    def _read_each(self, table_locator, styles):
+        """
+        Per-element fallback with the same raw shape as READ_TABLE_SCRIPT.
+        """
+        from selenium.webdriver.common.by import By
+        roots = WaitPolicy(self.driver).find_all(table_locator)
+        if not roots:
+            return None
+        root = roots[0]
+        headers = [th.text.strip() for th in root.find_elements(By.CSS_SELECTOR, "thead tr:last-child > th")]
+        rows = [
+            row for row in root.find_elements(By.CSS_SELECTOR, "tbody tr")
+            if "ant-table-measure-row" not in (row.get_attribute("class") or "")
+            and "ant-table-placeholder" not in (row.get_attribute("class") or "")
+        ]
+        row_cells = [row.find_elements(By.XPATH, "./td|./th") for row in rows]
+        width = max([len(headers)] + [len(cells) for cells in row_cells])
+        cells = [[] for _ in range(width)]
+        computed = {prop: [[] for _ in range(width)] for prop in styles}
+        for row_elements in row_cells:
+            for position in range(width):
+                cell = row_elements[position] if position < len(row_elements) else None
+                cells[position].append(cell.text.strip() if cell else None)
+                for prop in styles:
+                    computed[prop][position].append(cell.value_of_css_property(prop) if cell else None)
+        keys = [row.get_attribute("data-row-key") or str(position) for position, row in enumerate(rows)]
+        return {"headers": headers, "cells": cells, "styles": computed, "row_keys": keys}
@@ -42,21 +42,53 @@ class DashboardPage(BasePage):
         """
         self.click_element(self.locators.WEEK_RADIO_BUTTON)
 
+    def get_metrics_snapshot(self, timeout=5):
+        """
+        Reads all three metric cards and their values in a single browser round trip.
+        Waits (up to timeout seconds) for the values to become visible.
+        Use it to check several metrics at once; the single-metric getters
+        below read (and wait for) only their own element.
+
+        Returns:
+            Dict keyed by "expenses", "revenue" and "profit", each with
+            "card_visible" (bool) and "value" (text, or None if not rendered).
+        """
+        metrics = {
+            "expenses": (self.locators.TOTAL_EXPENSES_CARD, self.locators.TOTAL_EXPENSES_VALUE),
+            "revenue": (self.locators.TOTAL_REVENUE_CARD, self.locators.TOTAL_REVENUE_VALUE),
+            "profit": (self.locators.TOTAL_PROFIT_CARD, self.locators.TOTAL_PROFIT_VALUE),
+        }
+        locators = {}
+        for name, (card, value) in metrics.items():
+            locators[f"{name}_card"] = card
+            locators[f"{name}_value"] = value
+        snapshot = self.read_many(locators, wait_for=[f"{name}_value" for name in metrics], timeout=timeout)
+        return {
+            name: {
+                "card_visible": snapshot[f"{name}_card"]["visible"],
+                "value": snapshot[f"{name}_value"]["text"] if snapshot[f"{name}_value"]["visible"] else None,
+            }
+            for name in metrics
+        }
+
     def get_total_expenses_value(self):
         """
         Reads and returns the total expenses value displayed on the dashboard.
+        Raises TimeoutException if the value is not shown in time.
         """
         return self.get_element_text(self.locators.TOTAL_EXPENSES_VALUE)
 
     def get_total_revenue_value(self):
         """
         Reads and returns the total revenue value displayed on the dashboard.
+        Raises TimeoutException if the value is not shown in time.
         """
         return self.get_element_text(self.locators.TOTAL_REVENUE_VALUE)
 
     def get_total_profit_value(self):
         """
         Reads and returns the total profit value displayed on the dashboard.
+        Raises TimeoutException if the value is not shown in time.
         """
         return self.get_element_text(self.locators.TOTAL_PROFIT_VALUE)
 
@@ -81,26 +113,34 @@ class DashboardPage(BasePage):
     def navigate_to_revenue_panel(self):
         """
         Navigates the browser to the Revenue Panel page via navigation tab.
+        Waits until the new page has loaded its data.
         """
         self.click_element(self.locators.REVENUE_PANEL_TAB)
+        self.wait_until_idle()
 
     def navigate_to_employee_management(self):
         """
         Navigates the browser to the Employee Management page via navigation tab.
+        Waits until the new page has loaded its data.
         """
         self.click_element(self.locators.EMPLOYEE_TAB)
+        self.wait_until_idle()
 
     def navigate_to_timesheet(self):
         """
         Navigates the browser to the Timesheet page via navigation tab.
+        Waits until the new page has loaded its data.
         """
         self.click_element(self.locators.TIMESHEET_TAB)
+        self.wait_until_idle()
 
     def navigate_to_project_management(self):
         """
         Navigates the browser to the Project Management page via navigation tab.
+        Waits until the new page has loaded its data.
         """
         self.click_element(self.locators.PROJECT_TAB)
+        self.wait_until_idle()
 
     def select_filter_scope(self, scope_value):
         """
@@ -110,6 +150,7 @@ class DashboardPage(BasePage):
             scope_value: Value string to select in the scope dropdown.
         """
         self.select_dropdown_by_value(self.locators.FILTER_BY_SCOPE_DROPDOWN, scope_value)
+        self.wait_until_idle()  # Metric cards reload for the new scope
 
     def logout(self):
         """
@@ -2,6 +2,8 @@
 Department page object for Trackora application.
 """
 
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import TimeoutException
 from pages.base_page import BasePage
 from utils.locators import DepartmentPageLocators
 
@@ -30,26 +32,47 @@ class DepartmentPage(BasePage):
     
     def get_edit_buttons_count(self):
         """Get count of edit buttons"""
-        elements = self.driver.find_elements(*self.locators.EDIT_BUTTONS)
+        elements = self.find_all(self.locators.EDIT_BUTTONS, timeout=5)
         return len(elements)
     
     def get_delete_buttons_count(self):
         """Get count of delete buttons"""
-        elements = self.driver.find_elements(*self.locators.DELETE_BUTTONS)
+        elements = self.find_all(self.locators.DELETE_BUTTONS, timeout=5)
         return len(elements)
     
     def click_first_edit_button(self):
         """Click the first edit button"""
-        edit_buttons = self.driver.find_elements(*self.locators.EDIT_BUTTONS)
+        edit_buttons = self.find_all(self.locators.EDIT_BUTTONS, timeout=5)
         if edit_buttons:
             edit_buttons[0].click()
     
     def click_first_delete_button(self):
         """Click the first delete button"""
-        delete_buttons = self.driver.find_elements(*self.locators.DELETE_BUTTONS)
+        delete_buttons = self.find_all(self.locators.DELETE_BUTTONS, timeout=5)
         if delete_buttons:
             delete_buttons[0].click()
     
+    def is_department_row_displayed(self, department_name, timeout=5):
+        """Check if the table has a row for department_name"""
+        return self.is_element_visible(self.locators.department_row_locator(department_name), timeout)
+
+    def is_department_row_removed(self, department_name, timeout=10):
+        """Wait until the row for department_name is gone; returns True if it is"""
+        locator = self.locators.department_row_locator(department_name)
+        try:
+            return self.waits.until(EC.invisibility_of_element_located(locator), timeout, "row_removed", locator)
+        except TimeoutException:
+            return False
+
+    def click_edit_button_for(self, department_name):
+        """Click Edit in the row of department_name"""
+        self.click_element(self.locators.edit_button_locator(department_name))
+
+    def delete_department(self, department_name):
+        """Delete department_name from its row (the confirm dialog is accepted by the alert shim)"""
+        self.click_element(self.locators.delete_button_locator(department_name))
+        self.wait_until_idle()  # Wait for the delete request and the list refresh
+
     def are_department_records_displayed(self):
         """Check if department records are displayed"""
         return self.is_department_table_displayed() and self.get_edit_buttons_count() > 0
\ No newline at end of file
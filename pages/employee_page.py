@@ -34,7 +34,7 @@ class EmployeePage(BasePage):
     
     def get_employee_cards_count(self):
         """Get count of employee cards"""
-        elements = self.driver.find_elements(*self.locators.EMPLOYEE_CARDS)
+        elements = self.find_all(self.locators.EMPLOYEE_CARDS, timeout=5)
         return len(elements)
     
     def are_employee_cards_displayed(self):
@@ -48,7 +48,9 @@ class EmployeePage(BasePage):
     def navigate_to_department_tab(self):
         """Navigate to Department tab"""
         self.click_element(self.locators.DEPARTMENT_TAB)
+        self.wait_until_idle()
     
     def navigate_to_employee_tab(self):
         """Navigate to Employee tab"""
-        self.click_element(self.locators.EMPLOYEE_TAB)
\ No newline at end of file
+        self.click_element(self.locators.EMPLOYEE_TAB)
+        self.wait_until_idle()
\ No newline at end of file
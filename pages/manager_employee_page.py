@@ -5,6 +5,8 @@ Manager Employee page object for Trackora application.
 from pages.base_page import BasePage
 from selenium.webdriver.support.ui import Select
 from utils.locators import ManagerEmployeesPageLocators
+from utils.batch_reader import BatchReader
+from pages.components.paginator import Paginator
 from selenium.webdriver.common.by import By
 
 class ManagerEmployeePage(BasePage):
@@ -28,12 +30,12 @@ class ManagerEmployeePage(BasePage):
     
     #Selects an option from the department dropdown by matching the visible text.
     def select_dropdown_by_text(self, text):
-        department_dropdown = Select(self.driver.find_element(By.NAME, "department")) 
+        department_dropdown = Select(self.wait_for_element((By.NAME, "department")))
         department_dropdown.select_by_visible_text(text)
         
     #Retrieves the currently selected option's visible text from the department dropdown.
     def get_selected_department(self):
-        select = Select (self.driver.find_element(By.NAME, "department"))
+        select = Select(self.wait_for_element((By.NAME, "department")))
         return select.first_selected_option.text.strip()
     
     def toggle_shared_resources(self):
@@ -42,7 +44,7 @@ class ManagerEmployeePage(BasePage):
 
     def get_employee_cards_count(self):
         """Get count of employee cards"""
-        elements = self.driver.find_elements(*self.locators.EMPLOYEE_CARDS)
+        elements = self.find_all(self.locators.EMPLOYEE_CARDS, timeout=5)
         return len(elements)
 
     def are_employee_cards_displayed(self):
@@ -51,4 +53,12 @@ class ManagerEmployeePage(BasePage):
     
     def is_pagination_present(self):
         """Check if pagination is present"""
-        return self.is_element_present(self.locators.PAGINATION_CONTROLS)
\ No newline at end of file
+        return self.is_element_present(self.locators.PAGINATION_CONTROLS)
+
+    def iter_rows(self, start_page=1, max_pages=None):
+        """Lazily yield the text of every employee card across all pages"""
+        paginator = Paginator(self.driver,
+                              lambda: BatchReader.read_texts(self.driver, self.locators.EMPLOYEE_CARDS),
+                              self.locators.NEXT_BUTTON, self.locators.PAGINATION_ACTIVE_PAGE_NUMBER,
+                              page_link=self.locators.page_number_locator)
+        return paginator.iter_rows(start_page=start_page, max_pages=max_pages)
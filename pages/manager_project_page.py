@@ -3,6 +3,8 @@ Manager Project page object for Trackora application.
 """
 
 from pages.base_page import BasePage
+from pages.components.table_reader import TableReader
+from utils.batch_reader import BatchReader
 from utils.locators import MangerProjectPageLocators
 
 class ManagerProjectPage(BasePage):
@@ -37,13 +39,40 @@ class ManagerProjectPage(BasePage):
         self.select_dropdown_by_text(self.locators.PROJECT_STATUS_DROPDOWN, status)
     
     def click_submit_button(self):
-        """Click Submit button"""
+        """Click Submit button and wait for the filtered results to load"""
         self.click_element(self.locators.SUBMIT_BUTTON)
+        self.wait_until_idle()
     
     def click_reset_button(self):
-        """Click Reset button"""
+        """Click Reset button and wait for the unfiltered results to load"""
         self.click_element(self.locators.RESET_BUTTON)
+        self.wait_until_idle()
+
+    def apply_filters(self, skill=None, department=None, manager=None, status=None):
+        """Apply multiple filters"""
+        if skill:
+            self.select_skill_filter(skill)
+        if department:
+            self.select_department_filter(department)
+        if manager:
+            self.select_manager_filter(manager)
+        if status:
+            self.select_project_status_filter(status)
+        self.click_submit_button()
+
+    def get_filter_domains(self):
+        """Read the options of all four filter dropdowns in one call ({filter: [option texts]})"""
+        return BatchReader.read_select_options(self.driver, {
+            "skill": self.locators.SKILL_DROPDOWN,
+            "department": self.locators.DEPARTMENT_DROPDOWN,
+            "manager": self.locators.MANAGER_DROPDOWN,
+            "status": self.locators.PROJECT_STATUS_DROPDOWN,
+        })
 
     def is_project_table_displayed(self):
         """Check if project table is displayed"""
-        return self.is_element_visible(self.locators.PROJECT_TABLE)
\ No newline at end of file
+        return self.is_element_visible(self.locators.PROJECT_TABLE)
+
+    def read_project_table(self, styles=()):
+        """Read the whole project table (headers, cell texts, optional styles) in one call"""
+        return TableReader(self.driver).read(self.locators.PROJECT_DATA_TABLE, styles)
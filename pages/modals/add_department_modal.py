@@ -5,6 +5,7 @@ Add Department Modal page object for Trackora application.
 from pages.base_page import BasePage
 from utils.locators import AddDepartmentModalLocators
 from utils.helpers import WaitHelpers
+from utils.entity_registry import EntityRegistry
 
 class AddDepartmentModal(BasePage):
     """Add Department Modal class"""
@@ -37,6 +38,7 @@ class AddDepartmentModal(BasePage):
     def click_ok_button(self):
         """Click OK button"""
         self.click_element(self.locators.OK_BUTTON)
+        self.wait_until_idle()  # Wait for the save request and the list refresh
     
     def click_cancel_button(self):
         """Click Cancel button"""
@@ -54,4 +56,6 @@ class AddDepartmentModal(BasePage):
     def save_department(self, department_data):
         """Fill details and save department"""
         self.fill_department_details(department_data)
-        self.click_ok_button()
\ No newline at end of file
+        self.click_ok_button()
+        # Record for end-of-session cleanup (resolved to an id by name)
+        EntityRegistry.record_created("department", name=department_data.get("name"))
\ No newline at end of file
@@ -5,6 +5,7 @@ Add Employee Modal page object for Trackora application.
 from pages.base_page import BasePage
 from utils.locators import AddEmployeeModalLocators
 from utils.helpers import WaitHelpers
+from utils.entity_registry import EntityRegistry
 
 class AddEmployeeModal(BasePage):
     """Add Employee Modal class"""
@@ -34,6 +35,18 @@ class AddEmployeeModal(BasePage):
         """Enter email"""
         self.send_keys_to_element(self.locators.EMAIL_INPUT, email)
     
+    def get_first_name(self):
+        """Get the value currently in the first name input"""
+        return self.wait_for_element(self.locators.FIRST_NAME_INPUT).get_attribute("value")
+    
+    def get_last_name(self):
+        """Get the value currently in the last name input"""
+        return self.wait_for_element(self.locators.LAST_NAME_INPUT).get_attribute("value")
+    
+    def get_email(self):
+        """Get the value currently in the email input"""
+        return self.wait_for_element(self.locators.EMAIL_INPUT).get_attribute("value")
+    
     def enter_password(self, password):
         """Enter password"""
         self.send_keys_to_element(self.locators.PASSWORD_INPUT, password)
@@ -57,6 +70,7 @@ class AddEmployeeModal(BasePage):
     def click_save_button(self):
         """Click Save Details button"""
         self.click_element(self.locators.SAVE_BUTTON)
+        self.wait_until_idle()  # Wait for the save request and the list refresh
     
     def click_cancel_button(self):
         """Click Cancel button"""
@@ -80,4 +94,6 @@ class AddEmployeeModal(BasePage):
     def save_employee(self, employee_data):
         """Fill details and save employee"""
         self.fill_employee_details(employee_data)
-        self.click_save_button()
\ No newline at end of file
+        self.click_save_button()
+        # Record for end-of-session cleanup (resolved to an id by email)
+        EntityRegistry.record_created("employee", name=employee_data.get("email"))
\ No newline at end of file
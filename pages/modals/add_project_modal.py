@@ -5,6 +5,7 @@ Add Project Modal page object for Trackora application.
 from pages.base_page import BasePage
 from utils.locators import AddProjectModalLocators
 from utils.helpers import WaitHelpers
+from utils.entity_registry import EntityRegistry
 
 class AddProjectModal(BasePage):
     """Add Project Modal class"""
@@ -26,6 +27,10 @@ class AddProjectModal(BasePage):
         """Enter project name"""
         self.send_keys_to_element(self.locators.PROJECT_NAME_INPUT, project_name)
     
+    def get_project_name(self):
+        """Get the value currently in the project name input"""
+        return self.wait_for_element(self.locators.PROJECT_NAME_INPUT).get_attribute("value")
+    
     def enter_project_description(self, description):
         """Enter project description"""
         self.send_keys_to_element(self.locators.PROJECT_DESCRIPTION_INPUT, description)
@@ -45,6 +50,7 @@ class AddProjectModal(BasePage):
     def click_add_project_button(self):
         """Click Add Project button"""
         self.click_element(self.locators.ADD_PROJECT_BUTTON)
+        self.wait_until_idle()  # Wait for the save request and the list refresh
     
     def click_cancel_button(self):
         """Click Cancel button"""
@@ -66,4 +72,6 @@ class AddProjectModal(BasePage):
     def save_project(self, project_data):
         """Fill details and save project"""
         self.fill_project_details(project_data)
-        self.click_add_project_button()
\ No newline at end of file
+        self.click_add_project_button()
+        # Record for end-of-session cleanup (resolved to an id by name)
+        EntityRegistry.record_created("project", name=project_data.get("name"))
\ No newline at end of file
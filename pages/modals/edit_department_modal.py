@@ -48,6 +48,7 @@ class EditDepartmentModal(BasePage):
     def click_ok_button(self):
         """Click OK button"""
         self.click_element(self.locators.OK_BUTTON)
+        self.wait_until_idle()  # Wait for the save request and the list refresh
     
     def click_cancel_button(self):
         """Click Cancel button"""
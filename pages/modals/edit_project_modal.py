@@ -43,10 +43,12 @@ class EditProjectModal(BasePage):
     def click_update_button(self):
         """Click Update button"""
         self.click_element(self.locators.UPDATE_BUTTON)
+        self.wait_until_idle()  # Wait for the save request and the list refresh
 
     def click_delete_button(self):
         """Click Delete button"""
         self.click_element(self.locators.DELETE_BUTTON)
+        self.wait_until_idle()  # Wait for the delete request and the list refresh
 
     def click_cancel_button(self):
         """Click Cancel button"""
@@ -42,6 +42,10 @@ class ManageAssignedEmployeesModal(BasePage):
         """Check if employee list is displayed"""
         return self.is_element_visible(self.locators.EMPLOYEE_LIST)
 
+    def is_employee_listed(self, employee_name, timeout=5):
+        """Check if the employee list shows an entry for employee_name"""
+        return self.is_element_visible(self.locators.employee_list_item_locator(employee_name), timeout)
+
     def click_assign_button(self):
         """Click Assign button"""
         self.click_element(self.locators.ASSIGN_BUTTON)
@@ -57,9 +61,8 @@ class ManageAssignedEmployeesModal(BasePage):
     def search_and_assign_employee(self, employee_name):
         """Search for employee and assign"""
         self.search_employees(employee_name)
-        # Wait for search results
-        import time
-        time.sleep(2)
+        # Wait for search results to render
+        self.wait_for_dom_to_settle(self.locators.MODAL, replaces=2)
         self.click_assign_button()
 
     def search_by_multiple_criteria(self, employee_name=None, role=None, primary_skill=None, secondary_skill=None):
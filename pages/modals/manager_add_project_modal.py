@@ -6,11 +6,10 @@ from pages.base_page import BasePage
 
 from utils.helpers import WaitHelpers
 from utils.locators import ManagerAddProjectModalLocators
-from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.by import By
 from selenium.common.exceptions import TimeoutException
-import time
+from utils.entity_registry import EntityRegistry
 
 class ManagerAddProjectModal(BasePage):
     """Add Project Modal class"""
@@ -30,16 +29,14 @@ class ManagerAddProjectModal(BasePage):
     
     def get_all_status_elements(self):
         # Adjust this selector based on your HTML
-        return self.driver.find_elements(By.CSS_SELECTOR, ".project-status")
+        return self.find_all((By.CSS_SELECTOR, ".project-status"))
     
     def enter_project_name(self, project_name):
         """Enter project name"""
         self.send_keys_to_element(self.locators.PROJECT_NAME_INPUT, project_name)
 
     def get_text_from_element(self, locator, timeout=10):
-        element = WebDriverWait(self.driver, timeout).until(
-        EC.visibility_of_element_located(locator)
-        )
+        element = self.waits.until(EC.visibility_of_element_located(locator), timeout, "visible", locator)
         return element.text.strip()
     
     def get_selected_primary_owner(self):
@@ -49,7 +46,7 @@ class ManagerAddProjectModal(BasePage):
     def enter_primary_owner(self, primary_owner):
         """Enter primary owner"""
         self.select_dropdown_by_text(self.locators.PRIMARY_OWNER_INPUT, primary_owner)
-        time.sleep(1)  # Wait for selection to register
+        self.wait_for_dom_to_settle(self.locators.MODAL, replaces=1)  # Wait for selection to register
     
 
     
@@ -76,6 +73,7 @@ class ManagerAddProjectModal(BasePage):
     def click_add_project_button(self):
         """Click Add Project button"""
         self.click_element(self.locators.ADD_PROJECT_BUTTON)
+        self.wait_until_idle()  # Wait for the save request and the list refresh
     
     def click_cancel_button(self):
         """Click Cancel button"""
@@ -105,4 +103,6 @@ class ManagerAddProjectModal(BasePage):
     def save_project(self, project_data):
         """Fill details and save project"""
         self.fill_project_details(project_data)
-        self.click_add_project_button()
\ No newline at end of file
+        self.click_add_project_button()
+        # Record for end-of-session cleanup (resolved to an id by name)
+        EntityRegistry.record_created("project", name=project_data.get("name"))
\ No newline at end of file
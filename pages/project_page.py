@@ -3,6 +3,9 @@ Project page object for Trackora application.
 """
 
 from pages.base_page import BasePage
+from pages.components.table_reader import TableReader
+from pages.components.paginator import Paginator
+from utils.batch_reader import BatchReader
 from utils.locators import ProjectPageLocators
 
 class ProjectPage(BasePage):
@@ -12,9 +15,20 @@ class ProjectPage(BasePage):
         super().__init__(driver)
         self.locators = ProjectPageLocators()
     
+    def get_page_state(self, wait_for=(), timeout=5):
+        """Read title, table, pagination and Next/Previous buttons in one round trip"""
+        locators = {
+            "title": self.locators.PAGE_TITLE,
+            "table": self.locators.PROJECT_TABLE,
+            "pagination": self.locators.PAGINATION_CONTROLS,
+            "next": self.locators.NEXT_BUTTON,
+            "previous": self.locators.PREVIOUS_BUTTON,
+        }
+        return self.read_many(locators, wait_for=wait_for, timeout=timeout)
+
     def is_project_page_loaded(self):
         """Check if project page is loaded"""
-        return self.is_element_visible(self.locators.PAGE_TITLE)
+        return self.get_page_state(wait_for=["title"])["title"]["visible"]
     
     def click_add_project_button(self):
         """Click Add Project button"""
@@ -37,36 +51,38 @@ class ProjectPage(BasePage):
         self.select_dropdown_by_text(self.locators.PROJECT_STATUS_DROPDOWN, status)
     
     def click_submit_button(self):
-        """Click Submit button"""
+        """Click Submit button and wait for the filtered results to load"""
         self.click_element(self.locators.SUBMIT_BUTTON)
+        self.wait_until_idle()
     
     def click_reset_button(self):
-        """Click Reset button"""
+        """Click Reset button and wait for the unfiltered results to load"""
         self.click_element(self.locators.RESET_BUTTON)
+        self.wait_until_idle()
     
     def is_project_table_displayed(self):
         """Check if project table is displayed"""
-        return self.is_element_visible(self.locators.PROJECT_TABLE)
+        return self.get_page_state(wait_for=["table"])["table"]["visible"]
     
     def get_project_rows_count(self):
         """Get count of project rows"""
-        elements = self.driver.find_elements(*self.locators.PROJECT_ROWS)
+        elements = self.find_all(self.locators.PROJECT_ROWS, timeout=5)
         return len(elements) - 1  # Subtract header row
     
     def is_pagination_present(self):
         """Check if pagination is present"""
-        return self.is_element_present(self.locators.PAGINATION_CONTROLS)
+        return self.get_page_state()["pagination"]["present"]
     
     def click_next_page(self):
         """Click next page button"""
-        if self.is_element_present(self.locators.NEXT_BUTTON):
+        if self.get_page_state()["next"]["present"]:
             self.click_element(self.locators.NEXT_BUTTON)
             return True
         return False
     
     def click_previous_page(self):
         """Click previous page button"""
-        if self.is_element_present(self.locators.PREVIOUS_BUTTON):
+        if self.get_page_state()["previous"]["present"]:
             self.click_element(self.locators.PREVIOUS_BUTTON)  
             return True
         return False
@@ -83,6 +99,47 @@ class ProjectPage(BasePage):
             self.select_project_status_filter(status)
         self.click_submit_button()
     
+    def get_filter_domains(self):
+        """Read the options of all four filter dropdowns in one call ({filter: [option texts]})"""
+        return BatchReader.read_select_options(self.driver, {
+            "skill": self.locators.SKILL_DROPDOWN,
+            "department": self.locators.DEPARTMENT_DROPDOWN,
+            "manager": self.locators.MANAGER_DROPDOWN,
+            "status": self.locators.PROJECT_STATUS_DROPDOWN,
+        })
+
     def reset_all_filters(self):
         """Reset all applied filters"""
-        self.click_reset_button()
\ No newline at end of file
+        self.click_reset_button()
+
+    def read_project_table(self, styles=()):
+        """Read the whole project table (headers, cell texts, optional styles) in one call"""
+        return TableReader(self.driver).read(self.locators.PROJECT_DATA_TABLE, styles)
+
+    def iter_rows(self, start_page=1, max_pages=None):
+        """Lazily yield every project row ({column: text}) across all pages"""
+        return self._paginator().iter_rows(start_page=start_page, max_pages=max_pages)
+
+    def go_to_project(self, project_name):
+        """Page through the listing until project_name is on the current page; returns True if found"""
+        for _, rows in self._paginator().iter_pages():
+            if any(project_name in row.values() for row in rows):
+                return True
+        return False
+
+    def click_edit_button_for(self, project_name):
+        """Click Edit in the row of project_name (on the current page)"""
+        self.click_element(self.locators.project_edit_button_locator(project_name))
+
+    def click_manage_assigned_button_for(self, project_name):
+        """Open Manage Assigned Employees from the row of project_name (on the current page)"""
+        self.click_element(self.locators.manage_assigned_button_locator(project_name))
+
+    def _paginator(self):
+        def read_rows():
+            table = self.read_project_table()
+            return list(table.rows()) if table else []
+
+        return Paginator(self.driver, read_rows, self.locators.NEXT_BUTTON,
+                         self.locators.PAGINATION_ACTIVE_PAGE_NUMBER,
+                         page_link=self.locators.page_number_locator)
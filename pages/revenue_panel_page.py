@@ -6,9 +6,13 @@ Defines interactions and validations for the Revenue Panel UI components.
 from pages.base_page import BasePage
 from utils.locators import RevenuePanelPageLocators
 from utils.helpers import TestHelpers
+from utils.animations import InteractionTimings
+from pages.components.table_reader import TableReader
+from pages.components.paginator import Paginator
 from datetime import datetime
 import time
 from selenium.webdriver.common.keys import Keys
+from selenium.common.exceptions import TimeoutException
 
 class RevenuePanelPage(BasePage):
     """Page object representing the Revenue Panel page."""
@@ -49,15 +53,16 @@ class RevenuePanelPage(BasePage):
         dropdown_locator = self.locators.DEPARTMENT_DROPDOWN
         option_locator = self.locators.department_option_locator(department_name)
 
-        # Click dropdown to open options
-        TestHelpers.safe_click(self.driver, dropdown_locator)
+        with InteractionTimings.measure("dropdown", self.driver):
+            # Click dropdown to open options
+            TestHelpers.safe_click(self.driver, dropdown_locator)
 
-        # Wait for the option to be clickable instead of fixed sleep
-        TestHelpers.wait_for_element_clickable(self.driver, option_locator, timeout=10)
+            # Wait for the option to be clickable instead of fixed sleep
+            TestHelpers.wait_for_element_clickable(self.driver, option_locator, timeout=10)
 
-        # Select the option by clicking it    
-        # TestHelpers.select_custom_dropdown_option(self.driver, dropdown_locator, option_locator)
-        TestHelpers.safe_click(self.driver, option_locator)
+            # Select the option by clicking it    
+            # TestHelpers.select_custom_dropdown_option(self.driver, dropdown_locator, option_locator)
+            TestHelpers.safe_click(self.driver, option_locator)
 
     # Commented out the code for select_month since the Month field in app has been changed to Year field
     # def select_month(self, month_name):
@@ -106,14 +111,15 @@ class RevenuePanelPage(BasePage):
         dropdown_locator = self.locators.WEEK_DROPDOWN
         option_locator = self.locators.week_option_locator(week_number)
 
-        # Click dropdown to open options
-        TestHelpers.safe_click(self.driver, dropdown_locator)
+        with InteractionTimings.measure("dropdown", self.driver):
+            # Click dropdown to open options
+            TestHelpers.safe_click(self.driver, dropdown_locator)
 
-        # Wait for the option to be clickable instead of fixed sleep
-        TestHelpers.wait_for_element_clickable(self.driver, option_locator, timeout=10)
+            # Wait for the option to be clickable instead of fixed sleep
+            TestHelpers.wait_for_element_clickable(self.driver, option_locator, timeout=10)
 
-        # TestHelpers.select_custom_dropdown_option(self.driver, dropdown_locator, option_locator)
-        TestHelpers.safe_click(self.driver, option_locator)
+            # TestHelpers.select_custom_dropdown_option(self.driver, dropdown_locator, option_locator)
+            TestHelpers.safe_click(self.driver, option_locator)
 
     # The commented out method below was presumably a search trigger for filters.
     # def click_search_button(self):
@@ -141,9 +147,8 @@ class RevenuePanelPage(BasePage):
         Returns:
             Integer count of employee cards found.
         """
-        # Wait for employee cards container or at least the first card visible (optional)
-        TestHelpers.wait_for_element(self.driver, self.locators.EMPLOYEE_CARDS, timeout=5)
-        elements = self.driver.find_elements(*self.locators.EMPLOYEE_CARDS)
+        # Wait (explicitly, up to 5s) for the first card; no implicit wait when there are none
+        elements = self.find_all(self.locators.EMPLOYEE_CARDS, timeout=5)
         return len(elements)
 
     def are_employee_cards_displayed(self):
@@ -155,6 +160,36 @@ class RevenuePanelPage(BasePage):
         """
         return self.get_employee_cards_count() > 0
 
+    def read_employee_table(self, styles=()):
+        """
+        Reads the employee revenue table (ant-table-wrapper) in one script call.
+
+        Args:
+            styles: Computed CSS properties to read for every cell.
+
+        Returns:
+            TableData with headers, columns and row index, or None if no table is shown.
+        """
+        return TableReader(self.driver).read(self.locators.EMPLOYEE_CARDS, styles, timeout=5)
+
+    def iter_rows(self, start_page=1, max_pages=None):
+        """
+        Lazily yields every employee revenue row ({column: text}) across all pages.
+        Pages are read one at a time; stop iterating to stop paging.
+
+        Args:
+            start_page: Page to start from (opened directly via its page link).
+            max_pages: Maximum number of pages to read (None for all).
+        """
+        def read_rows():
+            table = self.read_employee_table()
+            return list(table.rows()) if table else []
+
+        paginator = Paginator(self.driver, read_rows, self.locators.NEXT_PAGE_BUTTON,
+                              self.locators.PAGINATION_ACTIVE_PAGE_NUMBER,
+                              page_link=self.locators.page_number_locator)
+        return paginator.iter_rows(start_page=start_page, max_pages=max_pages)
+
     def click_next_page(self):
         """
         Clicks the 'Next' pagination button if present to load next page.
@@ -192,58 +227,71 @@ class RevenuePanelPage(BasePage):
         TestHelpers.scroll_to_element(self.driver, self.locators.PAGINATION_CONTROLS)
         return self.is_element_present(self.locators.PAGINATION_CONTROLS)
     
+    def get_pagination_state(self, wait_for=(), timeout=5):
+        """
+        Reads the Previous/Next buttons, page numbers and active page in one round trip.
+
+        Args:
+            wait_for: Names ("previous", "next", "page_numbers", "active_page") to wait for.
+            timeout: Maximum seconds to wait for them.
+
+        Returns:
+            read_many() snapshot with aria-disabled, class and disabled attributes.
+        """
+        locators = {
+            "previous": self.locators.PREVIOUS_PAGE_BUTTON,
+            "next": self.locators.NEXT_PAGE_BUTTON,
+            "page_numbers": self.locators.PAGINATION_PAGE_NUMBERS,
+            "active_page": self.locators.PAGINATION_ACTIVE_PAGE_NUMBER,
+        }
+        return self.read_many(locators, attributes=("aria-disabled", "class", "disabled"),
+                              wait_for=wait_for, timeout=timeout)
+
     def is_previous_page_disabled(self):
         """
         Returns True if the 'Previous' button is disabled, otherwise False.
         """
-        try:
-            element = self.wait_for_element(self.locators.PREVIOUS_PAGE_BUTTON, timeout=5)
-            
-            # Get the value of the aria-disabled attribute
-            aria_disabled_value = element.get_attribute("aria-disabled") or ""
-            
-            # Check if aria-disabled is 'true', which means the button is disabled
-            if aria_disabled_value == "true":
-                return True
-            
-            # If aria-disabled is not 'true', check if the element is enabled
-            return not element.is_enabled()
-        except Exception:
+        button = self.get_pagination_state(wait_for=["previous"])["previous"]
+        if not button["visible"]:
             return True  # If button not found, treat as disabled
 
+        # Check if aria-disabled is 'true', which means the button is disabled
+        if (button["attributes"]["aria-disabled"] or "") == "true":
+            return True
+        return button["attributes"]["disabled"] is not None
+
     def is_next_page_enabled(self):
         """
         Returns True if the 'Next' button is enabled, otherwise False.
         """
-        try:
-            element = self.wait_for_element(self.locators.NEXT_PAGE_BUTTON, timeout=5)
-            
-            # Get the value of the aria-disabled attribute
-            aria_disabled_value = element.get_attribute("aria-disabled") or ""
-            
-            # If aria-disabled is 'false', the button is enabled
-            if aria_disabled_value == "false":
-                return True
-            
-            # Otherwise, check if the element is enabled and class doesn't contain 'disabled'
-            class_attr = element.get_attribute("class") or ""
-            return element.is_enabled() and "disabled" not in class_attr.lower()
-        except Exception:
+        button = self.get_pagination_state(wait_for=["next"])["next"]
+        if not button["visible"]:
             return False  # If the button is not found, treat as disabled
 
+        # If aria-disabled is 'false', the button is enabled
+        if (button["attributes"]["aria-disabled"] or "") == "false":
+            return True
+
+        # Otherwise, check if the element is enabled and class doesn't contain 'disabled'
+        class_attr = button["attributes"]["class"] or ""
+        return button["attributes"]["disabled"] is None and "disabled" not in class_attr.lower()
 
     def are_page_numbers_visible(self):
         """
         Checks if page number elements are visible in the pagination.
         """
-        return self.is_element_present(self.locators.PAGINATION_PAGE_NUMBERS)
+        return self.get_pagination_state()["page_numbers"]["present"]
 
     def get_current_page_number(self):
         """
         Returns the currently active page number as integer.
         """
-        element = self.wait_for_element(self.locators.PAGINATION_ACTIVE_PAGE_NUMBER, timeout=5)
-        return int(element.text.strip())
+        active_page = self.get_pagination_state(wait_for=["active_page"])["active_page"]
+        if not active_page["visible"]:
+            raise TimeoutException(
+                f"Element not found within 5 seconds: {self.locators.PAGINATION_ACTIVE_PAGE_NUMBER}"
+            )
+        return int(active_page["text"])
 
     def apply_filters(self, department=None, year=None, week=None):
         """
@@ -266,9 +314,11 @@ class RevenuePanelPage(BasePage):
         if week:
             self.select_week(week)
         # self.click_search_button()  # Uncomment if search is triggered manually
+        self.wait_until_idle()  # Filters apply on selection; wait for the panel data to reload
 
     def clear_all_filters(self):
         """
         Clears all applied filters by clicking the 'Clear' button.
         """
         self.click_clear_button()
+        self.wait_until_idle()
@@ -62,13 +62,13 @@ class TimesheetPage(BasePage):
     
     def click_first_edit_icon(self):
         """Click first edit icon"""
-        edit_icons = self.driver.find_elements(*self.locators.EDIT_ICONS)
+        edit_icons = self.find_all(self.locators.EDIT_ICONS, timeout=5)
         if edit_icons:
             edit_icons[0].click()
     
     def click_first_delete_icon(self):
         """Click first delete icon"""
-        delete_icons = self.driver.find_elements(*self.locators.DELETE_ICONS)
+        delete_icons = self.find_all(self.locators.DELETE_ICONS, timeout=5)
         if delete_icons:
             delete_icons[0].click()
     
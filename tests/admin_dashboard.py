@@ -63,13 +63,16 @@ class TestAdminDashboard:
         driver, dashboard_page = admin_login
         logger.info("Starting test: All metric cards visibility")
 
-        assert dashboard_page.is_total_expenses_card_visible(), "Total expenses card should be visible"
-        assert dashboard_page.is_total_revenue_card_visible(), "Total revenue card should be visible"
-        assert dashboard_page.is_total_profit_card_visible(), "Total profit card should be visible"
+        # One round trip for all cards and values
+        metrics = dashboard_page.get_metrics_snapshot()
+
+        assert metrics["expenses"]["card_visible"], "Total expenses card should be visible"
+        assert metrics["revenue"]["card_visible"], "Total revenue card should be visible"
+        assert metrics["profit"]["card_visible"], "Total profit card should be visible"
 
-        expenses_value = dashboard_page.get_total_expenses_value()
-        revenue_value = dashboard_page.get_total_revenue_value()
-        profit_value = dashboard_page.get_total_profit_value()
+        expenses_value = metrics["expenses"]["value"]
+        revenue_value = metrics["revenue"]["value"]
+        profit_value = metrics["profit"]["value"]
 
         assert expenses_value, "Expenses value should not be empty"
         assert revenue_value, "Revenue value should not be empty"
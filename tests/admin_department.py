@@ -31,20 +31,24 @@ class TestAdminDepartment:
         assert add_department_modal.is_modal_displayed(), "Add Department modal should be displayed"
         add_department_modal.click_ok_button()
 
-    def test_verify_edit_department_form_loads_with_existing_data(self, admin_login, logger):
+    def test_verify_edit_department_form_loads_with_existing_data(self, pooled_department, admin_login, logger):
         driver, dashboard_page = admin_login
         dashboard_page.navigate_to_employee_management()
         employee_page = EmployeePage(driver)
         employee_page.navigate_to_department_tab()
         department_page = DepartmentPage(driver)
-        edit_count = department_page.get_edit_buttons_count()
-        if edit_count > 0:
-            department_page.click_first_edit_button()
-            edit_department_modal = EditDepartmentModal(driver)
-            edit_department_modal.wait_for_modal_to_appear()
-            assert edit_department_modal.is_modal_displayed(), "Edit Department modal should be displayed"
-            assert edit_department_modal.verify_existing_data_loaded(), "Existing department data should be pre-populated"
-            edit_department_modal.click_cancel_button()
+        assert department_page.is_department_row_displayed(pooled_department["name"]), \
+            f"Department {pooled_department['name']} should be listed"
+        department_page.click_edit_button_for(pooled_department["name"])
+        edit_department_modal = EditDepartmentModal(driver)
+        edit_department_modal.wait_for_modal_to_appear()
+        assert edit_department_modal.is_modal_displayed(), "Edit Department modal should be displayed"
+        assert edit_department_modal.get_current_department_name() == pooled_department["name"], \
+            "Department name should be pre-populated"
+        assert edit_department_modal.get_current_description() == pooled_department["description"], \
+            "Department description should be pre-populated"
+        assert edit_department_modal.get_current_manager(), "Department manager should be pre-populated"
+        edit_department_modal.click_cancel_button()
 
     def test_add_department_with_valid_data(self, admin_login, department_test_data, unique_name, logger):
         driver, dashboard_page = admin_login
@@ -59,11 +63,14 @@ class TestAdminDepartment:
         test_dept_data["name"] = unique_name(test_dept_data["name"])
         add_department_modal.save_department(test_dept_data)
 
-    def test_department_delete_functionality(self, admin_login, logger):
+    def test_department_delete_functionality(self, fresh_department, admin_login, logger):
         driver, dashboard_page = admin_login
         dashboard_page.navigate_to_employee_management()
         employee_page = EmployeePage(driver)
         employee_page.navigate_to_department_tab()
         department_page = DepartmentPage(driver)
-        delete_count = department_page.get_delete_buttons_count()
-        assert delete_count >= 0
+        assert department_page.is_department_row_displayed(fresh_department["name"]), \
+            f"Department {fresh_department['name']} should be listed"
+        department_page.delete_department(fresh_department["name"])
+        assert department_page.is_department_row_removed(fresh_department["name"]), \
+            f"Department {fresh_department['name']} should be gone after deleting it"
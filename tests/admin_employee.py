@@ -49,3 +49,21 @@ class TestAdminEmployee:
         dashboard_page.navigate_to_employee_management()
         employee_page = EmployeePage(driver)
         employee_page.click_reset_button()
+
+    @pytest.mark.data_source("employee_boundaries", id_field="case")
+    def test_add_employee_boundary_values(self, data_record, admin_login, logger):
+        driver, dashboard_page = admin_login
+        dashboard_page.navigate_to_employee_management()
+        employee_page = EmployeePage(driver)
+        employee_page.click_add_employees_button()
+        add_employee_modal = AddEmployeeModal(driver)
+        add_employee_modal.wait_for_modal_to_appear()
+        # The form is cancelled, so the raw boundary values are used (nothing is created)
+        add_employee_modal.fill_employee_details(data_record)
+        assert add_employee_modal.get_first_name() == data_record["first_name"], \
+            f"First name input should accept the {data_record['case']} value unchanged"
+        assert add_employee_modal.get_last_name() == data_record["last_name"], \
+            f"Last name input should accept the {data_record['case']} value unchanged"
+        assert add_employee_modal.get_email() == data_record["email"], \
+            f"Email input should accept the {data_record['case']} value unchanged"
+        add_employee_modal.click_cancel_button()
@@ -1,6 +1,5 @@
 import pytest
 import pytest_order
-import time
 from pages.revenue_panel_page import RevenuePanelPage
 
 
@@ -104,6 +103,24 @@ class TestAdminRevenuePanel:
         # Clear all filters after test to reset state
         revenue_panel_page.clear_all_filters()
 
+    @pytest.mark.combinatorial("revenue_filters")
+    def test_revenue_panel_filter_combinations(self, filter_case, admin_login, logger):
+        """
+        Tests department/year/week filter combinations (pairwise covering array
+        from test_data.filter_domains.revenue_filters):
+        - Applies the case's filters
+        - Asserts the panel still loads
+        - Clears filters after test
+        """
+        driver, dashboard_page = admin_login
+        dashboard_page.navigate_to_revenue_panel()
+        revenue_panel_page = RevenuePanelPage(driver)
+
+        revenue_panel_page.apply_filters(**filter_case)
+        assert revenue_panel_page.is_revenue_panel_loaded(), f"Revenue panel should stay loaded for filters {filter_case}"
+
+        revenue_panel_page.clear_all_filters()
+
 
     # @pytest.mark.order(4)
     def test_revenue_panel_export_functionality(self, admin_login, logger):
@@ -120,7 +137,8 @@ class TestAdminRevenuePanel:
         # Select filters to load data
         revenue_panel_page.apply_filters(department="Java", year="2025")
 
-        time.sleep(2)
+        # Let the filtered data finish rendering before exporting
+        revenue_panel_page.wait_for_dom_to_settle(replaces=2)
 
         try:
             revenue_panel_page.click_export_button()
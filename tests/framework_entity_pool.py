@@ -0,0 +1,114 @@
+import threading
+import pytest
+from utils.entity_pool import EntityPool
+from utils.file_lock import FileLock
+
+
+class FakeBackend:
+    """
+    In-memory SeedBackend; create_many() can be held open to check what other
+    workers can do while a pool is being created.
+    """
+
+    def __init__(self, pool_dir=None):
+        self.pool_dir = pool_dir
+        self.entities = {}
+        self.next_id = 1
+        self.release_create = threading.Event()
+        self.release_create.set()
+        self.creating = threading.Event()
+        self.lock_free_during_create = None
+
+    def create_many(self, entity_type, payloads):
+        self.creating.set()
+        if self.pool_dir is not None:
+            try:
+                with FileLock(next(self.pool_dir.glob("*.lock")), timeout=0.5):
+                    self.lock_free_during_create = True
+            except TimeoutError:
+                self.lock_free_during_create = False
+        self.release_create.wait(5)
+        created = []
+        for payload in payloads:
+            entity = dict(payload, id=self.next_id)
+            self.entities[(entity_type, self.next_id)] = entity
+            self.next_id += 1
+            created.append(entity)
+        return created
+
+    def delete_many(self, entity_type, entity_ids):
+        for entity_id in entity_ids:
+            self.entities.pop((entity_type, entity_id), None)
+
+    def find_ids(self, entity_type, names):
+        return {}
+
+
+class FakeSeeder:
+    def __init__(self, backend):
+        self.backend = backend
+
+    @staticmethod
+    def payload(entity_type):
+        return {"name": f"pooled {entity_type}"}
+
+
+class TestEntityPool:
+    """
+    Checks the shared entity pool without an API: the batch creation runs
+    without holding the pool lock, and the pool survives until every worker
+    of the run has finished.
+    """
+
+    @pytest.fixture(autouse=True)
+    def isolated_run(self, monkeypatch):
+        monkeypatch.setenv("TRACKORA_RUN_ID", "framework-entity-pool")
+        monkeypatch.setattr("utils.unique_ids.UniqueIds._run", None)
+        monkeypatch.setattr(EntityPool, "attached", False)
+
+    def pool(self, backend, tmp_path, holder, **kwargs):
+        pool = EntityPool(FakeSeeder(backend), pool_dir=tmp_path, lease_timeout=5, **kwargs)
+        pool.holder = holder
+        return pool
+
+    def test_creation_does_not_hold_the_lock(self, tmp_path):
+        backend = FakeBackend(pool_dir=tmp_path)
+        backend.release_create.clear()
+        first = self.pool(backend, tmp_path, "gw0:1", sizes={"project": 2}).attach()
+        second = self.pool(backend, tmp_path, "gw1:2", sizes={"project": 2}).attach()
+
+        leased = {}
+        creator = threading.Thread(target=lambda: leased.update(first=first.lease("project")))
+        creator.start()
+        assert backend.creating.wait(5)
+        # The second worker waits for the creation instead of starting its own
+        waiter = threading.Thread(target=lambda: leased.update(second=second.lease("project")))
+        waiter.start()
+        backend.release_create.set()
+        creator.join(5)
+        waiter.join(5)
+
+        assert backend.lock_free_during_create is True
+        assert len(backend.entities) == 2, "the pool was created more than once"
+        assert leased["first"]["id"] != leased["second"]["id"]
+
+    def test_pool_outlives_workers_that_finish_early(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("PYTEST_XDIST_WORKER_COUNT", "3")
+        backend = FakeBackend()
+        early = self.pool(backend, tmp_path, "gw0:1").attach()
+        early.release("project", early.lease("project"))
+        early.detach()
+        assert len(backend.entities) == 1, "pool deleted before the other workers attached"
+
+        late = self.pool(backend, tmp_path, "gw1:2").attach()
+        entity = late.lease("project")
+        assert ("project", entity["id"]) in backend.entities
+        late.release("project", entity)
+        late.detach()
+        assert len(backend.entities) == 1
+
+        # The third worker never used the pool; as the last one out it deletes it
+        EntityPool.attached = False
+        EntityPool.finish_unattached(backend, pool_dir=tmp_path)
+        assert backend.entities == {}
+        assert not list(tmp_path.glob("*.json"))
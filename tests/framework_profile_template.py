@@ -0,0 +1,124 @@
+import json
+import os
+import socket
+import stat
+import subprocess
+import sys
+import time
+import pytest
+from utils.driver_factory import DriverFactory
+from utils.helpers import TestHelpers
+from utils.profile_template import ProfileTemplate, STALE_RUN_AGE
+
+CACHE_ENTRY = "Default/Cache/Cache_Data/0123456789abcdef_0"
+
+
+class FakeChrome:
+    """
+    Stands in for the Chrome that warms the template: writes a cache entry,
+    auth state and a process lock into its user-data-dir.
+    """
+
+    def __init__(self, user_data_dir):
+        for relative, content in ((CACHE_ENTRY, b"cached response"), ("Default/Cookies", b"session cookie"),
+                                  ("Default/Preferences", b"{}")):
+            path = user_data_dir / relative
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_bytes(content)
+        os.symlink(f"{socket.gethostname()}-1", user_data_dir / "SingletonLock")
+        self.quit_calls = 0
+
+    def execute_async_script(self, script, *args):
+        return "none"
+
+    def execute_cdp_cmd(self, command, params):
+        return {}
+
+    def quit(self):
+        self.quit_calls += 1
+
+
+def wait_for(condition, timeout=5):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if condition():
+            return True
+        time.sleep(0.05)
+    return condition()
+
+
+class TestProfileTemplate:
+    """
+    Checks the warm profile template without a browser: clones are independent
+    writable copies of a read-only template, discarded clones are deleted in
+    the background and abandoned runs are reaped.
+    """
+
+    @pytest.fixture
+    def template(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(DriverFactory, "create_driver",
+                            staticmethod(lambda config, user_data_dir=None: FakeChrome(user_data_dir)))
+        monkeypatch.setattr(TestHelpers, "wait_until_idle", staticmethod(lambda driver, timeout=None: True))
+        template = ProfileTemplate({"base_url": "http://trackora.test"}, root=tmp_path / "profiles").start()
+        assert ProfileTemplate.active is template, "template was not built"
+        yield template
+        template.shutdown()
+
+    def test_template_is_read_only_without_auth_state(self, template):
+        assert (template.template_dir / CACHE_ENTRY).is_file()
+        assert not (template.template_dir / "Default/Cookies").exists()
+        assert not os.path.lexists(template.template_dir / "SingletonLock")
+        mode = (template.template_dir / CACHE_ENTRY).stat().st_mode
+        assert not mode & (stat.S_IWUSR | stat.S_IWGRP | stat.S_IWOTH), oct(mode)
+
+    def test_clones_are_independent(self, template):
+        first, second = template.clone(), template.clone()
+        source = template.template_dir / CACHE_ENTRY
+        first_entry, second_entry = first / CACHE_ENTRY, second / CACHE_ENTRY
+        inodes = {path.stat().st_ino for path in (source, first_entry, second_entry)}
+        assert len(inodes) == 3, "clones share files with the template or each other"
+        assert not (first / "ready.json").exists()
+
+        # Chrome rewrites cache entries in place
+        with open(first_entry, "r+b") as f:
+            f.write(b"CHANGED")
+        assert source.read_bytes() == b"cached response"
+        assert second_entry.read_bytes() == b"cached response"
+        assert template.summary()["clones"] == 2
+
+    def test_attached_clone_is_discarded_on_quit(self, template):
+        clone = template.clone()
+        driver = FakeChrome(template.clones_dir / "scratch")
+        ProfileTemplate.attach(driver, clone)
+        driver.quit()
+        assert driver.quit_calls == 1
+        assert wait_for(lambda: not clone.exists()), "clone was not deleted after quit()"
+
+    def test_shutdown_removes_run_directory(self, tmp_path, template):
+        template.clone()
+        template.shutdown()
+        assert not template.run_dir.exists()
+        assert ProfileTemplate.active is None
+
+    def test_stale_runs_are_reaped(self, tmp_path):
+        root = tmp_path / "profiles"
+        finished = subprocess.Popen([sys.executable, "-c", "pass"])
+        finished.wait()
+        stale = root / "run-stale"
+        (stale / "workers").mkdir(parents=True)
+        (stale / "workers" / "gw0.json").write_text(json.dumps({"host": socket.gethostname(),
+                                                                 "pid": finished.pid}))
+        live = root / "run-live"
+        (live / "workers").mkdir(parents=True)
+        (live / "workers" / "gw0.json").write_text(json.dumps({"host": socket.gethostname(),
+                                                                "pid": os.getpid()}))
+        old = time.time() - STALE_RUN_AGE - 10
+        for run_dir in (stale, live):
+            os.utime(run_dir, (old, old))
+        # A run directory removed by another worker between listing and stat()
+        os.symlink(root / "missing", root / "run-gone")
+
+        ProfileTemplate({"base_url": "http://trackora.test"}, root=root)._reap_stale_runs()
+
+        assert not stale.exists()
+        assert live.exists()
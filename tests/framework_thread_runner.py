@@ -0,0 +1,126 @@
+import json
+import os
+import subprocess
+import sys
+import textwrap
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+
+CONFTEST = """
+from utils.thread_runner import ThreadedRunner
+
+def pytest_runtestloop(session):
+    if session.config.option.collectonly:
+        return None
+    return ThreadedRunner(session, threads=2).run()
+"""
+
+# Shared fixtures record which value each test saw and when each value was torn down
+FIXTURES = """
+import itertools
+import json
+import os
+import threading
+import time
+import pytest
+
+_counter = itertools.count()
+_lock = threading.Lock()
+
+def record(event):
+    with _lock:
+        with open(os.environ["TK_EVENTS"], "a", encoding="utf-8") as f:
+            f.write(json.dumps(event) + "\\n")
+
+@pytest.fixture(scope="class")
+def class_value(request):
+    value = next(_counter)
+    yield value
+    record({"teardown": "class", "node": request.node.nodeid, "value": value})
+
+@pytest.fixture(scope="module")
+def module_value(request):
+    value = next(_counter)
+    yield value
+    record({"teardown": "module", "node": request.node.nodeid, "value": value})
+
+def seen(request, class_value, module_value):
+    time.sleep(0.1)  # Keep both threads busy so classes and modules overlap
+    record({"test": request.node.nodeid, "class": request.node.parent.nodeid,
+            "module": request.node.module.__name__, "class_value": class_value,
+            "module_value": module_value})
+"""
+
+MODULE = """
+from fixtures import class_value, module_value, seen
+
+class TestA:
+    def test_one(self, request, class_value, module_value):
+        seen(request, class_value, module_value)
+
+    def test_two(self, request, class_value, module_value):
+        seen(request, class_value, module_value)
+
+class TestB:
+    def test_one(self, request, class_value, module_value):
+        seen(request, class_value, module_value)
+
+    def test_two(self, request, class_value, module_value):
+        seen(request, class_value, module_value)
+"""
+
+
+class TestThreadRunnerFixtureIsolation:
+    """
+    Runs a small suite with the --tk-threads runner (2 threads) in a separate
+    pytest process and checks that class- and module-scoped fixtures keep one
+    value per class/module and are torn down once per value.
+    """
+
+    def run_suite(self, tmp_path):
+        (tmp_path / "pytest.ini").write_text("[pytest]\naddopts = -s -p no:cacheprovider\n")
+        (tmp_path / "conftest.py").write_text(CONFTEST)
+        (tmp_path / "fixtures.py").write_text(textwrap.dedent(FIXTURES))
+        (tmp_path / "test_first.py").write_text(MODULE)
+        (tmp_path / "test_second.py").write_text(MODULE)
+        events_path = tmp_path / "events.jsonl"
+        env = dict(os.environ, TK_EVENTS=str(events_path),
+                   PYTHONPATH=os.pathsep.join(filter(None, [str(ROOT), str(tmp_path),
+                                                            os.environ.get("PYTHONPATH")])))
+        result = subprocess.run([sys.executable, "-m", "pytest", "-q", "-p", "no:html"], cwd=tmp_path, env=env,
+                                capture_output=True, text=True, timeout=120)
+        assert result.returncode == 0, result.stdout + result.stderr
+        with open(events_path, "r", encoding="utf-8") as f:
+            return [json.loads(line) for line in f]
+
+    def test_class_and_module_fixtures_are_isolated(self, tmp_path):
+        events = self.run_suite(tmp_path)
+        tests = [event for event in events if "test" in event]
+        assert len(tests) == 8, tests
+
+        class_values = {}
+        module_values = {}
+        for event in tests:
+            class_values.setdefault(event["class"], set()).add(event["class_value"])
+            module_values.setdefault(event["module"], set()).add(event["module_value"])
+        # Every test of a class/module saw the same value, and no value crossed over
+        assert all(len(values) == 1 for values in class_values.values()), class_values
+        assert all(len(values) == 1 for values in module_values.values()), module_values
+        assert len({values.pop() for values in class_values.values()}) == 4, class_values
+        assert len({values.pop() for values in module_values.values()}) == 2, module_values
+
+    def test_shared_fixtures_are_torn_down_once_after_their_last_test(self, tmp_path):
+        events = self.run_suite(tmp_path)
+        teardowns = [event for event in events if "teardown" in event]
+        class_teardowns = sorted(event["value"] for event in teardowns if event["teardown"] == "class")
+        module_teardowns = sorted(event["value"] for event in teardowns if event["teardown"] == "module")
+        created = {event["class_value"] for event in events if "test" in event}
+        assert class_teardowns == sorted(created), teardowns
+        assert len(module_teardowns) == len(set(module_teardowns)) == 2, teardowns
+
+        # The first module is torn down while the second one's tests still run, not at session end
+        first_module_teardown = next(index for index, event in enumerate(events)
+                                     if event.get("teardown") == "module" and "test_first" in event["node"])
+        last_test = max(index for index, event in enumerate(events) if "test" in event)
+        assert first_module_teardown < last_test, events
@@ -2,7 +2,7 @@ import pytest
 from pages.manager_project_page import ManagerProjectPage
 from pages.modals.manager_add_project_modal import ManagerAddProjectModal
 from utils.locators import MangerProjectPageLocators
-from selenium.webdriver.common.by import By
+from utils.combinatorics import FilterDomains
 import time
 
 
@@ -41,6 +41,25 @@ class TestAdminProject:
         project_page.click_reset_button()
         assert project_page.is_project_table_displayed(), "Project table should be displayed after resetting filters"
 
+    def test_filter_domains_match_dropdowns(self, manager_login, logger):
+        driver, dashboard_page = manager_login
+        dashboard_page.navigate_to_project_management()
+        project_page = ManagerProjectPage(driver)
+        logger.info("Checking the declared filter domains against the live dropdown options")
+        # The combinatorial filter tests only use values the live dropdowns still offer
+        missing = FilterDomains.missing("manager_project_filters", project_page.get_filter_domains())
+        assert not missing, f"Filter values in testdata.json no longer offered: {missing}"
+
+    @pytest.mark.combinatorial("manager_project_filters")
+    def test_project_filter_combinations(self, filter_case, manager_login, logger):
+        driver, dashboard_page = manager_login
+        dashboard_page.navigate_to_project_management()
+        project_page = ManagerProjectPage(driver)
+        logger.info(f"Applying filters {filter_case}")
+        project_page.apply_filters(**filter_case)
+        assert project_page.is_project_table_displayed(), f"Project table should be displayed for filters {filter_case}"
+        project_page.click_reset_button()
+
     def test_verify_add_project_button_opens_modal(self, manager_login, logger):
         driver, dashboard_page = manager_login
         dashboard_page.navigate_to_project_management()
@@ -71,17 +90,18 @@ class TestAdminProject:
             # "COMPLETED": "rgb(0, 128, 0)"           # Placeholder: Replace with actual green color from DOM
         }
 
-        # Find all table cells containing project statuses
-        status_elements = driver.find_elements(By.XPATH,
-            "//td[normalize-space(text())='IN_PROGRESS' or text()='COMPLETED' or text()='NOT_STARTED']"
-        )
+        # Read the whole table (texts + computed colors) in one call
+        table = project_page.read_project_table(styles=["color"])
+        assert table is not None, "project table not rendered"
+        statuses = table.column("Project Status")
+        colors = table.column_styles("Project Status", "color")
 
-        for element in status_elements:
-            status_text = element.text.strip()
-            actual_color = element.value_of_css_property("color").strip()
+        for status_text, actual_color in zip(statuses, colors):
+            if status_text not in ("IN_PROGRESS", "COMPLETED", "NOT_STARTED"):
+                continue
 
             # Normalize if needed (e.g., rgba to rgb)
-            actual_color = actual_color.replace("rgba", "rgb").replace(", 1)", ")")
+            actual_color = actual_color.strip().replace("rgba", "rgb").replace(", 1)", ")")
 
             logger.info(f"Status: {status_text}, Color: {actual_color}")
 
@@ -91,7 +111,6 @@ class TestAdminProject:
             assert actual_color == expected_color, (
                 f"Color mismatch for status '{status_text}': Expected {expected_color}, got {actual_color}"
             )
-            time.sleep(2)  # Pause to visually confirm colors during test run
 
     def test_verify_table_column_display(self, manager_login, logger):
             driver, dashboard_page = manager_login
@@ -105,11 +124,10 @@ class TestAdminProject:
                 "Start Date", "End Date", "Project Status", "Project Type", 
                 "Manager", "Assignees", "Project Details"]
 
-            # Fetch all header elements
-            header_elements = driver.find_elements(By.XPATH, "//table/thead/tr/th")
-
-            # Remove empty header texts
-            actual_columns = [header.text.strip() for header in header_elements if header.text.strip()]
+            # Read all headers in one call, removing empty header texts
+            table = project_page.read_project_table()
+            assert table is not None, "project table not rendered"
+            actual_columns = table.visible_headers()
 
 
             logger.info(f"Actual columns: {actual_columns}")
@@ -125,24 +143,26 @@ class TestAdminProject:
             assert project_page.is_project_page_loaded(), "Project page should be loaded"
             assert project_page.is_project_table_displayed(), "Project table should be displayed"
 
-            # Fetch all start date elements
-            start_date_elements = driver.find_elements(By.XPATH, "//table/tbody/tr/td[4]")
-            end_date_elements = driver.find_elements(By.XPATH, "//table/tbody/tr/td[5]")
+            # Read the whole table once and validate both date columns at once
+            table = project_page.read_project_table()
+            assert table is not None, "project table not rendered"
 
             date_format = "%d-%m-%Y"
 
-            for elem in start_date_elements + end_date_elements:
-                date_text = elem.text.strip()
-                
+            def is_valid_date(date_text):
                 if not date_text:
-                    logger.warning("Skipping empty date field")
-                    continue
-
+                    return True  # Empty date fields are skipped
                 try:
                     time.strptime(date_text, date_format)
-                    logger.info(f"Date '{date_text}' matches format {date_format}")
+                    return True
                 except ValueError:
-                    pytest.fail(f"Date '{date_text}' does not match format {date_format}")
+                    return False
+
+            for column in ("Start Date", "End Date"):
+                mismatches = table.find_mismatches(column, is_valid_date)
+                logger.info(f"{column}: {table.row_count} row(s), {len(mismatches)} invalid")
+                if mismatches:
+                    pytest.fail(f"{column} values do not match format {date_format}: {mismatches}")
 
     # def test_verify_add_project_mandatory_fields_validation(self, manager_login, logger):
     #     driver, dashboard_page = manager_login
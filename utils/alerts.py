@@ -0,0 +1,170 @@
+"""
+Alert handling for Trackora automation framework.
+Detects browser alert/confirm/prompt dialogs without blocking on a timeout
+and keeps a per-test log of every dialog seen, for assertions and reporting.
+"""
+
+import json
+import logging
+import time
+import weakref
+from selenium.common.exceptions import (
+    NoAlertPresentException,
+    UnexpectedAlertPresentException,
+    WebDriverException,
+)
+from utils.helpers import TestHelpers
+from utils.wait_policy import WaitPolicy
+
+logger = logging.getLogger(__name__)
+
+ALERT_LOG_KEY = "__tk_alert_log"
+
+# Replaces window.alert/confirm/prompt with recorders that never block the page.
+# Entries go to sessionStorage so they survive reloads/redirects within the tab.
+# confirm() is accepted and prompt() returns its default value, like a user
+# clicking OK. Installed on every new document (CDP) when the browser allows it.
+ALERT_SHIM_SCRIPT = """
+(function () {
+    if (window.__tkAlertShim) { return; }
+    window.__tkAlertShim = true;
+    var record = function (type, text) {
+        try {
+            var log = JSON.parse(window.sessionStorage.getItem('%(key)s') || '[]');
+            log.push({type: type, text: String(text === undefined ? '' : text),
+                      url: window.location.href, timestamp: Date.now() / 1000});
+            window.sessionStorage.setItem('%(key)s', JSON.stringify(log));
+        } catch (e) {}
+    };
+    window.alert = function (message) { record('alert', message); };
+    window.confirm = function (message) { record('confirm', message); return true; };
+    window.prompt = function (message, value) {
+        record('prompt', message);
+        return value === undefined ? '' : value;
+    };
+})();
+""" % {"key": ALERT_LOG_KEY}
+
+DRAIN_LOG_SCRIPT = """
+try {
+    var log = window.sessionStorage.getItem('%(key)s');
+    window.sessionStorage.removeItem('%(key)s');
+    return log || '[]';
+} catch (e) {
+    return '[]';
+}
+""" % {"key": ALERT_LOG_KEY}
+
+
+class AlertMonitor:
+    """
+    Per-driver alert recorder.
+
+    - install(): injects the non-blocking alert shim into every document
+    - collect(): drains shimmed alerts and accepts any native alert, without waiting
+    - entries: everything seen since the last clear() (i.e. during the current test)
+    """
+
+    _monitors = weakref.WeakKeyDictionary()
+
+    def __init__(self, driver):
+        self.driver = driver
+        self.entries = []
+        self.shim_installed = False
+
+    @classmethod
+    def for_driver(cls, driver):
+        """
+        Returns the monitor attached to a driver, creating it on first use.
+        """
+        monitor = cls._monitors.get(driver)
+        if monitor is None:
+            monitor = cls(driver)
+            cls._monitors[driver] = monitor
+        return monitor
+
+    def install(self):
+        """
+        Injects the alert shim. On Chromium it is registered for every new document
+        so alerts raised during page load are captured too.
+        """
+        self.shim_installed = TestHelpers.add_init_script(self.driver, ALERT_SHIM_SCRIPT)
+        return self.shim_installed
+
+    def collect(self):
+        """
+        Picks up alerts raised since the last call. Never waits.
+        Returns the list of newly recorded entries.
+        """
+        new_entries = []
+        if not self.shim_installed:
+            native = self._accept_native_alert()
+            if native:
+                new_entries.append(native)
+        try:
+            # Without CDP the shim only lives in the current document; re-arm it on the same round trip
+            script = DRAIN_LOG_SCRIPT if self.shim_installed else ALERT_SHIM_SCRIPT + DRAIN_LOG_SCRIPT
+            raw = self.driver.execute_script(script)
+            for entry in json.loads(raw):
+                entry["source"] = "shim"
+                new_entries.append(entry)
+        except UnexpectedAlertPresentException:
+            native = self._accept_native_alert()
+            if native:
+                new_entries.append(native)
+        except (WebDriverException, ValueError) as e:
+            logger.debug(f"Could not read alert log: {e}")
+
+        for entry in new_entries:
+            logger.info(f"Browser {entry['type']} seen: {entry['text']}")
+        self.entries.extend(new_entries)
+        return new_entries
+
+    def wait_for_alert(self, timeout=0):
+        """
+        Returns the first alert entry raised from now on, or None.
+        With timeout=0 only already-raised alerts are considered (no blocking).
+        """
+        new_entries = self.collect()
+        if new_entries or not timeout:
+            return new_entries[0] if new_entries else None
+        try:
+            return WaitPolicy(self.driver).until(
+                lambda d: (self.collect() or [None])[0], timeout, "alert", poll=0.1
+            )
+        except WebDriverException:
+            return None
+
+    def texts(self):
+        """
+        Returns the text of every alert recorded during the current test.
+        """
+        return [entry["text"] for entry in self.entries]
+
+    def last(self):
+        """
+        Returns the most recent alert entry, or None.
+        """
+        return self.entries[-1] if self.entries else None
+
+    def clear(self):
+        """
+        Forgets recorded alerts (called at the start of each test).
+        """
+        self.entries = []
+
+    def _accept_native_alert(self):
+        """
+        Accepts a native dialog if one is open right now (no waiting).
+        Covers browsers/pages where the shim could not be installed in time.
+        """
+        try:
+            alert = self.driver.switch_to.alert
+            text = alert.text
+            alert.accept()
+        except NoAlertPresentException:
+            return None
+        except WebDriverException as e:
+            logger.debug(f"Native alert check failed: {e}")
+            return None
+        return {"type": "alert", "text": text, "url": None, "timestamp": time.time(), "source": "native"}
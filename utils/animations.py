@@ -0,0 +1,253 @@
+"""
+Animation suppression for Trackora automation framework.
+Opt-in mode (animations.suppress in config.yaml) that injects a stylesheet
+into every document to zero out CSS transitions/animations, turn off smooth
+scrolling and short-circuit Ant Design's rc-motion enter/leave classes, so
+dropdowns, pickers and modals open and close instantly and the helpers can
+skip their animation waits.
+
+Interaction timings (dropdown, scroll, modal open/close) are recorded per
+run and mode, so a run with the mode on can be compared with one without.
+
+Usage:
+    python -m utils.animations            # compare the latest suppressed and animated runs
+"""
+
+import argparse
+import json
+import logging
+import statistics
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from selenium.common.exceptions import WebDriverException
+from utils.unique_ids import UniqueIds
+
+logger = logging.getLogger(__name__)
+
+TIMINGS_DIR = Path(__file__).parents[1] / ".trackora" / "interaction_timings"
+MODES = ("suppressed", "animated")
+
+# Durations are near zero rather than none: rc-motion (Ant Design's
+# -enter/-appear/-leave motion classes) waits for animationend/transitionend,
+# so the events must still fire for it to finish its state machine at once
+# instead of falling back to its motion deadline.
+SUPPRESS_ANIMATIONS_CSS = """
+*, *::before, *::after {
+    transition-duration: 0.001ms !important;
+    transition-delay: 0s !important;
+    animation-duration: 0.001ms !important;
+    animation-delay: 0s !important;
+    scroll-behavior: auto !important;
+    caret-color: auto !important;
+}
+html, body { scroll-behavior: auto !important; }
+.ant-wave, [class*="-click-animating"] { display: none !important; }
+"""
+
+SUPPRESS_ANIMATIONS_SCRIPT = """
+(function () {
+    var css = %s;
+    var add = function () {
+        if (document.getElementById('trackora-no-animations')) { return true; }
+        var root = document.head || document.documentElement;
+        if (!root) { return false; }
+        var style = document.createElement('style');
+        style.id = 'trackora-no-animations';
+        style.textContent = css;
+        root.appendChild(style);
+        return true;
+    };
+    if (!add()) {
+        new MutationObserver(function (mutations, observer) {
+            if (add()) { observer.disconnect(); }
+        }).observe(document, {childList: true, subtree: true});
+    }
+})();
+""" % json.dumps(SUPPRESS_ANIMATIONS_CSS)
+
+
+class AnimationControl:
+    """
+    Installs animation suppression on a driver and tells helpers whether they
+    may skip animation waits for it.
+    """
+
+    @staticmethod
+    def install(driver):
+        """
+        Injects the suppression stylesheet into every new document (Chromium) and the
+        current one, and emulates prefers-reduced-motion. Animation waits are only
+        skipped when the stylesheet is registered for new documents.
+        Returns True if registered for new documents.
+        """
+        from utils.helpers import TestHelpers
+        registered = TestHelpers.add_init_script(driver, SUPPRESS_ANIMATIONS_SCRIPT)
+        if registered:
+            try:
+                driver.execute_cdp_cmd("Emulation.setEmulatedMedia", {
+                    "features": [{"name": "prefers-reduced-motion", "value": "reduce"}]
+                })
+            except WebDriverException as e:
+                logger.debug(f"Could not emulate prefers-reduced-motion: {e}")
+        else:
+            logger.warning("Animation suppression needs Chromium (CDP); animation waits stay on.")
+        driver.animations_suppressed = registered
+        return registered
+
+    @staticmethod
+    def suppressed(driver):
+        """
+        Returns True if animations are suppressed on every document of this driver.
+        """
+        return getattr(driver, "animations_suppressed", False)
+
+    @staticmethod
+    def mode(driver):
+        """
+        Returns "suppressed" or "animated" for this driver: what suppression
+        actually achieved, not what animations.suppress asked for.
+        """
+        return "suppressed" if AnimationControl.suppressed(driver) else "animated"
+
+
+class InteractionTimings:
+    """
+    Durations of animated interactions ("dropdown", "scroll", "modal_open",
+    "modal_close") in this process, kept per mode of the driver that ran them
+    (AnimationControl.mode) and saved per mode at session end.
+
+    Usage:
+        with InteractionTimings.measure("dropdown", driver):
+            ...open the dropdown and pick an option...
+    """
+
+    _durations = {}
+    _lock = threading.Lock()
+
+    @classmethod
+    @contextmanager
+    def measure(cls, kind, driver):
+        """
+        Records how long the block took under `kind` (only if it completed).
+        """
+        mode = AnimationControl.mode(driver)
+        started = time.perf_counter()
+        yield
+        cls.record(kind, time.perf_counter() - started, mode)
+
+    @classmethod
+    def record(cls, kind, seconds, mode):
+        with cls._lock:
+            cls._durations.setdefault(mode, {}).setdefault(kind, []).append(seconds)
+
+    @classmethod
+    def durations(cls, mode):
+        """
+        Returns {kind: [seconds, ...]} recorded in this process in `mode`.
+        """
+        with cls._lock:
+            return {kind: list(values) for kind, values in cls._durations.get(mode, {}).items()}
+
+    @classmethod
+    def modes(cls):
+        """
+        Returns the modes with timings recorded in this process.
+        """
+        with cls._lock:
+            return [mode for mode, durations in cls._durations.items() if durations]
+
+    @classmethod
+    def save(cls, mode, timings_dir=TIMINGS_DIR):
+        """
+        Writes this process's timings for `mode` ("suppressed" or "animated").
+        Returns the file path, or None when nothing was recorded.
+        """
+        durations = cls.durations(mode)
+        if not durations:
+            return None
+        path = Path(timings_dir) / mode / f"{UniqueIds.prefix()}.json"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"run_id": UniqueIds.run_id(), "saved": time.time(), "durations": durations}, f)
+        return path
+
+    @staticmethod
+    def load_latest(mode, timings_dir=TIMINGS_DIR):
+        """
+        Returns {kind: [seconds, ...]} of the most recent run in `mode` (all of its
+        xdist workers merged), or {} if there is none.
+        """
+        records = []
+        for path in (Path(timings_dir) / mode).glob("*.json"):
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    records.append(json.load(f))
+            except (OSError, ValueError):
+                continue
+        if not records:
+            return {}
+        latest = max(records, key=lambda record: record.get("saved", 0))["run_id"]
+        merged = {}
+        for record in records:
+            if record.get("run_id") == latest:
+                for kind, values in record.get("durations", {}).items():
+                    merged.setdefault(kind, []).extend(values)
+        return merged
+
+    @staticmethod
+    def compare(suppressed, animated):
+        """
+        Args:
+            suppressed: {kind: [seconds]} with animations suppressed.
+            animated: {kind: [seconds]} with animations on.
+
+        Returns:
+            {kind: {"suppressed_s", "animated_s", "saved_s", "count"}}; times are
+            medians (None when a mode has no samples).
+        """
+        comparison = {}
+        for kind in sorted(set(suppressed) | set(animated)):
+            medians = {mode: round(statistics.median(values[kind]), 3) if values.get(kind) else None
+                       for mode, values in (("suppressed", suppressed), ("animated", animated))}
+            saved = None
+            if medians["suppressed"] is not None and medians["animated"] is not None:
+                saved = round(medians["animated"] - medians["suppressed"], 3)
+            comparison[kind] = {
+                "suppressed_s": medians["suppressed"],
+                "animated_s": medians["animated"],
+                "saved_s": saved,
+                "count": {"suppressed": len(suppressed.get(kind, [])), "animated": len(animated.get(kind, []))},
+            }
+        return comparison
+
+    @staticmethod
+    def format_table(comparison):
+        """
+        Returns the comparison as a text table (median seconds per interaction).
+        """
+        lines = [f"{'interaction':<14} {'animated (s)':>13} {'suppressed (s)':>15} {'saved (s)':>10}"]
+        for kind, row in comparison.items():
+            cells = [f"{row[key]:.3f}" if row[key] is not None else "-"
+                     for key in ("animated_s", "suppressed_s", "saved_s")]
+            lines.append(f"{kind:<14} {cells[0]:>13} {cells[1]:>15} {cells[2]:>10}")
+        return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Compare interaction timings of the latest runs with animations suppressed and on.")
+    parser.add_argument("--json", action="store_true", help="Print the comparison as JSON")
+    args = parser.parse_args(argv)
+
+    comparison = InteractionTimings.compare(InteractionTimings.load_latest("suppressed"),
+                                            InteractionTimings.load_latest("animated"))
+    if not comparison:
+        print("No interaction timings recorded yet; run the suite with and without animations.suppress.")
+        return
+    print(json.dumps(comparison, indent=2) if args.json else InteractionTimings.format_table(comparison))
+
+
+if __name__ == "__main__":
+    main()
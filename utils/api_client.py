@@ -0,0 +1,164 @@
+"""
+Pooled REST client for Trackora automation framework.
+One keep-alive urllib3 connection pool per worker process is shared by all
+API calls (data seeding, cleanup), instead of a new connection per request.
+"""
+
+import json
+import logging
+import threading
+from urllib.parse import urljoin
+import urllib3
+from urllib3.util.retry import Retry
+
+logger = logging.getLogger(__name__)
+
+
+class ApiError(Exception):
+    """
+    Raised when the Trackora API returns an error status or cannot be reached.
+    """
+
+    def __init__(self, method, url, status, body):
+        super().__init__(f"{method} {url} failed with status {status}: {body[:300] if body else ''}")
+        self.method = method
+        self.url = url
+        self.status = status
+        self.body = body
+
+
+class ApiClient:
+    """
+    Thin JSON client over a shared urllib3 PoolManager.
+
+    - Keep-alive connections, reused across calls and threads
+    - Retries idempotent requests on connection errors and 502/503/504
+    - Bearer token obtained once through the configured login endpoint
+
+    Usage:
+        client = ApiClient.for_config(config)
+        department = client.post("/api/departments", {"name": "QA"})
+    """
+
+    _instances = {}
+    _instances_lock = threading.Lock()
+
+    def __init__(self, base_url, login_path=None, credentials=None, token_field="token",
+                 pool_size=8, timeout=30):
+        """
+        Args:
+            base_url: API root, e.g. "https://trackora-qa.example.com".
+            login_path: Endpoint returning a token for `credentials` (optional).
+            credentials: Dict posted to login_path (e.g. username/password).
+            token_field: Key of the token in the login response.
+            pool_size: Connections kept open per host (match the seeding concurrency).
+            timeout: Per-request timeout in seconds.
+        """
+        self.base_url = base_url.rstrip("/") + "/"
+        self.login_path = login_path
+        self.credentials = credentials
+        self.token_field = token_field
+        self.pool_size = pool_size
+        self.timeout = timeout
+        self._token = None
+        self._token_lock = threading.Lock()
+        self.http = urllib3.PoolManager(
+            num_pools=4,
+            maxsize=pool_size,
+            block=True,  # Never open more than pool_size connections; wait for a free one instead
+            retries=Retry(total=3, connect=3, backoff_factor=0.2, status_forcelist=(502, 503, 504),
+                          allowed_methods=frozenset({"GET", "PUT", "DELETE"})),
+            timeout=urllib3.Timeout(total=timeout),
+        )
+        self.requests_sent = 0
+        self._stats_lock = threading.Lock()
+
+    @classmethod
+    def for_config(cls, config, base_url=None):
+        """
+        Returns the process-wide client for the `api` section of config.yaml
+        (one pool per xdist worker). `base_url` overrides the configured API root.
+        """
+        from utils.test_data_store import TestDataStore
+        api = config.get("api", {}) or {}
+        base_url = base_url or api.get("base_url")
+        with cls._instances_lock:
+            if base_url not in cls._instances:
+                auth = api.get("auth", {}) or {}
+                credentials = None
+                if auth.get("login_path"):
+                    user = TestDataStore.section("users").get(auth.get("user_type", "admin"))
+                    credentials = {"username": user["username"], "password": user["password"]}
+                cls._instances[base_url] = cls(
+                    base_url,
+                    login_path=auth.get("login_path"),
+                    credentials=credentials,
+                    token_field=auth.get("token_field", "token"),
+                    pool_size=api.get("pool_size", 8),
+                    timeout=api.get("timeout", 30),
+                )
+            return cls._instances[base_url]
+
+    def request(self, method, path, payload=None, authenticated=True):
+        """
+        Sends one JSON request and returns the decoded response body (None if empty).
+        Raises ApiError for status >= 400.
+        """
+        url = urljoin(self.base_url, path.lstrip("/"))
+        headers = {"Accept": "application/json"}
+        body = None
+        if payload is not None:
+            headers["Content-Type"] = "application/json"
+            body = json.dumps(payload).encode("utf-8")
+        if authenticated and self.login_path:
+            headers["Authorization"] = f"Bearer {self.token()}"
+        try:
+            response = self.http.request(method, url, body=body, headers=headers)
+        except urllib3.exceptions.HTTPError as e:
+            raise ApiError(method, url, None, str(e)) from e
+        with self._stats_lock:
+            self.requests_sent += 1
+        text = response.data.decode("utf-8") if response.data else ""
+        if response.status >= 400:
+            raise ApiError(method, url, response.status, text)
+        return json.loads(text) if text else None
+
+    def get(self, path):
+        return self.request("GET", path)
+
+    def post(self, path, payload):
+        return self.request("POST", path, payload)
+
+    def put(self, path, payload):
+        return self.request("PUT", path, payload)
+
+    def delete(self, path):
+        return self.request("DELETE", path)
+
+    def token(self):
+        """
+        Logs in through login_path once and returns the cached bearer token.
+        """
+        with self._token_lock:
+            if self._token is None:
+                response = self.request("POST", self.login_path, self.credentials, authenticated=False)
+                self._token = (response or {}).get(self.token_field)
+                if not self._token:
+                    raise ApiError("POST", self.login_path, None, f"no '{self.token_field}' in login response")
+            return self._token
+
+    def close(self):
+        """
+        Closes every pooled connection.
+        """
+        self.http.clear()
+
+    @classmethod
+    def close_all(cls):
+        """
+        Closes all process-wide clients (called at session end).
+        """
+        with cls._instances_lock:
+            for client in cls._instances.values():
+                client.close()
+            cls._instances = {}
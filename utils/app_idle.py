@@ -0,0 +1,209 @@
+"""
+App-idle detection for Trackora automation framework.
+Instruments every document (CDP Page.addScriptToEvaluateOnNewDocument on
+Chromium) with counters of in-flight fetch/XHR requests, pending short
+timers and running animations, so page objects can wait for the React SPA
+to finish reacting to an action with one cheap in-page wait instead of
+polling for `.ant-spin` spinners or document.readyState (which stays
+'complete' after the first load).
+"""
+
+import logging
+import time
+from selenium.common.exceptions import WebDriverException
+from utils.wait_policy import WaitPolicy
+
+logger = logging.getLogger(__name__)
+
+# Installed at document start. Idempotent; %(timer_threshold_ms)d is filled in by AppIdle.
+# Only setTimeout calls up to the threshold count as pending work: long
+# timeouts (session expiry, toasts) and setInterval polling never settle.
+IDLE_HOOKS_SCRIPT = """
+(function () {
+    if (window.__trackoraIdle) { return; }
+    var state = {fetch: 0, xhr: 0, lastBusy: performance.now()};
+    var timers = new Set();
+    var thresholdMs = %(timer_threshold_ms)d;
+    var busy = function () { state.lastBusy = performance.now(); };
+
+    var nativeFetch = window.fetch;
+    if (nativeFetch) {
+        window.fetch = function () {
+            state.fetch++;
+            busy();
+            var done = function () { state.fetch--; busy(); };
+            var request;
+            try {
+                request = nativeFetch.apply(this, arguments);
+            } catch (e) {
+                done();
+                throw e;
+            }
+            request.then(done, done);
+            return request;
+        };
+    }
+
+    var nativeSend = XMLHttpRequest.prototype.send;
+    XMLHttpRequest.prototype.send = function () {
+        var xhr = this;
+        var done = function () {
+            xhr.removeEventListener('loadend', done);
+            state.xhr--;
+            busy();
+        };
+        state.xhr++;
+        busy();
+        xhr.addEventListener('loadend', done);
+        try {
+            return nativeSend.apply(this, arguments);
+        } catch (e) {
+            done();
+            throw e;
+        }
+    };
+
+    var nativeSetTimeout = window.setTimeout;
+    var nativeClearTimeout = window.clearTimeout;
+    window.setTimeout = function (callback, delay) {
+        if (typeof callback !== 'function' || (Number(delay) || 0) > thresholdMs) {
+            return nativeSetTimeout.apply(this, arguments);
+        }
+        var args = Array.prototype.slice.call(arguments, 2);
+        var id = nativeSetTimeout.call(this, function () {
+            timers.delete(id);
+            busy();
+            callback.apply(this, args);
+        }, delay);
+        timers.add(id);
+        return id;
+    };
+    window.clearTimeout = function (id) {
+        if (timers.delete(id)) { busy(); }
+        return nativeClearTimeout.apply(this, arguments);
+    };
+
+    var runningAnimations = function () {
+        if (!document.getAnimations) { return 0; }
+        return document.getAnimations().filter(function (a) {
+            var timing = a.effect && a.effect.getComputedTiming ? a.effect.getComputedTiming() : {};
+            return a.playState === 'running' && timing.iterations !== Infinity;
+        }).length;
+    };
+
+    window.__trackoraIdle = {
+        busy: busy,
+        pending: function () {
+            return {
+                fetch: state.fetch,
+                xhr: state.xhr,
+                timers: timers.size,
+                animations: runningAnimations(),
+                idle_for_ms: performance.now() - state.lastBusy
+            };
+        }
+    };
+})();
+"""
+
+# Async script. Arguments: quiet window in ms, timeout in ms, Selenium callback.
+# If the hooks were not in place at document start (no CDP), they are installed
+# now; requests already in flight are then invisible, so a spinning .ant-spin
+# also counts as busy in that case.
+IDLE_WAIT_SCRIPT = """
+var late = !window.__trackoraIdle;
+%(hooks)s
+var quietMs = arguments[0];
+var timeoutMs = arguments[1];
+var done = arguments[arguments.length - 1];
+var idle = window.__trackoraIdle;
+var start = performance.now();
+var check = function () {
+    var pending = idle.pending();
+    var spinning = late && !!document.querySelector('.ant-spin-spinning');
+    var busyNow = pending.fetch + pending.xhr + pending.timers + pending.animations > 0 || spinning;
+    if (busyNow) { idle.busy(); }
+    if (!busyNow && idle.pending().idle_for_ms >= quietMs) {
+        clearInterval(timer);
+        done({idle: true, elapsed_ms: performance.now() - start, pending: pending, late: late});
+    } else if (performance.now() - start >= timeoutMs) {
+        clearInterval(timer);
+        done({idle: false, elapsed_ms: performance.now() - start, pending: pending, late: late});
+    }
+};
+var timer = setInterval(check, 16);
+check();
+"""
+
+
+class AppIdle:
+    """
+    Waits until the app has no network requests, short timers or animations
+    pending for a quiet window.
+
+    - install(driver): registers the counters for every new document (done by DriverFactory)
+    - wait(driver): one async script call; recorded in the wait ledger as "app_idle"
+    """
+
+    quiet_ms = 100
+    timeout = 10
+    timer_threshold_ms = 500
+
+    @classmethod
+    def configure(cls, quiet_ms=None, timeout=None, timer_threshold_ms=None):
+        """
+        Sets the quiet window (ms), default timeout (s) and the longest setTimeout
+        delay (ms) that counts as pending work, from config.
+        """
+        if quiet_ms is not None:
+            cls.quiet_ms = quiet_ms
+        if timeout is not None:
+            cls.timeout = timeout
+        if timer_threshold_ms is not None:
+            cls.timer_threshold_ms = timer_threshold_ms
+
+    @classmethod
+    def hooks_script(cls):
+        return IDLE_HOOKS_SCRIPT % {"timer_threshold_ms": cls.timer_threshold_ms}
+
+    @classmethod
+    def install(cls, driver):
+        """
+        Injects the idle counters into every document loaded from now on (Chromium)
+        and into the current one. Returns True if registered for new documents.
+        """
+        from utils.helpers import TestHelpers
+        return TestHelpers.add_init_script(driver, cls.hooks_script())
+
+    @classmethod
+    def wait(cls, driver, timeout=None, quiet_ms=None):
+        """
+        Blocks until no fetch/XHR request, short timer or animation has been
+        pending for the quiet window.
+
+        Args:
+            driver: Selenium WebDriver instance.
+            timeout: Maximum seconds to wait (defaults to config).
+            quiet_ms: Quiet window in milliseconds (defaults to config).
+
+        Returns:
+            True if the app went idle, False on timeout (never raises on timeout).
+        """
+        timeout = cls.timeout if timeout is None else timeout
+        quiet_ms = cls.quiet_ms if quiet_ms is None else quiet_ms
+        script = IDLE_WAIT_SCRIPT % {"hooks": cls.hooks_script()}
+        started = time.perf_counter()
+        result = None
+        for attempt in range(2):
+            try:
+                result = driver.execute_async_script(script, quiet_ms, timeout * 1000)
+                break
+            except WebDriverException as e:
+                # Usually the document was replaced mid-wait; the new one has the hooks too
+                logger.debug(f"App idle script failed (attempt {attempt + 1}): {e}")
+        idle = bool(result and result.get("idle"))
+        WaitPolicy.ledger.record("app_idle", None, timeout, time.perf_counter() - started,
+                                 "ok" if idle else "timeout")
+        if result and not idle:
+            logger.debug(f"App not idle within {timeout}s, pending: {result.get('pending')}")
+        return idle
@@ -0,0 +1,615 @@
+"""
+Caching asset proxy for Trackora automation framework.
+With clear_cache: true every browser starts incognito and downloads the
+whole SPA bundle again. This local forward proxy (one per worker, shared by
+all its browsers) keeps immutable, hash-named static assets (e.g.
+main.3f9a1c2b.js) in an on-disk content-addressed cache shared by workers
+and runs, and serves them without contacting the server. Everything else
+(API calls, HTML, non-hashed files) is passed through untouched.
+
+HTTPS for base_url's host (and any configured hosts) is decrypted with a
+local self-signed certificate (generated with openssl), which the browsers
+accept because certificate errors are already ignored for the QA origin.
+Other HTTPS traffic is tunnelled as is.
+
+Usage:
+    python -m utils.asset_proxy --self-test     # offline check against the stub server
+    python -m utils.asset_proxy --clear         # empty the asset cache
+"""
+
+import argparse
+import hashlib
+import http.client
+import json
+import logging
+import os
+import re
+import shutil
+import socket
+import socketserver
+import ssl
+import subprocess
+import tempfile
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import urlsplit
+
+logger = logging.getLogger(__name__)
+
+STATE_DIR = Path(__file__).parents[1] / ".trackora"
+CACHE_DIR = STATE_DIR / "asset_cache"
+CERT_DIR = STATE_DIR / "asset_proxy"
+
+# A content hash (8+ characters, at least one digit) right before the extension
+DEFAULT_IMMUTABLE_PATTERN = (r"[.-](?=[0-9A-Za-z_]*\d)[0-9A-Za-z_]{8,}"
+                             r"\.(?:js|mjs|css|map|wasm|woff2?|ttf|otf|eot|png|jpe?g|gif|svg|webp|avif|ico)$")
+
+HOP_BY_HOP = {"connection", "keep-alive", "proxy-connection", "proxy-authenticate", "proxy-authorization",
+              "te", "trailer", "trailers", "transfer-encoding", "upgrade", "expect"}
+# Response headers not replayed from the cache
+UNCACHED_HEADERS = HOP_BY_HOP | {"content-length", "date", "age", "set-cookie", "set-cookie2"}
+
+
+def _pipe(client, upstream):
+    """
+    Copies bytes both ways until either side closes (tunnels and upgraded connections).
+    """
+    def copy(source, target):
+        try:
+            while True:
+                data = source.recv(65536)
+                if not data:
+                    break
+                target.sendall(data)
+        except OSError:
+            pass
+        finally:
+            for sock in (source, target):
+                try:
+                    sock.shutdown(socket.SHUT_RDWR)
+                except OSError:
+                    pass
+
+    reverse = threading.Thread(target=copy, args=(upstream, client), name="asset-proxy-pipe", daemon=True)
+    reverse.start()
+    copy(client, upstream)
+    reverse.join()
+    upstream.close()
+
+
+class AssetCache:
+    """
+    Content-addressed asset store: bodies under blobs/<sha256>, and one index
+    entry per URL (and Accept-Encoding) under index/ pointing at a blob with
+    the response headers. Writes are atomic renames, so workers share it safely.
+    """
+
+    def __init__(self, cache_dir=CACHE_DIR):
+        self.cache_dir = Path(cache_dir)
+        self._index = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(url, accept_encoding=""):
+        return hashlib.sha256(f"{accept_encoding}|{url}".encode("utf-8")).hexdigest()
+
+    def get(self, url, accept_encoding=""):
+        """
+        Returns (headers, body) for a cached URL, or None.
+        """
+        key = self.key(url, accept_encoding)
+        with self._lock:
+            entry = self._index.get(key)
+        if entry is None:
+            try:
+                with open(self._index_path(key), "r", encoding="utf-8") as f:
+                    entry = json.load(f)
+            except (OSError, ValueError):
+                return None
+        try:
+            body = self._blob_path(entry["sha256"]).read_bytes()
+        except OSError:
+            return None
+        with self._lock:
+            self._index[key] = entry
+        return entry["headers"], body
+
+    def put(self, url, accept_encoding, headers, body):
+        """
+        Stores a response body (once per content hash) and indexes it under the URL.
+        """
+        digest = hashlib.sha256(body).hexdigest()
+        blob = self._blob_path(digest)
+        if not blob.exists():
+            self._write_atomic(blob, body)
+        key = self.key(url, accept_encoding)
+        entry = {"url": url, "sha256": digest,
+                 "headers": [[name, value] for name, value in headers if name.lower() not in UNCACHED_HEADERS]}
+        self._write_atomic(self._index_path(key), json.dumps(entry).encode("utf-8"))
+        with self._lock:
+            self._index[key] = entry
+
+    def clear(self):
+        shutil.rmtree(self.cache_dir, ignore_errors=True)
+        with self._lock:
+            self._index = {}
+
+    def _blob_path(self, digest):
+        return self.cache_dir / "blobs" / digest[:2] / digest
+
+    def _index_path(self, key):
+        return self.cache_dir / "index" / key[:2] / f"{key}.json"
+
+    @staticmethod
+    def _write_atomic(path, data):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+
+
+class AssetProxyStats:
+    """
+    Counters of one proxy: cache hits/misses of immutable assets, passed-through
+    requests, tunnelled connections, and bytes served from cache vs. fetched.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.counters = {"hits": 0, "misses": 0, "passthrough": 0, "tunnels": 0,
+                         "bytes_saved": 0, "bytes_fetched": 0}
+
+    def record(self, kind, saved=0, fetched=0):
+        with self._lock:
+            self.counters[kind] += 1
+            self.counters["bytes_saved"] += saved
+            self.counters["bytes_fetched"] += fetched
+
+    def summary(self):
+        """
+        Returns the counters plus "hit_rate" (hits / cacheable asset requests, None if none).
+        """
+        with self._lock:
+            counters = dict(self.counters)
+        assets = counters["hits"] + counters["misses"]
+        counters["hit_rate"] = round(counters["hits"] / assets, 3) if assets else None
+        return counters
+
+
+class _ProxyHandler(BaseHTTPRequestHandler):
+    """
+    One client connection: absolute-URI HTTP requests, CONNECT tunnels and,
+    inside intercepted tunnels, the decrypted HTTPS requests.
+    """
+
+    protocol_version = "HTTP/1.1"
+
+    def setup(self):
+        super().setup()
+        self._origin = None     # "https://host[:port]" inside an intercepted tunnel
+        self._upstream = {}     # (scheme, netloc) -> keep-alive upstream connection
+
+    def finish(self):
+        for connection in self._upstream.values():
+            connection.close()
+        try:
+            super().finish()
+        except OSError:
+            pass
+
+    def log_message(self, format, *args):
+        logger.debug("asset proxy: " + format % args)
+
+    def do_CONNECT(self):
+        host, _, port = self.path.rpartition(":")
+        port = int(port) if port.isdigit() else 443
+        proxy = self.server.proxy
+        if proxy.intercepts(host):
+            self.send_response(200, "Connection Established")
+            self.end_headers()
+            try:
+                tls = proxy.tls_context.wrap_socket(self.connection, server_side=True)
+            except (ssl.SSLError, OSError) as e:
+                logger.debug(f"TLS handshake with browser failed for {host}: {e}")
+                self.close_connection = True
+                return
+            # Keep reading requests, now decrypted, on this connection
+            self.connection = tls
+            self.rfile = tls.makefile("rb", self.rbufsize)
+            self.wfile = socketserver._SocketWriter(tls)
+            self._origin = f"https://{host}" + ("" if port == 443 else f":{port}")
+            self.close_connection = False
+            return
+        try:
+            upstream = socket.create_connection((host, port), timeout=proxy.timeout)
+        except OSError as e:
+            self.send_error(502, f"Cannot reach {host}:{port}: {e}")
+            return
+        upstream.settimeout(None)
+        self.send_response(200, "Connection Established")
+        self.end_headers()
+        proxy.stats.record("tunnels")
+        self.close_connection = True
+        _pipe(self.connection, upstream)
+
+    def do_GET(self):
+        self._proxy_request()
+
+    do_HEAD = do_POST = do_PUT = do_PATCH = do_DELETE = do_OPTIONS = do_GET
+
+    def _proxy_request(self):
+        url = self._target_url()
+        if url is None:
+            self.send_error(400, "Absolute URL or intercepted tunnel expected")
+            return
+        if self.headers.get("Upgrade"):
+            self._pipe_upgrade(url)
+            return
+        proxy = self.server.proxy
+        body = self._read_body()
+        accept_encoding = self.headers.get("Accept-Encoding", "")
+        lookup = self.command == "GET" and "Range" not in self.headers
+        if lookup:
+            cached = proxy.cache.get(url, accept_encoding)
+            if cached is not None:
+                headers, data = cached
+                self._send(200, "OK", headers, data)
+                proxy.stats.record("hits", saved=len(data))
+                return
+        try:
+            response = self._forward(url, body)
+        except (OSError, http.client.HTTPException) as e:
+            self.send_error(502, f"Upstream request failed: {e}")
+            return
+        if lookup and proxy.is_cacheable(url, response):
+            data = response.read()
+            proxy.cache.put(url, accept_encoding, response.getheaders(), data)
+            self._send(response.status, response.reason, response.getheaders(), data)
+            proxy.stats.record("misses", fetched=len(data))
+        else:
+            fetched = self._stream(response)
+            proxy.stats.record("passthrough", fetched=fetched)
+        if response.will_close:
+            self._upstream.pop(self._upstream_key(url), None)
+
+    def _target_url(self):
+        if self._origin and self.path.startswith("/"):
+            return self._origin + self.path
+        if self.path.startswith("http://") or self.path.startswith("https://"):
+            return self.path
+        return None
+
+    def _read_body(self):
+        if self.headers.get("Transfer-Encoding", "").lower() == "chunked":
+            chunks = []
+            while True:
+                size = int(self.rfile.readline().split(b";")[0].strip() or b"0", 16)
+                if size == 0:
+                    while self.rfile.readline() not in (b"\r\n", b"\n", b""):
+                        pass  # Trailers
+                    return b"".join(chunks)
+                chunks.append(self.rfile.read(size))
+                self.rfile.readline()
+        length = int(self.headers.get("Content-Length") or 0)
+        return self.rfile.read(length) if length else None
+
+    @staticmethod
+    def _upstream_key(url):
+        parts = urlsplit(url)
+        return parts.scheme, parts.netloc
+
+    def _connection(self, url, fresh=False):
+        key = self._upstream_key(url)
+        connection = self._upstream.get(key)
+        if connection is None or fresh:
+            if connection is not None:
+                connection.close()
+            scheme, netloc = key
+            timeout = self.server.proxy.timeout
+            if scheme == "https":
+                # Same trust as the browsers: QA certificates are not verified
+                connection = http.client.HTTPSConnection(netloc, timeout=timeout,
+                                                         context=ssl._create_unverified_context())
+            else:
+                connection = http.client.HTTPConnection(netloc, timeout=timeout)
+            self._upstream[key] = connection
+        return connection
+
+    def _forward(self, url, body):
+        """
+        Sends the request upstream unchanged (minus hop-by-hop headers) and returns the response.
+        """
+        parts = urlsplit(url)
+        path = (parts.path or "/") + (f"?{parts.query}" if parts.query else "")
+        headers = [(name, value) for name, value in self.headers.items() if name.lower() not in HOP_BY_HOP]
+        if body is not None and not any(name.lower() == "content-length" for name, _ in headers):
+            headers.append(("Content-Length", str(len(body))))
+        for attempt in range(2):
+            # A kept-alive upstream connection may have been closed by the server; retry once on a new one
+            connection = self._connection(url, fresh=attempt > 0)
+            try:
+                connection.putrequest(self.command, path, skip_host=True, skip_accept_encoding=True)
+                for name, value in headers:
+                    connection.putheader(name, value)
+                connection.endheaders(body)
+                return connection.getresponse()
+            except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+                if attempt:
+                    raise
+
+    def _send(self, status, reason, headers, data):
+        self.send_response_only(status, reason)
+        for name, value in headers:
+            if name.lower() not in UNCACHED_HEADERS:
+                self.send_header(name, value)
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        if self.command != "HEAD":
+            self.wfile.write(data)
+
+    def _stream(self, response):
+        """
+        Relays an upstream response as it arrives. Returns the number of body bytes.
+        """
+        self.send_response_only(response.status, response.reason)
+        for name, value in response.getheaders():
+            if name.lower() not in HOP_BY_HOP:
+                self.send_header(name, value)
+        no_body = self.command == "HEAD" or response.status in (204, 304) or response.status < 200
+        chunked = not no_body and response.length is None
+        if chunked:
+            self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        total = 0
+        if no_body:
+            response.read()
+            return total
+        while True:
+            data = response.read1(65536) if chunked else response.read(65536)
+            if not data:
+                break
+            total += len(data)
+            self.wfile.write(b"%x\r\n%s\r\n" % (len(data), data) if chunked else data)
+        if chunked:
+            self.wfile.write(b"0\r\n\r\n")
+        return total
+
+    def _pipe_upgrade(self, url):
+        """
+        Hands an Upgrade request (e.g. WebSocket) to the server and relays the raw connection.
+        """
+        parts = urlsplit(url)
+        port = parts.port or (443 if parts.scheme == "https" else 80)
+        try:
+            upstream = socket.create_connection((parts.hostname, port), timeout=self.server.proxy.timeout)
+            if parts.scheme == "https":
+                upstream = ssl._create_unverified_context().wrap_socket(upstream, server_hostname=parts.hostname)
+            upstream.settimeout(None)
+        except OSError as e:
+            self.send_error(502, f"Cannot reach {parts.netloc}: {e}")
+            return
+        path = (parts.path or "/") + (f"?{parts.query}" if parts.query else "")
+        lines = [f"{self.command} {path} HTTP/1.1"]
+        lines += [f"{name}: {value}" for name, value in self.headers.items() if name.lower() != "proxy-connection"]
+        upstream.sendall(("\r\n".join(lines) + "\r\n\r\n").encode("latin-1"))
+        self.server.proxy.stats.record("tunnels")
+        self.close_connection = True
+        _pipe(self.connection, upstream)
+
+
+class AssetProxy:
+    """
+    Local caching forward proxy for the browsers of one worker.
+
+    - start() / stop(): runs the proxy on 127.0.0.1 in a background thread;
+      AssetProxy.active is what DriverFactory wires into new browsers
+    - stats.summary(): hits, misses, hit rate, bytes saved/fetched
+
+    Usage:
+        with AssetProxy(intercept_hosts=["qa.trackora.example"]) as proxy:
+            driver = DriverFactory.create_driver(config)   # routed through proxy.url
+    """
+
+    active = None
+
+    def __init__(self, cache_dir=CACHE_DIR, port=0, immutable_pattern=None, intercept_hosts=(),
+                 cert_dir=CERT_DIR, timeout=30):
+        """
+        Args:
+            cache_dir: Content-addressed asset cache (shared by workers and runs).
+            port: Port to listen on (0 picks a free one).
+            immutable_pattern: Regex for URL paths of immutable assets (default: hash-named files).
+            intercept_hosts: HTTPS hosts whose assets are cached (others are tunnelled).
+            cert_dir: Where the self-signed certificate for intercepted hosts is kept.
+            timeout: Seconds to wait on the upstream server.
+        """
+        self.cache = AssetCache(cache_dir)
+        self.immutable = re.compile(immutable_pattern or DEFAULT_IMMUTABLE_PATTERN, re.IGNORECASE)
+        self.intercept_hosts = {host.lower() for host in intercept_hosts if host}
+        self.timeout = timeout
+        self.stats = AssetProxyStats()
+        self.tls_context = self._tls_context(Path(cert_dir)) if self.intercept_hosts else None
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", port), _ProxyHandler)
+        self.httpd.daemon_threads = True
+        self.httpd.proxy = self
+        self._thread = None
+
+    @classmethod
+    def from_config(cls, config):
+        """
+        Builds the proxy from the asset_proxy section of config.yaml, or returns None when disabled.
+        """
+        settings = config.get("asset_proxy") or {}
+        if not settings.get("enabled", False):
+            return None
+        hosts = list(settings.get("hosts") or [])
+        base_url = urlsplit(config.get("base_url", ""))
+        if base_url.scheme == "https" and base_url.hostname:
+            hosts.append(base_url.hostname)
+        cache_dir = settings.get("cache_dir") or CACHE_DIR
+        return cls(cache_dir=Path(__file__).parents[1] / cache_dir, port=settings.get("port", 0),
+                   immutable_pattern=settings.get("immutable_pattern"), intercept_hosts=hosts)
+
+    @property
+    def url(self):
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def intercepts(self, host):
+        return self.tls_context is not None and host.lower() in self.intercept_hosts
+
+    def is_cacheable(self, url, response):
+        """
+        True for a complete 200 response to an immutable asset URL (hash-named or
+        Cache-Control: immutable) that sets no cookie and allows storing.
+        """
+        if response.status != 200 or response.getheader("Set-Cookie"):
+            return False
+        cache_control = (response.getheader("Cache-Control") or "").lower()
+        if "no-store" in cache_control or "private" in cache_control:
+            return False
+        return bool(self.immutable.search(urlsplit(url).path)) or "immutable" in cache_control
+
+    def start(self):
+        """
+        Starts serving in a daemon thread and makes this the active proxy. Returns self.
+        """
+        self._thread = threading.Thread(target=self.httpd.serve_forever, name="asset-proxy", daemon=True)
+        self._thread.start()
+        AssetProxy.active = self
+        logger.info(f"Asset proxy listening on {self.url} (cache: {self.cache.cache_dir})")
+        return self
+
+    def stop(self):
+        """
+        Stops the server and logs its hit rate.
+        """
+        if AssetProxy.active is self:
+            AssetProxy.active = None
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        summary = self.stats.summary()
+        logger.info(f"Asset proxy: {summary['hits']} hit(s), {summary['misses']} miss(es), "
+                    f"{summary['bytes_saved']} bytes served from cache.")
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    @staticmethod
+    def _tls_context(cert_dir):
+        """
+        Server-side TLS context with the local certificate (created with openssl on first use).
+        Returns None, so HTTPS is only tunnelled, when no certificate can be made.
+        """
+        cert, key = cert_dir / "proxy-cert.pem", cert_dir / "proxy-key.pem"
+        if not (cert.is_file() and key.is_file()):
+            cert_dir.mkdir(parents=True, exist_ok=True)
+            try:
+                subprocess.run(["openssl", "req", "-x509", "-newkey", "rsa:2048", "-nodes", "-days", "3650",
+                                "-subj", "/CN=Trackora asset proxy", "-keyout", str(key), "-out", str(cert)],
+                               check=True, capture_output=True)
+            except (OSError, subprocess.CalledProcessError) as e:
+                logger.warning(f"Could not create the asset proxy certificate, HTTPS assets are not cached: {e}")
+                return None
+        context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+        context.load_cert_chain(cert, key)
+        context.set_alpn_protocols(["http/1.1"])
+        return context
+
+
+def self_test():
+    """
+    Runs the proxy against the local stub server (HTTP, and HTTPS when openssl
+    is available) and checks that hash-named assets are served from cache after
+    the first request while API calls always reach the server.
+    Returns a list of failures (empty when everything passed).
+    """
+    from utils.stub_server import StubApiServer
+
+    asset_path, asset = "/static/js/main.3f9a1c2b.js", b"console.log('trackora');" * 1000
+    plain_path = "/static/js/config.js"
+    assets = {asset_path: ("application/javascript", asset), plain_path: ("application/javascript", b"var x;")}
+    failures = []
+
+    def check(condition, message):
+        if not condition:
+            failures.append(message)
+
+    def request(proxy, base_url, method, path, body=None):
+        target = urlsplit(base_url)
+        if target.scheme == "https":
+            connection = http.client.HTTPSConnection("127.0.0.1", proxy.httpd.server_address[1],
+                                                     context=ssl._create_unverified_context())
+            connection.set_tunnel(target.netloc)
+            connection.request(method, path, body)
+        else:
+            connection = http.client.HTTPConnection("127.0.0.1", proxy.httpd.server_address[1])
+            connection.request(method, base_url + path, body)
+        response = connection.getresponse()
+        data = response.read()
+        connection.close()
+        return response.status, data
+
+    with tempfile.TemporaryDirectory() as workdir:
+        cert_dir = Path(workdir) / "cert"
+        schemes = ["http"]
+        if AssetProxy._tls_context(cert_dir) is not None:
+            schemes.append("https")
+        for scheme in schemes:
+            server_context = None
+            if scheme == "https":
+                server_context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+                server_context.load_cert_chain(cert_dir / "proxy-cert.pem", cert_dir / "proxy-key.pem")
+            cache_dir = Path(workdir) / f"cache-{scheme}"
+            with StubApiServer(assets=assets, ssl_context=server_context) as server:
+                for run in range(2):  # The second proxy stands for the next worker/run
+                    hosts = ["127.0.0.1"] if scheme == "https" else ()
+                    with AssetProxy(cache_dir=cache_dir, intercept_hosts=hosts, cert_dir=cert_dir) as proxy:
+                        for _ in range(2):
+                            status, data = request(proxy, server.base_url, "GET", asset_path)
+                            check(status == 200 and data == asset, f"{scheme}: asset body differs")
+                            request(proxy, server.base_url, "GET", plain_path)
+                            request(proxy, server.base_url, "GET", "/api/departments")
+                        status, data = request(proxy, server.base_url, "POST", "/api/departments",
+                                               json.dumps({"name": "Proxy"}).encode("utf-8"))
+                        check(status == 201 and json.loads(data).get("name") == "Proxy",
+                              f"{scheme}: API POST not passed through")
+                        summary = proxy.stats.summary()
+                        expected_hits = 2 if run else 1
+                        check(summary["hits"] == expected_hits and summary["misses"] == 2 - expected_hits,
+                              f"{scheme} run {run + 1}: expected {expected_hits} hit(s), got {summary}")
+                        check(summary["bytes_saved"] == expected_hits * len(asset),
+                              f"{scheme} run {run + 1}: bytes saved {summary['bytes_saved']}")
+                requests = server.store.requests
+                check(requests[asset_path] == 1, f"{scheme}: asset fetched {requests[asset_path]} times, expected 1")
+                check(requests[plain_path] == 4, f"{scheme}: non-hashed file must not be cached")
+                check(requests["/api/departments"] == 6, f"{scheme}: API calls must always reach the server")
+        logger.info(f"Self-test covered: {', '.join(schemes)}")
+    return failures
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Caching asset proxy maintenance.")
+    parser.add_argument("--self-test", action="store_true", help="Check the proxy offline against the stub server")
+    parser.add_argument("--clear", action="store_true", help="Delete the asset cache")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO)
+    if args.clear:
+        AssetCache().clear()
+        print(f"Cleared {CACHE_DIR}")
+    if args.self_test:
+        failures = self_test()
+        print("Asset proxy self-test passed." if not failures else "\n".join(["Asset proxy self-test failed:"] + failures))
+        raise SystemExit(1 if failures else 0)
+    if not (args.clear or args.self_test):
+        parser.print_help()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,170 @@
+"""
+Batched element reads for Trackora automation framework.
+Resolves many locators in the browser with one injected script and returns
+visibility, text, attributes and computed styles for each of them, instead of
+several WebDriver round trips per element.
+"""
+
+import logging
+from selenium.common.exceptions import WebDriverException
+
+logger = logging.getLogger(__name__)
+
+# JS helpers shared by batched scripts: resolve a Selenium (by, value) locator
+# in-page and approximate WebDriver's "is displayed" check.
+LOCATOR_JS = """
+var tkFindAll = function (by, value, context) {
+    context = context || document;
+    var list = function (nodes) { return Array.prototype.slice.call(nodes); };
+    switch (by) {
+        case 'xpath':
+            var snapshot = document.evaluate(value, context, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+            var found = [];
+            for (var i = 0; i < snapshot.snapshotLength; i++) { found.push(snapshot.snapshotItem(i)); }
+            return found;
+        case 'css selector': return list(context.querySelectorAll(value));
+        case 'id': return list(context.querySelectorAll('[id="' + value.replace(/"/g, '\\\\"') + '"]'));
+        case 'class name': return list(context.getElementsByClassName(value));
+        case 'name': return list(context.querySelectorAll('[name="' + value.replace(/"/g, '\\\\"') + '"]'));
+        case 'tag name': return list(context.getElementsByTagName(value));
+        case 'link text':
+            return list(context.getElementsByTagName('a')).filter(function (a) { return a.innerText.trim() === value; });
+        case 'partial link text':
+            return list(context.getElementsByTagName('a')).filter(function (a) { return a.innerText.indexOf(value) !== -1; });
+    }
+    throw new Error('Unsupported locator strategy: ' + by);
+};
+var tkIsVisible = function (el) {
+    if (el.checkVisibility) {
+        return el.checkVisibility({checkOpacity: true, checkVisibilityCSS: true});
+    }
+    var style = window.getComputedStyle(el);
+    return style.visibility !== 'hidden' && style.display !== 'none' && el.getClientRects().length > 0;
+};
+"""
+
+READ_MANY_SCRIPT = LOCATOR_JS + """
+var specs = arguments[0];
+var attributes = arguments[1];
+var styles = arguments[2];
+var result = {};
+specs.forEach(function (spec) {
+    var el = tkFindAll(spec.by, spec.value)[0];
+    if (!el) {
+        result[spec.name] = {present: false, visible: false, text: null, attributes: {}, styles: {}};
+        return;
+    }
+    var visible = tkIsVisible(el);
+    var entry = {present: true, visible: visible, text: visible ? el.innerText.trim() : '', attributes: {}, styles: {}};
+    attributes.forEach(function (name) { entry.attributes[name] = el.getAttribute(name); });
+    if (styles.length) {
+        var computed = window.getComputedStyle(el);
+        styles.forEach(function (name) { entry.styles[name] = computed.getPropertyValue(name); });
+    }
+    result[spec.name] = entry;
+});
+return result;
+"""
+
+# Arguments: locator strategy, locator value. Returns innerText of every match.
+READ_TEXTS_SCRIPT = LOCATOR_JS + """
+return tkFindAll(arguments[0], arguments[1]).map(function (el) { return (el.innerText || '').trim(); });
+"""
+
+READ_OPTIONS_SCRIPT = LOCATOR_JS + """
+var specs = arguments[0], result = {};
+specs.forEach(function (spec) {
+  var select = tkFindAll(spec.by, spec.value)[0];
+  result[spec.name] = !select ? null : Array.prototype.filter.call(select.options || [], function (option) {
+    return option.value !== '' && !option.disabled;  // Skip "All"/placeholder entries
+  }).map(function (option) { return option.text.trim(); });
+});
+return result;
+"""
+
+
+class BatchReader:
+    """
+    Reads a named set of locators in a single execute_script call.
+    Falls back to per-element WebDriver reads if the script cannot run.
+    """
+
+    @staticmethod
+    def read_many(driver, locators, attributes=(), styles=()):
+        """
+        Args:
+            driver: Selenium WebDriver instance.
+            locators: Dict of {name: (By, value)}.
+            attributes: Attribute names to read from every element.
+            styles: Computed CSS properties to read from every element.
+
+        Returns:
+            Dict of {name: {"present", "visible", "text", "attributes", "styles"}}.
+            Missing elements have present/visible False and text None.
+        """
+        specs = [{"name": name, "by": by, "value": value} for name, (by, value) in locators.items()]
+        try:
+            return driver.execute_script(READ_MANY_SCRIPT, specs, list(attributes), list(styles))
+        except WebDriverException as e:
+            logger.debug(f"Batched read failed, reading elements one by one: {e}")
+            return BatchReader._read_each(driver, locators, attributes, styles)
+
+    @staticmethod
+    def _read_each(driver, locators, attributes, styles):
+        """
+        Per-element fallback with the same result shape as read_many.
+        """
+        from utils.wait_policy import WaitPolicy
+        policy = WaitPolicy(driver)
+        result = {}
+        for name, locator in locators.items():
+            elements = policy.find_all(locator)
+            if not elements:
+                result[name] = {"present": False, "visible": False, "text": None, "attributes": {}, "styles": {}}
+                continue
+            element = elements[0]
+            visible = element.is_displayed()
+            result[name] = {
+                "present": True,
+                "visible": visible,
+                "text": element.text.strip() if visible else "",
+                "attributes": {attr: element.get_attribute(attr) for attr in attributes},
+                "styles": {style: element.value_of_css_property(style) for style in styles},
+            }
+        return result
+
+    @staticmethod
+    def read_texts(driver, locator):
+        """
+        Returns the text of every element matching locator, in one call.
+        Falls back to per-element reads if the script cannot run.
+        """
+        by, value = locator
+        try:
+            return driver.execute_script(READ_TEXTS_SCRIPT, by, value)
+        except WebDriverException as e:
+            logger.debug(f"Batched text read failed, reading elements one by one: {e}")
+            from utils.wait_policy import WaitPolicy
+            return [element.text.strip() for element in WaitPolicy(driver).find_all(locator)]
+
+    @staticmethod
+    def read_select_options(driver, locators):
+        """
+        Returns {name: [option texts]} for native <select> elements, in one call.
+        Placeholder (empty value) and disabled options are skipped; a missing
+        select gives None.
+        """
+        specs = [{"name": name, "by": by, "value": value} for name, (by, value) in locators.items()]
+        try:
+            return driver.execute_script(READ_OPTIONS_SCRIPT, specs)
+        except WebDriverException as e:
+            logger.debug(f"Batched option read failed, reading selects one by one: {e}")
+            from selenium.webdriver.support.ui import Select
+            from utils.wait_policy import WaitPolicy
+            policy = WaitPolicy(driver)
+            result = {}
+            for name, locator in locators.items():
+                elements = policy.find_all(locator)
+                result[name] = [option.text.strip() for option in Select(elements[0]).options
+                                if option.get_attribute("value") and option.is_enabled()] if elements else None
+            return result
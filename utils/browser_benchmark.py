@@ -0,0 +1,87 @@
+"""
+Browser startup benchmark for Trackora automation framework.
+Launches each browser profile from config.yaml a few times and reports the
+launch and launch-to-first-page (base_url loaded) times.
+
+Usage:
+    python -m utils.browser_benchmark                       # every profile, 3 runs each
+    python -m utils.browser_benchmark --profiles default fast-headless --runs 5
+"""
+
+import argparse
+import json
+import logging
+import statistics
+from utils.config_loader import ConfigLoader
+from utils.driver_factory import DriverFactory
+
+logger = logging.getLogger(__name__)
+
+
+class BrowserBenchmark:
+    """
+    Measures browser startup per profile.
+    """
+
+    @staticmethod
+    def run(config, profiles=None, runs=3):
+        """
+        Args:
+            config: Effective configuration (see ConfigLoader).
+            profiles: Profile names to measure (default: all in browser_profiles).
+            runs: Launches per profile.
+
+        Returns:
+            {profile: {"runs", "launch_s", "first_page_s", "total_s", "errors"}};
+            times are medians over the successful runs.
+        """
+        profiles = profiles or list(config.get("browser_profiles", {}) or {"default": {}})
+        results = {}
+        for name in profiles:
+            timings, errors = [], []
+            for _ in range(runs):
+                driver = None
+                try:
+                    driver = DriverFactory.create_driver(config, name)
+                    timings.append(driver.startup_timings)
+                except Exception as e:
+                    logger.warning(f"Profile '{name}' failed to start: {e}")
+                    errors.append(str(e).splitlines()[0] if str(e) else type(e).__name__)
+                finally:
+                    if driver is not None:
+                        driver.quit()
+            results[name] = {"runs": len(timings), "errors": errors}
+            for key in ("launch_s", "first_page_s", "total_s"):
+                results[name][key] = round(statistics.median(t[key] for t in timings), 3) if timings else None
+        return results
+
+    @staticmethod
+    def format_table(results):
+        """
+        Returns the results as a text table, fastest profile first.
+        """
+        rows = sorted(results.items(), key=lambda item: (item[1]["total_s"] is None, item[1]["total_s"] or 0))
+        lines = [f"{'profile':<20} {'runs':>4} {'launch (s)':>11} {'first page (s)':>15} {'total (s)':>10}"]
+        for name, result in rows:
+            cells = [f"{result[key]:.3f}" if result[key] is not None else "-"
+                     for key in ("launch_s", "first_page_s", "total_s")]
+            lines.append(f"{name:<20} {result['runs']:>4} {cells[0]:>11} {cells[1]:>15} {cells[2]:>10}")
+            for error in result["errors"]:
+                lines.append(f"  ! {error}")
+        return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Measure browser startup time per browser profile.")
+    parser.add_argument("--profiles", nargs="*", help="Profiles to measure (default: all)")
+    parser.add_argument("--runs", type=int, default=3, help="Launches per profile (default: 3)")
+    parser.add_argument("--json", action="store_true", help="Print the results as JSON")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.WARNING)
+    results = BrowserBenchmark.run(ConfigLoader.get(), args.profiles, args.runs)
+    print(json.dumps(results, indent=2) if args.json else BrowserBenchmark.format_table(results))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,171 @@
+"""
+Combinatorial test reduction for Trackora automation framework.
+Builds n-wise (pairwise by default) covering arrays over filter domains, so a
+multi-filter page is covered for every pair of filter values in a small
+fraction of the exhaustive cartesian product.
+"""
+
+import logging
+import math
+import random
+from itertools import combinations, product
+from utils.test_data_store import TestDataStore, thaw
+
+logger = logging.getLogger(__name__)
+
+
+def covering_array(domains, strength=2, constraints=(), seed=0, candidates=30):
+    """
+    Greedy (AETG-style) covering array: every combination of `strength`
+    parameter values allowed by the constraints appears in at least one case.
+
+    Args:
+        domains: {parameter: [values]} (None is a valid value, e.g. "filter not set").
+        strength: Interaction strength (2 = pairwise, 3 = all triples, ...).
+        constraints: Callables taking a possibly partial case dict and returning
+            False when it is not allowed (use case.get() for unset parameters).
+        seed: Random seed; the same inputs and seed always give the same cases.
+        candidates: Candidate cases built per selected case (more = smaller arrays).
+
+    Returns:
+        List of {parameter: value} cases.
+    """
+    names = list(domains)
+    values = [list(domains[name]) for name in names]
+    if not names or any(not options for options in values):
+        return []
+    strength = max(1, min(strength, len(names)))
+    rng = random.Random(seed)
+
+    def as_case(assignment):
+        return {names[i]: values[i][assignment[i]] for i in sorted(assignment)}
+
+    def allowed(assignment):
+        case = as_case(assignment)
+        return all(constraint(case) for constraint in constraints)
+
+    # Every allowed t-way interaction, as ((param index, value index), ...)
+    uncovered = set()
+    for params in combinations(range(len(names)), strength):
+        for picks in product(*(range(len(values[i])) for i in params)):
+            if allowed(dict(zip(params, picks))):
+                uncovered.add(tuple(zip(params, picks)))
+
+    def covered_by(assignment, must_include=None):
+        found = set()
+        params = sorted(assignment)
+        for combo in combinations(params, strength):
+            if must_include is not None and must_include not in combo:
+                continue
+            key = tuple((i, assignment[i]) for i in combo)
+            if key in uncovered:
+                found.add(key)
+        return found
+
+    cases = []
+    while uncovered:
+        best, best_gain = None, 0
+        ordered = sorted(uncovered)
+        for _ in range(candidates):
+            # Start from an uncovered interaction so every case makes progress
+            assignment = dict(rng.choice(ordered))
+            remaining = [i for i in range(len(names)) if i not in assignment]
+            rng.shuffle(remaining)
+            for param in remaining:
+                options = list(range(len(values[param])))
+                rng.shuffle(options)
+                scored = []
+                for option in options:
+                    assignment[param] = option
+                    if allowed(assignment):
+                        scored.append((len(covered_by(assignment, param)), option))
+                del assignment[param]
+                if not scored:
+                    assignment = None
+                    break
+                assignment[param] = max(scored, key=lambda item: item[0])[1]
+            if assignment is None:
+                continue
+            gain = len(covered_by(assignment))
+            if gain > best_gain:
+                best, best_gain = assignment, gain
+        if best is None:
+            # No allowed full case contains what is left; report and stop
+            logger.warning(f"{len(uncovered)} interactions cannot be covered under the constraints")
+            break
+        uncovered -= covered_by(best)
+        cases.append(as_case(best))
+    return cases
+
+
+def exclusions(rules):
+    """
+    Turns declared constraints into a predicate for covering_array().
+
+    Args:
+        rules: List of partial cases that must never occur together,
+            e.g. [{"department": "QA", "skill": "Java"}].
+    """
+    def constraint(case):
+        return not any(all(key in case and case[key] == value for key, value in rule.items())
+                       for rule in rules)
+    return constraint
+
+
+def case_id(case):
+    """
+    Stable, readable test id for a case, e.g. "skill=PHP-department=QA-status=any".
+    """
+    return "-".join(f"{name}={'any' if value is None else value}" for name, value in case.items())
+
+
+class FilterDomains:
+    """
+    Filter value domains for combinatorial tests, declared in
+    test_data.filter_domains.<name> of data/testdata.json. Only these committed
+    values are used at collection, so every machine generates the same cases;
+    the filter tests check them against the live dropdowns with missing().
+
+    A domain entry in testdata.json looks like:
+      "project_filters": {
+        "domains": {"skill": ["PHP", "Java"], "status": [null, "In Progress"]},
+        "exclude": [{"skill": "PHP", "department": "Java"}]
+      }
+    """
+
+    @staticmethod
+    def load(name):
+        """
+        Returns (domains, constraints) for covering_array().
+        """
+        declared = thaw(TestDataStore.section("test_data", "filter_domains").get(name, {}))
+        domains = declared.get("domains", {})
+        if not domains:
+            raise KeyError(f"No filter domains declared for '{name}'")
+        return domains, [exclusions(declared.get("exclude", []))]
+
+    @staticmethod
+    def missing(name, live_domains):
+        """
+        Returns {parameter: [declared values]} the live dropdowns no longer offer
+        (empty when the declared domains are still valid).
+
+        Args:
+            name: Domain name in test_data.filter_domains.
+            live_domains: {parameter: [option texts]} read from the page.
+        """
+        domains, _ = FilterDomains.load(name)
+        missing = {}
+        for parameter, options in domains.items():
+            offered = set(live_domains.get(parameter) or [])
+            absent = [value for value in options if value is not None and value not in offered]
+            if absent:
+                missing[parameter] = absent
+        return missing
+
+    @staticmethod
+    def exhaustive_size(domains):
+        """
+        Number of cases in the full cartesian product.
+        """
+        return math.prod(len(options) for options in domains.values())
@@ -0,0 +1,247 @@
+"""
+Layered configuration loader for Trackora automation framework.
+Builds the effective configuration once per process from (later layers win):
+  1. Built-in defaults
+  2. config/config.yaml
+  3. config/config.<env>.yaml            (optional, e.g. config.staging.yaml)
+  4. TRACKORA_* environment variables     (TRACKORA_BROWSER, TRACKORA_DRIVER_POOL__ENABLED, ...)
+  5. --tk-* command line options          (--tk-browser, --tk-set driver_pool.enabled=false, ...)
+and exposes it as an immutable Config shared by fixtures and hooks.
+"""
+
+import logging
+import os
+import threading
+from collections.abc import Mapping
+from pathlib import Path
+import yaml
+from utils.test_data_store import deep_merge, freeze, thaw
+
+logger = logging.getLogger(__name__)
+
+CONFIG_DIR = Path(__file__).parents[1] / "config"
+ENV_PREFIX = "TRACKORA_"
+SECRET_SUFFIXES = ("password", "secret", "api_key", "token")  # Masked in dump()
+
+DEFAULTS = {
+    "env": "QA",
+    "browser": "chrome",
+    "base_url": None,
+    "implicit_wait": 0,
+    "explicit_wait": 10,
+    "clear_cache": True,
+}
+
+
+class ConfigError(ValueError):
+    """
+    Raised for an invalid override (unknown key, wrong type) or a missing required value.
+    """
+
+
+class Config(Mapping):
+    """
+    Immutable effective configuration.
+
+    Behaves like the parsed YAML (config["base_url"], config.get("driver_pool", {}))
+    with nested sections as read-only mappings, plus typed properties for the
+    core settings and `sources` recording which layer set each value.
+    """
+
+    def __init__(self, values, sources):
+        self._values = freeze(values)
+        self._sources = dict(sources)
+
+    def __getitem__(self, key):
+        return self._values[key]
+
+    def __iter__(self):
+        return iter(self._values)
+
+    def __len__(self):
+        return len(self._values)
+
+    def __setattr__(self, name, value):
+        if name.startswith("_") and name not in self.__dict__:
+            return object.__setattr__(self, name, value)
+        raise AttributeError("Config is read-only; use TRACKORA_* variables or --tk-* options to override values")
+
+    @property
+    def env(self):
+        return str(self._values["env"])
+
+    @property
+    def browser(self):
+        return str(self._values["browser"]).lower()
+
+    @property
+    def base_url(self):
+        return str(self._values["base_url"])
+
+    @property
+    def implicit_wait(self):
+        return float(self._values["implicit_wait"])
+
+    @property
+    def explicit_wait(self):
+        return float(self._values["explicit_wait"])
+
+    @property
+    def clear_cache(self):
+        return bool(self._values["clear_cache"])
+
+    @property
+    def sources(self):
+        """
+        {dotted key: layer} for every leaf value, e.g. {"browser": "env:TRACKORA_BROWSER"}.
+        """
+        return dict(self._sources)
+
+    def to_dict(self):
+        """
+        Returns a mutable deep copy of the values.
+        """
+        return thaw(self._values)
+
+    def dump(self):
+        """
+        Returns the effective configuration as YAML, each leaf annotated with its source layer.
+        """
+        lines = []
+
+        def walk(value, path, indent):
+            for key, item in value.items():
+                dotted = f"{path}.{key}" if path else str(key)
+                if isinstance(item, Mapping) and item:
+                    lines.append(f"{'  ' * indent}{key}:")
+                    walk(item, dotted, indent + 1)
+                else:
+                    rendered = yaml.safe_dump(thaw(item), default_flow_style=True).strip()
+                    if rendered.endswith("\n..."):
+                        rendered = rendered[:-4].strip()
+                    if rendered.endswith("..."):
+                        rendered = rendered[:-3].strip()
+                    if str(key).lower().endswith(SECRET_SUFFIXES):
+                        rendered = "'****'"
+                    lines.append(f"{'  ' * indent}{key}: {rendered}  # {self._sources.get(dotted, 'defaults')}")
+
+        walk(self._values, "", 0)
+        return "\n".join(lines)
+
+
+class ConfigLoader:
+    """
+    Loads the effective Config once per process (thread-safe).
+
+    Usage:
+        ConfigLoader.load(cli_overrides={"browser": "firefox"})   # pytest_configure
+        config = ConfigLoader.get()                                # anywhere after that
+    """
+
+    config_dir = CONFIG_DIR
+    _config = None
+    _lock = threading.Lock()
+
+    @classmethod
+    def load(cls, cli_overrides=None, environ=None, config_dir=None):
+        """
+        Builds (or rebuilds) the process-wide Config.
+
+        Args:
+            cli_overrides: {dotted key: value} from --tk-* options (strings are parsed as YAML scalars).
+            environ: Environment mapping (defaults to os.environ).
+            config_dir: Directory holding config.yaml and config.<env>.yaml.
+        """
+        environ = os.environ if environ is None else environ
+        config_dir = Path(config_dir or cls.config_dir)
+        cli_overrides = {key: value for key, value in (cli_overrides or {}).items() if value is not None}
+
+        values, sources = dict(DEFAULTS), {key: "defaults" for key in DEFAULTS}
+        values = cls._merge_layer(values, sources, cls._read_yaml(config_dir / "config.yaml"), "config.yaml")
+
+        # The env can itself be overridden, so resolve it before picking the env file
+        env = cli_overrides.get("env") or environ.get(f"{ENV_PREFIX}ENV") or values.get("env")
+        env_file = config_dir / f"config.{str(env).lower()}.yaml"
+        if env and env_file.exists():
+            values = cls._merge_layer(values, sources, cls._read_yaml(env_file), env_file.name)
+
+        for key, raw in cls._env_overrides(values, environ).items():
+            cls._set(values, sources, key, raw, f"env:{ENV_PREFIX}{key.upper().replace('.', '__')}")
+        for key, raw in cli_overrides.items():
+            cls._set(values, sources, key, raw, "cli")
+
+        if not values.get("base_url"):
+            raise ConfigError("base_url is not set (config.yaml, TRACKORA_BASE_URL or --tk-base-url)")
+        config = Config(values, sources)
+        with cls._lock:
+            cls._config = config
+        logger.debug(f"Effective configuration:\n{config.dump()}")
+        return config
+
+    @classmethod
+    def get(cls):
+        """
+        Returns the process-wide Config, loading it (without CLI overrides) on first use.
+        """
+        with cls._lock:
+            config = cls._config
+        return config if config is not None else cls.load()
+
+    @staticmethod
+    def _read_yaml(path):
+        with open(path, "r") as file:
+            return yaml.safe_load(file) or {}
+
+    @classmethod
+    def _merge_layer(cls, values, sources, layer, source):
+        for key in cls._leaf_keys(layer):
+            sources[key] = source
+        return deep_merge(values, layer)
+
+    @classmethod
+    def _leaf_keys(cls, value, path=""):
+        for key, item in value.items():
+            dotted = f"{path}.{key}" if path else str(key)
+            if isinstance(item, dict) and item:
+                yield from cls._leaf_keys(item, dotted)
+            else:
+                yield dotted
+
+    @classmethod
+    def _env_overrides(cls, values, environ):
+        """
+        Maps TRACKORA_* variables onto existing keys: TRACKORA_BROWSER -> browser,
+        TRACKORA_DRIVER_POOL__ENABLED -> driver_pool.enabled. Variables that do
+        not name a config key (e.g. TRACKORA_RUN_ID) are ignored.
+        """
+        known = {key.upper().replace(".", "__"): key for key in cls._leaf_keys(values)}
+        return {known[name[len(ENV_PREFIX):]]: raw for name, raw in environ.items()
+                if name.startswith(ENV_PREFIX) and name[len(ENV_PREFIX):] in known}
+
+    @staticmethod
+    def _set(values, sources, dotted, raw, source):
+        """
+        Sets a dotted key, parsing strings as YAML scalars and checking the type
+        against the current value (an int setting only accepts numbers, etc.).
+        Unknown top-level keys are rejected, so a typo is not silently ignored.
+        """
+        value = yaml.safe_load(raw) if isinstance(raw, str) else raw
+        section = values
+        parts = dotted.split(".")
+        if parts[0] not in values:
+            raise ConfigError(f"Unknown config key '{parts[0]}' in '{dotted}' ({source})")
+        for part in parts[:-1]:
+            if not isinstance(section.get(part), dict):
+                raise ConfigError(f"Unknown config section '{part}' in '{dotted}' ({source})")
+            section[part] = dict(section[part])  # Do not mutate a layer's dict in place
+            section = section[part]
+        current = section.get(parts[-1])
+        if isinstance(current, bool) and not isinstance(value, bool):
+            raise ConfigError(f"{dotted} expects true/false, got {raw!r} ({source})")
+        if isinstance(current, (int, float)) and not isinstance(current, bool) \
+                and (isinstance(value, bool) or not isinstance(value, (int, float))):
+            raise ConfigError(f"{dotted} expects a number, got {raw!r} ({source})")
+        if isinstance(current, str) and value is not None and not isinstance(value, str):
+            value = str(raw)  # e.g. "2025" for a string setting stays a string
+        section[parts[-1]] = value
+        sources[dotted] = source
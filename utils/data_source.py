@@ -0,0 +1,165 @@
+"""
+Streaming data-driven parametrization for Trackora automation framework.
+Drives a test from a CSV or JSONL dataset (data/datasets/) without loading the
+records at collection time: collection makes one pass over the file, keeps only
+the byte offset and id of each selected record, and the record itself is read
+when its test runs. Deterministic sampling and sharding keep large
+boundary-value datasets usable.
+"""
+
+import csv
+import io
+import json
+import logging
+import re
+import zlib
+from pathlib import Path
+from utils.test_data_store import TestDataStore
+
+logger = logging.getLogger(__name__)
+
+
+class RecordRef:
+    """
+    Pointer to one dataset record (file, byte offset, case id).
+    Cheap to create and hold for every collected test; load() reads the record.
+    """
+
+    __slots__ = ("path", "offset", "case_id", "header")
+
+    def __init__(self, path, offset, case_id, header=None):
+        self.path = path
+        self.offset = offset
+        self.case_id = case_id
+        self.header = header  # CSV column names (None for JSONL)
+
+    def load(self):
+        """
+        Returns the record as a new dict (CSV values are strings).
+        """
+        with open(self.path, "rb") as f:
+            f.seek(self.offset)
+            line = f.readline().decode("utf-8")
+        if self.header is None:
+            return json.loads(line)
+        values = next(csv.reader(io.StringIO(line)))
+        return dict(zip(self.header, values))
+
+    def __repr__(self):
+        return f"RecordRef({self.case_id!r})"
+
+
+def _bucket(seed, case_id):
+    """
+    Maps a case id to a stable number in [0, 1) (same on every machine and run).
+    """
+    return zlib.crc32(f"{seed}:{case_id}".encode("utf-8")) / 0x100000000
+
+
+class DataSource:
+    """
+    A CSV (header row + one record per line) or JSONL (one JSON object per line) dataset.
+
+    Case ids are taken from `id_field` when given, otherwise "<dataset>-<line number>",
+    so they stay stable as long as rows are only appended.
+
+    Usage:
+        refs = DataSource("project_boundaries", id_field="case").select(sample=0.01, shard=(0, 4))
+        record = refs[0].load()
+    """
+
+    _selections = {}  # (path, mtime, size, options) -> [RecordRef]; shared by tests using the same dataset
+
+    def __init__(self, name, id_field=None):
+        """
+        Args:
+            name: Dataset name in data/datasets/ (extension optional) or a file path.
+            id_field: Record field holding a stable, unique case id.
+        """
+        self.path = self._resolve(name)
+        self.name = self.path.stem
+        self.id_field = id_field
+        self.is_csv = self.path.suffix.lower() == ".csv"
+        # Pulls a simple string/number id out of a JSONL line without parsing the whole record
+        self._id_pattern = re.compile(
+            rb'"' + re.escape(id_field.encode("utf-8")) + rb'"\s*:\s*(?:"([^"\\]*)"|(-?\d+))'
+        ) if id_field else None
+
+    def select(self, sample=None, shard=None, seed=0, limit=None):
+        """
+        Streams the file once and returns RecordRefs for the selected records.
+
+        Args:
+            sample: Fraction (0-1] of records to keep, chosen by hashing the case id with seed.
+            shard: (index, count) to keep only this shard's records (hash of the case id).
+            seed: Sampling seed; the same seed always selects the same records.
+            limit: Maximum number of records to return.
+        """
+        stat = self.path.stat()
+        key = (str(self.path), stat.st_mtime_ns, stat.st_size, self.id_field, sample, shard, seed, limit)
+        if key in self._selections:
+            return self._selections[key]
+
+        refs = []
+        seen = 0
+        with open(self.path, "rb") as f:
+            header = None
+            offset = 0
+            if self.is_csv:
+                first = f.readline()
+                header = next(csv.reader(io.StringIO(first.decode("utf-8"))))
+                offset = len(first)
+            for line_number, line in enumerate(f, start=2 if self.is_csv else 1):
+                line_offset = offset
+                offset += len(line)
+                if not line.strip():
+                    continue
+                seen += 1
+                case_id = self._case_id(line, header, line_number)
+                if shard and zlib.crc32(str(case_id).encode("utf-8")) % shard[1] != shard[0]:
+                    continue
+                if sample is not None and sample < 1 and _bucket(seed, case_id) >= sample:
+                    continue
+                refs.append(RecordRef(str(self.path), line_offset, case_id, header))
+                if limit and len(refs) >= limit:
+                    break
+        logger.debug(f"Dataset {self.name}: selected {len(refs)} of {seen} records scanned")
+        self._selections[key] = refs
+        return refs
+
+    def _case_id(self, line, header, line_number):
+        if not self.id_field:
+            return f"{self.name}-{line_number}"
+        # Only the id is needed at collection time
+        if header is None:
+            match = self._id_pattern.search(line)
+            if match:
+                value = next(group for group in match.groups() if group is not None).decode("utf-8")
+            else:
+                value = json.loads(line).get(self.id_field)
+        else:
+            value = dict(zip(header, next(csv.reader(io.StringIO(line.decode("utf-8")))))).get(self.id_field)
+        return value if value not in (None, "") else f"{self.name}-{line_number}"
+
+    @staticmethod
+    def _resolve(name):
+        path = Path(name)
+        if path.suffix and path.exists():
+            return path
+        datasets_dir = TestDataStore.data_dir / "datasets"
+        for candidate in (datasets_dir / name, datasets_dir / f"{name}.jsonl", datasets_dir / f"{name}.csv"):
+            if candidate.suffix in (".jsonl", ".csv") and candidate.exists():
+                return candidate
+        raise FileNotFoundError(f"Dataset not found: {name} (looked in {datasets_dir})")
+
+
+def parse_shard(value):
+    """
+    Parses a --tk-shard value "INDEX/COUNT" (1-based index) into (index, count) for select().
+    """
+    if not value:
+        return None
+    index, count = (int(part) for part in value.split("/"))
+    if not 1 <= index <= count:
+        raise ValueError(f"Invalid shard '{value}': expected INDEX/COUNT with 1 <= INDEX <= COUNT")
+    return index - 1, count
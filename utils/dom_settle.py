@@ -0,0 +1,160 @@
+"""
+Event-driven DOM settle waits for Trackora automation framework.
+Replaces fixed time.sleep() pauses with an in-page MutationObserver plus
+animation/transition/scroll listeners that resolve as soon as the targeted
+subtree has been quiet for a short window.
+"""
+
+import logging
+import threading
+import time
+from selenium.common.exceptions import WebDriverException
+
+logger = logging.getLogger(__name__)
+
+# Async script. Arguments: root element (or null for the whole document),
+# quiet window in ms, timeout in ms, Selenium callback.
+# Infinite animations (spinner icons, pulsing badges) are ignored; their
+# removal from the DOM is still seen by the MutationObserver.
+SETTLE_SCRIPT = """
+var root = arguments[0] || document.documentElement;
+var quietMs = arguments[1];
+var timeoutMs = arguments[2];
+var done = arguments[arguments.length - 1];
+var start = performance.now();
+var last = start;
+var running = 0;
+var finished = false;
+var touch = function () { last = performance.now(); };
+var inRoot = function (e) { return e.target === document || root.contains(e.target); };
+var onStart = function (e) { if (inRoot(e)) { running++; touch(); } };
+var onEnd = function (e) { if (inRoot(e)) { running = Math.max(0, running - 1); touch(); } };
+var onScroll = function () { touch(); };
+var starts = ['animationstart', 'transitionrun'];
+var ends = ['animationend', 'animationcancel', 'transitionend', 'transitioncancel'];
+var finiteAnimationRunning = function () {
+    if (!root.getAnimations) { return false; }
+    return root.getAnimations({subtree: true}).some(function (a) {
+        var timing = a.effect && a.effect.getComputedTiming ? a.effect.getComputedTiming() : {};
+        return a.playState === 'running' && timing.iterations !== Infinity;
+    });
+};
+var observer = new MutationObserver(touch);
+observer.observe(root, {childList: true, subtree: true, attributes: true, characterData: true});
+starts.forEach(function (name) { document.addEventListener(name, onStart, true); });
+ends.forEach(function (name) { document.addEventListener(name, onEnd, true); });
+document.addEventListener('scroll', onScroll, true);
+var finish = function (settled) {
+    if (finished) { return; }
+    finished = true;
+    clearInterval(timer);
+    observer.disconnect();
+    starts.forEach(function (name) { document.removeEventListener(name, onStart, true); });
+    ends.forEach(function (name) { document.removeEventListener(name, onEnd, true); });
+    document.removeEventListener('scroll', onScroll, true);
+    done({settled: settled, elapsed_ms: performance.now() - start});
+};
+var timer = setInterval(function () {
+    var now = performance.now();
+    if (running === 0 && !finiteAnimationRunning() && now - last >= quietMs) {
+        finish(true);
+    } else if (now - start >= timeoutMs) {
+        finish(false);
+    }
+}, 16);
+"""
+
+
+class SettleStats(threading.local):
+    """
+    Accumulates how long settle waits took versus the fixed sleeps they replaced.
+    Reset at the start of each test; summarized in the report afterwards.
+    Counters are kept per thread, so threaded runs (--tk-threads) report each test separately.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        """
+        Clears the counters (called before each test).
+        """
+        with self._lock:
+            self.calls = 0
+            self.sleep_budget = 0.0
+            self.waited = 0.0
+
+    def record(self, replaced_sleep, waited):
+        """
+        Records one settle wait that replaced `replaced_sleep` seconds of fixed sleep.
+        """
+        with self._lock:
+            self.calls += 1
+            self.sleep_budget += replaced_sleep
+            self.waited += waited
+
+    def summary(self):
+        """
+        Returns a dict with calls, fixed-sleep budget, actual wait and time saved (seconds).
+        """
+        with self._lock:
+            return {
+                "calls": self.calls,
+                "sleep_budget_s": round(self.sleep_budget, 3),
+                "waited_s": round(self.waited, 3),
+                "saved_s": round(self.sleep_budget - self.waited, 3),
+            }
+
+
+class DomSettle:
+    """
+    Waits until a DOM subtree stops changing (no mutations, animations,
+    transitions or scrolling for `quiet_ms`).
+    """
+
+    quiet_ms = 100
+    timeout = 5
+    stats = SettleStats()
+
+    @classmethod
+    def configure(cls, quiet_ms=None, timeout=None):
+        """
+        Sets the default quiet window (ms) and timeout (s) from config.
+        """
+        if quiet_ms is not None:
+            cls.quiet_ms = quiet_ms
+        if timeout is not None:
+            cls.timeout = timeout
+
+    @classmethod
+    def wait(cls, driver, root=None, quiet_ms=None, timeout=None, replaces=0.0):
+        """
+        Blocks until the subtree under `root` (a WebElement, or the whole
+        document when None) has been quiet for the quiet window.
+
+        Args:
+            driver: Selenium WebDriver instance.
+            root: WebElement whose subtree is watched (optional).
+            quiet_ms: Quiet window in milliseconds (defaults to config).
+            timeout: Maximum seconds to wait (defaults to config).
+            replaces: Seconds of fixed sleep this wait replaces, for reporting.
+
+        Returns:
+            True if the DOM settled, False if the timeout was hit or the script failed.
+        """
+        quiet_ms = cls.quiet_ms if quiet_ms is None else quiet_ms
+        timeout = cls.timeout if timeout is None else timeout
+        started = time.perf_counter()
+        try:
+            result = driver.execute_async_script(SETTLE_SCRIPT, root, quiet_ms, timeout * 1000)
+            settled = bool(result and result.get("settled"))
+        except WebDriverException as e:
+            # Script could not run (e.g. page navigating); keep the old fixed pause
+            logger.debug(f"DOM settle script failed, sleeping {replaces}s instead: {e}")
+            time.sleep(replaces)
+            settled = False
+        cls.stats.record(replaces, time.perf_counter() - started)
+        if not settled:
+            logger.debug(f"DOM did not settle within {timeout}s")
+        return settled
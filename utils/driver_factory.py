@@ -0,0 +1,238 @@
+"""
+Browser factory for Trackora automation framework.
+Builds browser options from config.yaml (and the selected browser profile)
+and launches WebDriver sessions.
+"""
+
+import logging
+import time
+from urllib.parse import urlparse
+from selenium import webdriver
+from selenium.common.exceptions import SessionNotCreatedException
+from selenium.webdriver.chrome.options import Options as ChromeOptions
+from selenium.webdriver.firefox.service import Service as FirefoxService
+from selenium.webdriver.firefox.options import Options as FirefoxOptions
+from utils.helpers import TestHelpers
+from utils.alerts import AlertMonitor
+from utils.driver_service import DriverServices
+from utils.app_idle import AppIdle
+from utils.animations import AnimationControl
+from utils.resource_policy import ResourcePolicy
+from utils.asset_proxy import AssetProxy
+from utils.profile_template import ProfileTemplate
+
+logger = logging.getLogger(__name__)
+
+
+class DriverFactory:
+    """
+    Creates configured WebDriver instances.
+    Used by the driver pool and by tests that need a cold browser.
+    """
+
+    @staticmethod
+    def get_origin(base_url):
+        """
+        Returns the scheme://host[:port] origin of a URL.
+        Used for cookie/storage resets and insecure-origin flags.
+        """
+        parsed_url = urlparse(base_url)
+        return f"{parsed_url.scheme}://{parsed_url.netloc}"
+
+    @staticmethod
+    def resolve_profile(config, name=None):
+        """
+        Returns the browser profile `name` (default: config's browser_profile)
+        from config.yaml's browser_profiles, with "browser" filled in.
+        Without browser_profiles, returns the previous headed/maximized behaviour.
+        """
+        name = name or config.get("browser_profile") or "default"
+        profiles = config.get("browser_profiles", {}) or {}
+        if name not in profiles and (profiles or name != "default"):
+            raise ValueError(f"Unknown browser profile '{name}' (available: {', '.join(profiles) or 'none'})")
+        profile = dict(profiles.get(name, {}) or {})
+        profile["name"] = name
+        profile["browser"] = (profile.get("browser") or config["browser"]).lower()
+        return profile
+
+    @staticmethod
+    def build_chrome_options(config, profile=None, user_data_dir=None):
+        """
+        Builds ChromeOptions from config:
+        - Disables password manager popups and data breach warnings
+        - Ignores certificate errors for the QA origin
+        - Uses incognito when clear_cache is true, unless launched on a cloned
+          profile template (user_data_dir), which is already free of auth state
+        - Applies the browser profile (headless, window size, page load strategy, performance flags)
+        """
+        profile = profile or DriverFactory.resolve_profile(config)
+        chrome_options = ChromeOptions()
+
+        # Disable data breach warnings for passwords
+        chrome_options.add_argument("--disable-features=PasswordManager,CredentialsEnableService,PasswordStore")
+
+        chrome_options.add_argument("--ignore-certificate-errors")
+        chrome_options.add_argument("--allow-insecure-localhost")
+        chrome_options.add_argument("--ignore-ssl-errors")
+
+        origin = DriverFactory.get_origin(config["base_url"])
+        chrome_options.add_argument(f"--unsafely-treat-insecure-origin-as-secure={origin}")
+
+        # Disable Chrome password manager popups and infobars
+        prefs = {
+            "credentials_enable_service": False,
+            "profile.password_manager_enabled": False,
+            # "profile.default_content_setting_values.notifications": 2  # Optional: block notifications
+        }
+        chrome_options.add_experimental_option("prefs", prefs)
+
+        if user_data_dir:
+            # Warm clone of the run's profile template (see utils/profile_template.py)
+            chrome_options.add_argument(f"--user-data-dir={user_data_dir}")
+            chrome_options.add_argument("--no-first-run")
+            logger.info(f"Launching Chrome on profile {user_data_dir}.")
+        elif config.get("clear_cache", True):
+            chrome_options.add_argument("--incognito")
+            logger.info("Launching Chrome in incognito mode (clear_cache=true).")
+        else:
+            logger.info("Launching Chrome in normal mode (clear_cache=false).")
+
+        # --- Browser profile ---
+        if profile.get("headless"):
+            chrome_options.add_argument("--headless=new")
+        if profile.get("window_size"):
+            chrome_options.add_argument(f"--window-size={profile['window_size']}")
+        for flag, argument in (
+            ("disable_extensions", "--disable-extensions"),
+            ("disable_background_networking", "--disable-background-networking"),
+            ("disable_gpu", "--disable-gpu"),
+            ("disable_dev_shm_usage", "--disable-dev-shm-usage"),
+        ):
+            if profile.get(flag):
+                chrome_options.add_argument(argument)
+        for argument in profile.get("extra_args") or ():
+            chrome_options.add_argument(argument)
+        chrome_options.page_load_strategy = profile.get("page_load_strategy") or "normal"
+
+        # --- Resource blocking (network log for blocked-request accounting) ---
+        ResourcePolicy.enable_logging(chrome_options, config.get("resource_policy"))
+
+        # --- Asset proxy (cached static assets, see utils/asset_proxy.py) ---
+        if AssetProxy.active is not None:
+            chrome_options.add_argument(f"--proxy-server={AssetProxy.active.url}")
+            chrome_options.add_argument("--proxy-bypass-list=<-loopback>")  # Proxy localhost too
+        return chrome_options
+
+    @staticmethod
+    def build_firefox_options(config, profile=None):
+        """
+        Builds FirefoxOptions from config (private mode when clear_cache is true)
+        and the browser profile (headless, window size, page load strategy).
+        """
+        profile = profile or DriverFactory.resolve_profile(config)
+        firefox_options = FirefoxOptions()
+        if config.get("clear_cache", True):
+            firefox_options.add_argument("--private")
+            logger.info("Launching Firefox in private mode (clear_cache=true).")
+        else:
+            logger.info("Launching Firefox in normal mode (clear_cache=false).")
+        if profile.get("headless"):
+            firefox_options.add_argument("-headless")
+        if profile.get("window_size"):
+            width, height = str(profile["window_size"]).split(",")
+            firefox_options.add_argument(f"--width={width.strip()}")
+            firefox_options.add_argument(f"--height={height.strip()}")
+        for argument in profile.get("extra_args") or ():
+            firefox_options.add_argument(argument)
+        firefox_options.page_load_strategy = profile.get("page_load_strategy") or "normal"
+        # No CDP here, so the alert shim cannot run before page scripts.
+        # Leave native dialogs open for AlertMonitor's non-blocking check.
+        firefox_options.unhandled_prompt_behavior = "ignore"
+
+        # --- Asset proxy (cached static assets, see utils/asset_proxy.py) ---
+        if AssetProxy.active is not None:
+            host, port = AssetProxy.active.httpd.server_address[:2]
+            firefox_options.set_preference("network.proxy.type", 1)
+            for scheme in ("http", "ssl"):
+                firefox_options.set_preference(f"network.proxy.{scheme}", host)
+                firefox_options.set_preference(f"network.proxy.{scheme}_port", port)
+            firefox_options.set_preference("network.proxy.allow_hijacking_localhost", True)
+            firefox_options.accept_insecure_certs = True  # Proxy certificate for intercepted hosts
+        return firefox_options
+
+    @staticmethod
+    def create_driver(config, profile=None, user_data_dir=None):
+        """
+        Launches a new browser session as configured in config.yaml:
+          - Starts Chrome or Firefox with the selected browser profile
+          - Sets the profile's window size (or maximizes) and applies the implicit wait
+          - Navigates to base_url and waits for page load
+        Returns the WebDriver instance. Caller is responsible for quit().
+        The launch and first-page times are kept in driver.startup_timings.
+        Chrome runs on `user_data_dir` if given, else on a clone of the active
+        profile template (deleted after quit()), else as configured.
+        """
+        profile = profile if isinstance(profile, dict) else DriverFactory.resolve_profile(config, profile)
+        browser = profile["browser"]
+        base_url = config["base_url"]
+        started = time.perf_counter()
+        clone = None
+        if browser == "chrome" and user_data_dir is None and ProfileTemplate.active is not None:
+            clone = user_data_dir = ProfileTemplate.active.clone()
+
+        # --- Browser selection ---
+        if browser == "chrome":
+            # All sessions of this worker share one chromedriver (see utils/driver_service.py)
+            try:
+                try:
+                    driver = webdriver.Chrome(
+                        service=DriverServices.chrome_service(),
+                        options=DriverFactory.build_chrome_options(config, profile, user_data_dir)
+                    )
+                except SessionNotCreatedException as e:
+                    # Usually a cached chromedriver that no longer matches an updated Chrome
+                    logger.warning(f"Chrome session not created, re-resolving chromedriver: {e.msg}")
+                    driver = webdriver.Chrome(
+                        service=DriverServices.chrome_service(refresh=True),
+                        options=DriverFactory.build_chrome_options(config, profile, user_data_dir)
+                    )
+            except Exception:
+                if clone is not None:
+                    ProfileTemplate.active.discard(clone)
+                raise
+            if clone is not None:
+                ProfileTemplate.attach(driver, clone)
+        elif browser == "firefox":
+            # geckodriver serves one session per process, so only its path is shared
+            driver = webdriver.Firefox(
+                service=FirefoxService(executable_path=DriverServices.driver_path("firefox")),
+                options=DriverFactory.build_firefox_options(config, profile)
+            )
+        else:
+            raise ValueError(f"Browser {browser} not supported")
+        DriverServices.track(driver)
+        launched = time.perf_counter()
+
+        # --- Driver common setup ---
+        if not profile.get("window_size") and not profile.get("headless"):
+            driver.maximize_window()
+        driver.implicitly_wait(config.get("implicit_wait", 0))
+        AlertMonitor.for_driver(driver).install()
+        AppIdle.install(driver)
+        if (config.get("animations") or {}).get("suppress", False):
+            AnimationControl.install(driver)
+        ResourcePolicy.install(driver, config.get("resource_policy"))
+        driver.get(base_url)
+        logger.info(f"Navigated to {base_url}")
+        TestHelpers.wait_for_page_load(driver)
+        first_page = time.perf_counter()
+
+        driver.startup_timings = {
+            "profile": profile["name"],
+            "launch_s": round(launched - started, 3),
+            "first_page_s": round(first_page - launched, 3),
+            "total_s": round(first_page - started, 3),
+        }
+        logger.info(f"Browser profile '{profile['name']}' ready in {driver.startup_timings['total_s']}s "
+                    f"(launch {driver.startup_timings['launch_s']}s)")
+        return driver
@@ -0,0 +1,186 @@
+"""
+Worker-scoped WebDriver pool for Trackora automation framework.
+Keeps browsers alive across tests and resets their state in between,
+so each test does not pay for a full browser launch and teardown.
+"""
+
+import logging
+import threading
+from selenium.common.exceptions import WebDriverException
+from utils.driver_factory import DriverFactory
+from utils.helpers import TestHelpers
+
+logger = logging.getLogger(__name__)
+
+# Clears Web Storage and IndexedDB for the current origin.
+# Runs as an async script; the last argument is the Selenium callback.
+RESET_STORAGE_SCRIPT = """
+var done = arguments[arguments.length - 1];
+try { window.localStorage.clear(); } catch (e) {}
+try { window.sessionStorage.clear(); } catch (e) {}
+if (!window.indexedDB || !window.indexedDB.databases) { done(true); return; }
+window.indexedDB.databases().then(function (dbs) {
+    return Promise.all(dbs.map(function (db) {
+        return new Promise(function (resolve) {
+            var req = window.indexedDB.deleteDatabase(db.name);
+            req.onsuccess = req.onerror = req.onblocked = function () { resolve(); };
+        });
+    }));
+}).then(function () { done(true); }, function () { done(false); });
+"""
+
+
+class PooledDriver:
+    """
+    Book-keeping wrapper for a pooled browser.
+    Tracks how many tests the browser has served.
+    """
+
+    def __init__(self, driver):
+        self.driver = driver
+        self.tests_served = 0
+
+
+class DriverPool:
+    """
+    Pool of browsers scoped to the pytest session (one per xdist worker).
+
+    - acquire(): returns a healthy browser on the login route
+    - release(): resets cookies/storage/tabs so the next test starts clean
+    - Browsers are recycled after `recycle_after` tests or when they crash
+    """
+
+    def __init__(self, config, recycle_after=25, launcher=None):
+        """
+        Args:
+            config: Framework config (browser, base_url, waits, etc.).
+            recycle_after: Number of tests a browser serves before it is relaunched.
+            launcher: Callable returning a new browser (e.g. WarmBrowserFactory.get);
+                defaults to a synchronous DriverFactory launch.
+        """
+        self.config = config
+        self.launcher = launcher or (lambda: DriverFactory.create_driver(config))
+        self.base_url = config["base_url"]
+        self.origin = DriverFactory.get_origin(self.base_url)
+        self.recycle_after = recycle_after
+        self._idle = []
+        self._in_use = {}
+        self._lock = threading.Lock()
+        self.launched = 0
+        self.recycled = 0
+
+    def acquire(self):
+        """
+        Hands out an idle, healthy browser or launches a new one.
+        Returns the WebDriver instance.
+        """
+        while True:
+            with self._lock:
+                pooled = self._idle.pop() if self._idle else None
+            if pooled is None:
+                pooled = PooledDriver(self._launch())
+                break
+            if self.is_healthy(pooled.driver):
+                break
+            logger.warning("Pooled browser failed health check; replacing it.")
+            self._discard(pooled)
+
+        pooled.tests_served += 1
+        with self._lock:
+            self._in_use[id(pooled.driver)] = pooled
+        return pooled.driver
+
+    def release(self, driver, discard=False):
+        """
+        Returns a browser to the pool after a test.
+        The browser is quit instead when discard is True, when it reached
+        recycle_after, or when resetting its state fails.
+        """
+        with self._lock:
+            pooled = self._in_use.pop(id(driver), None)
+        if pooled is None:
+            return
+
+        if discard or pooled.tests_served >= self.recycle_after:
+            logger.info(f"Recycling browser after {pooled.tests_served} test(s).")
+            self._discard(pooled)
+            return
+
+        try:
+            self.reset_state(driver)
+        except WebDriverException as e:
+            logger.warning(f"Browser state reset failed, recycling browser: {e}")
+            self._discard(pooled)
+            return
+
+        with self._lock:
+            self._idle.append(pooled)
+
+    def reset_state(self, driver):
+        """
+        Brings a used browser back to a clean state:
+          - Closes extra tabs/windows
+          - Clears cookies, localStorage, sessionStorage and IndexedDB
+          - Restores the configured implicit wait
+          - Navigates back to the login route
+        """
+        handles = driver.window_handles
+        for handle in handles[1:]:
+            driver.switch_to.window(handle)
+            driver.close()
+        driver.switch_to.window(handles[0])
+
+        # Storage is per origin, so make sure we are on the app before clearing it
+        if not driver.current_url.startswith(self.origin):
+            driver.get(self.base_url)
+        driver.execute_async_script(RESET_STORAGE_SCRIPT)
+
+        driver.delete_all_cookies()
+        if hasattr(driver, "execute_cdp_cmd"):
+            # Chromium only: also drops cookies set for other domains (SSO, APIs)
+            driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+
+        # Undo any implicit wait a test may have set
+        driver.implicitly_wait(self.config.get("implicit_wait", 0))
+        driver.get(self.base_url)
+        TestHelpers.wait_for_page_load(driver)
+
+    def is_healthy(self, driver):
+        """
+        Checks the browser still responds to commands.
+        Returns True if healthy, False if the session crashed or hung.
+        """
+        try:
+            return driver.execute_script("return document.readyState") is not None
+        except WebDriverException:
+            return False
+
+    def shutdown(self):
+        """
+        Quits every browser owned by the pool. Called at session end.
+        """
+        with self._lock:
+            pooled_drivers = self._idle + list(self._in_use.values())
+            self._idle = []
+            self._in_use = {}
+        for pooled in pooled_drivers:
+            self._quit(pooled.driver)
+        logger.info(f"Driver pool shut down (launched={self.launched}, recycled={self.recycled}).")
+
+    def _launch(self):
+        driver = self.launcher()
+        with self._lock:
+            self.launched += 1
+        return driver
+
+    def _discard(self, pooled):
+        with self._lock:
+            self.recycled += 1
+        self._quit(pooled.driver)
+
+    @staticmethod
+    def _quit(driver):
+        try:
+            driver.quit()
+        except Exception as e:
+            logger.warning(f"Error while quitting browser: {e}")
@@ -0,0 +1,315 @@
+"""
+Driver binaries and services for Trackora automation framework.
+Resolves the chromedriver/geckodriver binary once (cached per platform),
+runs one chromedriver process per worker for all Chrome sessions, and reaps
+browser/driver processes left behind by a crashed or killed run.
+"""
+
+import json
+import logging
+import os
+import platform
+import signal
+import socket
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+from selenium.webdriver.chrome.service import Service as ChromeService
+from selenium.webdriver.common.selenium_manager import SeleniumManager
+from utils.unique_ids import UniqueIds
+
+logger = logging.getLogger(__name__)
+
+ROOT_DIR = Path(__file__).parents[1]
+DRIVER_DIR = ROOT_DIR / "driver"
+STATE_DIR = ROOT_DIR / ".trackora"
+PATH_CACHE = STATE_DIR / "driver_paths.json"
+PROCESS_DIR = STATE_DIR / "processes"
+
+DRIVER_NAMES = {"chrome": "chromedriver", "firefox": "geckodriver"}
+# Process names we are willing to kill when reaping (guards against reused PIDs)
+REAPABLE = ("chromedriver", "chrome", "chromium", "geckodriver", "firefox")
+
+
+def platform_key():
+    """
+    Returns the Chrome for Testing platform name: win64, win32, linux64, mac-arm64 or mac-x64.
+    """
+    machine = platform.machine().lower()
+    if sys.platform.startswith("win"):
+        return "win64" if machine.endswith("64") else "win32"
+    if sys.platform == "darwin":
+        return "mac-arm64" if machine in ("arm64", "aarch64") else "mac-x64"
+    return "linux64"
+
+
+def _process_alive(pid):
+    if os.name == "nt":
+        result = subprocess.run(["tasklist", "/FI", f"PID eq {pid}", "/NH"], capture_output=True, text=True)
+        return str(pid) in result.stdout
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except (PermissionError, OSError):
+        return True
+    return True
+
+
+def _process_name(pid):
+    """
+    Returns the lower-case executable name of pid ("" if unknown or gone).
+    """
+    try:
+        if os.name == "nt":
+            result = subprocess.run(["tasklist", "/FI", f"PID eq {pid}", "/FO", "CSV", "/NH"],
+                                    capture_output=True, text=True)
+            return result.stdout.split(",")[0].strip('"').lower() if str(pid) in result.stdout else ""
+        proc_comm = Path(f"/proc/{pid}/comm")
+        if proc_comm.exists():
+            return proc_comm.read_text().strip().lower()
+        result = subprocess.run(["ps", "-o", "comm=", "-p", str(pid)], capture_output=True, text=True)
+        return os.path.basename(result.stdout.strip()).lower()
+    except OSError:
+        return ""
+
+
+def _descendants(pid):
+    """
+    Returns the PIDs of every descendant of pid (POSIX; empty on Windows,
+    where taskkill /T handles the tree).
+    """
+    if os.name == "nt":
+        return []
+    children = {}
+    if Path("/proc").is_dir():
+        for entry in Path("/proc").iterdir():
+            if not entry.name.isdigit():
+                continue
+            try:
+                # Field 4 of /proc/<pid>/stat is the parent pid (after the "(comm)" field)
+                parent = int((entry / "stat").read_text().rsplit(")", 1)[1].split()[1])
+            except (OSError, IndexError, ValueError):
+                continue
+            children.setdefault(parent, []).append(int(entry.name))
+    else:
+        result = subprocess.run(["ps", "-A", "-o", "pid=,ppid="], capture_output=True, text=True)
+        for line in result.stdout.splitlines():
+            child, parent = (int(part) for part in line.split())
+            children.setdefault(parent, []).append(child)
+    found, pending = [], [pid]
+    while pending:
+        for child in children.get(pending.pop(), []):
+            found.append(child)
+            pending.append(child)
+    return found
+
+
+def _kill(pids):
+    """
+    Kills the given processes (and, on Windows, their trees) if they are still
+    running and are browser/driver processes. Returns the number killed.
+    """
+    killed = 0
+    for pid in pids:
+        name = _process_name(pid)
+        if not name or not any(part in name for part in REAPABLE):
+            continue
+        try:
+            if os.name == "nt":
+                subprocess.run(["taskkill", "/PID", str(pid), "/T", "/F"], capture_output=True)
+            else:
+                os.kill(pid, signal.SIGKILL)
+            killed += 1
+        except OSError:
+            pass
+    return killed
+
+
+class SharedChromeService(ChromeService):
+    """
+    chromedriver service shared by many Chrome sessions.
+    start() is a no-op while the process runs; stop() (called by every
+    driver.quit()) keeps it running. shutdown() really stops it.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._start_lock = threading.Lock()
+        self.process = None
+
+    def start(self):
+        with self._start_lock:
+            if self.process is not None and self.process.poll() is None:
+                return
+            if self.process is not None:
+                logger.warning("Shared chromedriver exited unexpectedly; restarting it.")
+            super().start()
+
+    def stop(self):
+        pass  # Other sessions still use this chromedriver
+
+    def shutdown(self):
+        with self._start_lock:
+            if self.process is not None:
+                super().stop()
+                self.process = None
+
+
+class DriverServices:
+    """
+    Per-process driver binary cache, shared chromedriver service and process tracking.
+
+    - driver_path(browser): resolved once per platform (config, driver/<name>-<platform>/,
+      then Selenium Manager) and cached in .trackora/driver_paths.json
+    - chrome_service(): the worker's SharedChromeService (or a new Service when sharing is off)
+    - track(driver): records browser PIDs so a later run can reap them after a crash
+    - shutdown(): stops the shared service and kills anything it left running
+    - reap_orphans(): kills processes recorded by dead runs on this host
+    """
+
+    settings = {}
+    _paths = {}
+    _shared = None
+    _pids = set()
+    _lock = threading.RLock()
+
+    @classmethod
+    def configure(cls, settings):
+        """
+        Applies the driver_service section of config.yaml.
+        """
+        cls.settings = dict(settings or {})
+
+    @classmethod
+    def driver_path(cls, browser, refresh=False):
+        """
+        Returns the driver executable for browser ("chrome" or "firefox").
+        refresh=True re-resolves it (e.g. after a browser update made the cached driver too old).
+        """
+        key = f"{browser}:{platform_key()}"
+        with cls._lock:
+            if not refresh:
+                cached = cls._paths.get(key) or cls._read_path_cache().get(key)
+                if cached and Path(cached).is_file():
+                    cls._paths[key] = cached
+                    return cached
+            path = cls._resolve(browser)
+            cls._paths[key] = path
+            cache = cls._read_path_cache()
+            cache[key] = path
+            PATH_CACHE.parent.mkdir(parents=True, exist_ok=True)
+            with open(PATH_CACHE, "w", encoding="utf-8") as f:
+                json.dump(cache, f, indent=2)
+            logger.info(f"Resolved {DRIVER_NAMES.get(browser, browser)} for {platform_key()}: {path}")
+            return path
+
+    @classmethod
+    def chrome_service(cls, refresh=False):
+        """
+        Returns the chromedriver service for a new Chrome session.
+        """
+        path = cls.driver_path("chrome", refresh)
+        if not cls.settings.get("shared", True):
+            return ChromeService(executable_path=path)
+        with cls._lock:
+            if cls._shared is None or refresh:
+                if cls._shared is not None:
+                    cls._shared.shutdown()
+                cls._shared = SharedChromeService(executable_path=path)
+            return cls._shared
+
+    @classmethod
+    def track(cls, driver):
+        """
+        Records the PIDs of the driver process and its browser processes.
+        """
+        service = getattr(driver, "service", None)
+        process = getattr(service, "process", None)
+        if process is None:
+            return
+        with cls._lock:
+            # Forget processes that already exited (their PIDs may be reused)
+            cls._pids = {pid for pid in cls._pids if _process_alive(pid)}
+            cls._pids.add(process.pid)
+            cls._pids.update(_descendants(process.pid))
+            cls._write_process_file()
+
+    @classmethod
+    def shutdown(cls):
+        """
+        Stops the shared chromedriver and kills browser/driver processes it left running.
+        """
+        with cls._lock:
+            shared, cls._shared = cls._shared, None
+            pids = set(cls._pids)
+            if shared is not None and shared.process is not None:
+                pids.update(_descendants(shared.process.pid))
+            if shared is not None:
+                shared.shutdown()
+            time.sleep(0.5)  # Let browsers exit on their own first
+            killed = _kill(pid for pid in pids if _process_alive(pid))
+            if killed:
+                logger.info(f"Killed {killed} leftover browser/driver process(es).")
+            cls._pids = set()
+            cls._process_file().unlink(missing_ok=True)
+
+    @classmethod
+    def reap_orphans(cls, process_dir=PROCESS_DIR):
+        """
+        Kills browser/driver processes recorded by runs on this host whose
+        test process is gone (crashed or killed). Returns the number killed.
+        """
+        process_dir = Path(process_dir)
+        if not process_dir.is_dir():
+            return 0
+        killed = 0
+        host = socket.gethostname()
+        for path in process_dir.glob("*.json"):
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    record = json.load(f)
+            except (OSError, ValueError):
+                continue
+            if record.get("host") != host or _process_alive(record.get("owner", 0)):
+                continue
+            killed += _kill(pid for pid in record.get("pids", []) if _process_alive(pid))
+            path.unlink(missing_ok=True)
+        if killed:
+            logger.info(f"Reaped {killed} orphaned browser/driver process(es) from earlier runs.")
+        return killed
+
+    @classmethod
+    def _resolve(cls, browser):
+        configured = cls.settings.get(f"{DRIVER_NAMES.get(browser, browser)}_path")
+        if configured:
+            if not Path(configured).is_file():
+                raise FileNotFoundError(f"Configured driver not found: {configured}")
+            return str(configured)
+        name = DRIVER_NAMES.get(browser, browser)
+        executable = f"{name}.exe" if os.name == "nt" else name
+        bundled = DRIVER_DIR / f"{name}-{platform_key()}" / executable
+        if bundled.is_file():
+            return str(bundled)
+        # Selenium Manager finds or downloads a driver matching the installed browser
+        return SeleniumManager().binary_paths(["--browser", browser])["driver_path"]
+
+    @staticmethod
+    def _read_path_cache():
+        try:
+            with open(PATH_CACHE, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    @staticmethod
+    def _process_file():
+        return PROCESS_DIR / f"{UniqueIds.prefix()}.json"
+
+    @classmethod
+    def _write_process_file(cls):
+        PROCESS_DIR.mkdir(parents=True, exist_ok=True)
+        with open(cls._process_file(), "w", encoding="utf-8") as f:
+            json.dump({"host": socket.gethostname(), "owner": os.getpid(), "pids": sorted(cls._pids)}, f)
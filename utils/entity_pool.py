@@ -0,0 +1,317 @@
+"""
+Leased pool of pre-created entities for Trackora automation framework.
+Tests that only need "some project/department/employee" lease a shared,
+read-only one instead of creating their own; tests that modify an entity get
+a fresh one from a background refill queue.
+"""
+
+import json
+import logging
+import os
+import queue
+import socket
+import threading
+import time
+from pathlib import Path
+from utils.entity_registry import EntityRegistry, _process_alive
+from utils.file_lock import FileLock
+from utils.unique_ids import UniqueIds
+
+logger = logging.getLogger(__name__)
+
+POOL_DIR = Path(__file__).parents[1] / ".trackora" / "pool"
+
+# A batch creation not published within this many seconds is taken over
+# (the creator is on another host, or hung)
+CREATION_TIMEOUT = 600
+
+
+class EntityPool:
+    """
+    Run-wide pool of read-only entities shared by all xdist workers.
+
+    - The first worker that needs a type creates `sizes[type]` entities in one batch;
+      it reserves the creation under the file lock, calls the API without holding
+      it and then publishes the entities, so other workers are never locked out
+    - lease()/release(): exclusive leases coordinated through a file lock, so
+      two tests never hold the same entity at the same time
+    - fresh(): a new, mutable entity from a per-worker queue that a background
+      thread keeps topped up (these are cleaned up by the EntityRegistry)
+    - The pooled entities are deleted once every worker of the run has finished
+      (PYTEST_XDIST_WORKER_COUNT, or 1 without xdist), not when the first
+      workers detach before late ones attach. Workers that never used the pool
+      report with finish_unattached().
+
+    Pool state (<run id>.json, guarded by <run id>.lock):
+      {"workers": n, "finished": [holder, ...], "started": ts, "entities": {type: [entity, ...]},
+       "creating": {type: {"host", "pid", "since"}}, "leases": {"type:id": holder}}
+    """
+
+    attached = False  # This process attached to the pool (it reports in detach())
+
+    def __init__(self, seeder, sizes=None, refill=None, lease_timeout=30, pool_dir=POOL_DIR):
+        """
+        Args:
+            seeder: DataSeeder used to create entities.
+            sizes: {entity_type: number of read-only entities to pre-create}.
+            refill: {entity_type: number of fresh entities kept ready per worker}.
+            lease_timeout: Seconds to wait for a free entity before failing.
+            pool_dir: Directory for the shared state and lock files.
+        """
+        self.seeder = seeder
+        self.sizes = sizes or {}
+        self.refill = refill or {}
+        self.lease_timeout = lease_timeout
+        self.pool_dir = Path(pool_dir)
+        run_id = UniqueIds.run_id()
+        self.state_path = self.pool_dir / f"{run_id}.json"
+        self.lock = FileLock(self.pool_dir / f"{run_id}.lock", timeout=lease_timeout)
+        self.holder = f"{os.environ.get('PYTEST_XDIST_WORKER', 'main')}:{os.getpid()}"
+        self._queues = {entity_type: queue.Queue(maxsize=count)
+                        for entity_type, count in self.refill.items() if count}
+        self._stop = threading.Event()
+        self._refiller = None
+
+    # ---------------- Lifecycle ----------------
+
+    def attach(self):
+        """
+        Registers this worker with the shared pool and starts the refill thread. Returns self.
+        """
+        with self.lock:
+            state = self._load()
+            state["workers"] = state.get("workers", 0) + 1
+            self._save(state)
+        EntityPool.attached = True
+        if self._queues:
+            self._refiller = threading.Thread(target=self._refill_loop, name="entity-pool-refill", daemon=True)
+            self._refiller.start()
+        return self
+
+    def detach(self):
+        """
+        Stops the refill thread and unregisters this worker. The last worker
+        of the run to finish deletes the pooled read-only entities and the state file.
+        Unused fresh entities are left to the EntityRegistry cleanup.
+        """
+        self._stop.set()
+        if self._refiller:
+            self._refiller.join(timeout=5)
+        with self.lock:
+            state = self._load()
+            state["workers"] = max(0, state.get("workers", 1) - 1)
+            # Drop leases this worker still holds (e.g. after an interrupted test)
+            state["leases"] = {key: holder for key, holder in state.get("leases", {}).items()
+                               if holder != self.holder}
+            self._finish(state, self.seeder.backend)
+
+    @classmethod
+    def finish_unattached(cls, backend, pool_dir=POOL_DIR):
+        """
+        Reports a worker that never attached to the pool as finished, so the
+        last worker of the run still deletes the pool others created.
+
+        Args:
+            backend: SeedBackend, or a callable returning one; only called when
+                this worker is the last one and pooled entities are left.
+                None drops the pool without deleting (entities of a stopped stub API).
+        """
+        if cls.attached:
+            return
+        pool = cls(seeder=None, pool_dir=pool_dir)
+        with pool.lock:
+            pool._finish(pool._load(), backend)
+
+    @staticmethod
+    def expected_workers():
+        """
+        Returns the number of worker processes sharing this run's pool.
+        """
+        return int(os.environ.get("PYTEST_XDIST_WORKER_COUNT", "1") or 1)
+
+    def _finish(self, state, backend):
+        """
+        Records this worker as finished (lock held) and, once every worker of
+        the run has finished and none is attached, deletes the pooled entities.
+        """
+        finished = state.setdefault("finished", [])
+        if self.holder not in finished:
+            finished.append(self.holder)
+        if state.get("workers", 0) or len(finished) < self.expected_workers():
+            self._save(state)
+            return
+        entries = [{"type": entity_type, "id": entity["id"], "name": None}
+                   for entity_type, entities in state.get("entities", {}).items()
+                   for entity in entities]
+        if entries and backend is None:
+            logger.debug(f"Entity pool: dropping {len(entries)} pooled entities without an API to delete them")
+        elif entries:
+            if callable(backend):
+                backend = backend()
+            deleted, remaining = EntityRegistry.purge(backend, entries)
+            logger.info(f"Entity pool: deleted {deleted} pooled entities")
+            if remaining:
+                logger.warning(f"Entity pool: {len(remaining)} pooled entities could not be deleted")
+        self.state_path.unlink(missing_ok=True)
+
+    @classmethod
+    def recover(cls, backend, pool_dir=POOL_DIR, stale_after_hours=12):
+        """
+        Deletes pooled entities left by runs that were killed before the last
+        worker detached (state files older than stale_after_hours).
+        Returns the number of entities deleted.
+        """
+        pool_dir = Path(pool_dir)
+        if not pool_dir.is_dir():
+            return 0
+        deleted = 0
+        for path in pool_dir.glob("*.json"):
+            if time.time() - path.stat().st_mtime < stale_after_hours * 3600:
+                continue
+            with FileLock(path.with_suffix(".lock"), timeout=5):
+                try:
+                    with open(path, "r", encoding="utf-8") as f:
+                        state = json.load(f)
+                except (FileNotFoundError, ValueError):
+                    continue
+                entries = [{"type": entity_type, "id": entity["id"], "name": None}
+                           for entity_type, entities in state.get("entities", {}).items()
+                           for entity in entities]
+                count, remaining = EntityRegistry.purge(backend, entries)
+                deleted += count
+                if not remaining:
+                    path.unlink(missing_ok=True)
+                    path.with_suffix(".lock").unlink(missing_ok=True)
+            logger.info(f"Recovered entity pool {path.name}: deleted {count} leftover entities")
+        return deleted
+
+    # ---------------- Read-only leases ----------------
+
+    def lease(self, entity_type):
+        """
+        Leases an unused read-only entity of entity_type, creating the pool on first use.
+        Waits up to lease_timeout seconds when every entity is leased (plus the
+        time another worker spends creating the pool).
+        Returns the entity dict; treat it as read-only and release() it afterwards.
+        """
+        deadline = time.monotonic() + self.lease_timeout
+        while True:
+            create = False
+            with self.lock:
+                state = self._load()
+                entities = state.setdefault("entities", {})
+                creating = state.setdefault("creating", {})
+                if entity_type in entities:
+                    leases = state.setdefault("leases", {})
+                    for entity in entities[entity_type]:
+                        key = f"{entity_type}:{entity['id']}"
+                        if key not in leases:
+                            leases[key] = self.holder
+                            self._save(state)
+                            return entity
+                elif self._creator_gone(creating.get(entity_type)):
+                    creating[entity_type] = {"host": socket.gethostname(), "pid": os.getpid(), "since": time.time()}
+                    self._save(state)
+                    create = True
+                else:
+                    # Another worker is creating the pool; its API time does not count
+                    deadline = time.monotonic() + self.lease_timeout
+            if create:
+                self._create_pooled(entity_type)
+                continue
+            if time.monotonic() >= deadline:
+                raise TimeoutError(f"No free pooled {entity_type} within {self.lease_timeout}s")
+            time.sleep(0.2)
+
+    def _create_pooled(self, entity_type):
+        """
+        Creates the pooled entities of entity_type without holding the lock,
+        then publishes them (or withdraws the reservation if creation failed).
+        """
+        count = self.sizes.get(entity_type, 1)
+        try:
+            # Created untracked: the pool, not one worker's registry, owns these
+            payloads = [self.seeder.payload(entity_type) for _ in range(count)]
+            created = self.seeder.backend.create_many(entity_type, payloads)
+        except BaseException:
+            with self.lock:
+                state = self._load()
+                state.setdefault("creating", {}).pop(entity_type, None)
+                self._save(state)
+            raise
+        with self.lock:
+            state = self._load()
+            state.setdefault("creating", {}).pop(entity_type, None)
+            state.setdefault("entities", {})[entity_type] = created
+            self._save(state)
+        logger.info(f"Entity pool: created {count} {entity_type}(s)")
+
+    @staticmethod
+    def _creator_gone(reservation):
+        """
+        Returns True when nobody is creating the pool: no reservation, or one
+        whose process died (same host) or that was never published.
+        """
+        if not reservation:
+            return True
+        if reservation.get("host") == socket.gethostname() and not _process_alive(reservation.get("pid", 0)):
+            return True
+        return time.time() - reservation.get("since", 0) >= CREATION_TIMEOUT
+
+    def release(self, entity_type, entity):
+        """
+        Returns a leased entity to the pool.
+        """
+        with self.lock:
+            state = self._load()
+            state.get("leases", {}).pop(f"{entity_type}:{entity['id']}", None)
+            self._save(state)
+
+    # ---------------- Fresh (mutable) entities ----------------
+
+    def fresh(self, entity_type, timeout=30):
+        """
+        Returns a new entity the test may modify or delete.
+        Taken from the refill queue when one is configured, otherwise created now.
+        """
+        fresh_queue = self._queues.get(entity_type)
+        if fresh_queue is not None:
+            try:
+                return fresh_queue.get(timeout=timeout)
+            except queue.Empty:
+                logger.warning(f"Entity pool: refill queue for {entity_type} is empty; creating one now")
+        return self.seeder.create(entity_type)
+
+    def _refill_loop(self):
+        while not self._stop.is_set():
+            idle = True
+            for entity_type, fresh_queue in self._queues.items():
+                if fresh_queue.full():
+                    continue
+                idle = False
+                try:
+                    fresh_queue.put(self.seeder.create(entity_type), timeout=1)
+                except queue.Full:
+                    pass
+                except Exception as e:
+                    logger.warning(f"Entity pool: refilling {entity_type} failed: {e}")
+                    self._stop.wait(5)
+            if idle:
+                self._stop.wait(0.5)
+
+    # ---------------- State file ----------------
+
+    def _load(self):
+        try:
+            with open(self.state_path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (FileNotFoundError, ValueError):
+            return {"workers": 0, "finished": [], "started": time.time(), "entities": {}, "creating": {},
+                    "leases": {}}
+
+    def _save(self, state):
+        self.pool_dir.mkdir(parents=True, exist_ok=True)
+        temp_path = self.state_path.with_suffix(f".tmp-{os.getpid()}")
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(state, f)
+        os.replace(temp_path, self.state_path)
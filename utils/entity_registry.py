@@ -0,0 +1,276 @@
+"""
+Registry of entities created by tests, for Trackora automation framework.
+Every department/project/employee a test creates (through the API or the
+Add* modals) is appended to a per-worker journal file. At session end the
+worker deletes them in batched, concurrent API calls; journals left behind by
+a killed run are picked up and cleaned by a later run.
+"""
+
+import json
+import logging
+import os
+import socket
+import threading
+import time
+from pathlib import Path
+from utils.unique_ids import UniqueIds
+
+logger = logging.getLogger(__name__)
+
+JOURNAL_DIR = Path(__file__).parents[1] / ".trackora" / "journals"
+
+
+def _process_alive(pid):
+    if os.name == "nt":
+        return True  # os.kill(pid, 0) would terminate the process on Windows; rely on age
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except (PermissionError, OSError):
+        return True  # Exists but owned by someone else (or cannot tell)
+    return True
+
+
+class EntityRegistry:
+    """
+    Crash-safe record of created entities for one worker process.
+
+    Journal format (JSONL, appended and fsynced per entry):
+      {"event": "open", "host", "pid", "worker", "started"}
+      {"event": "created", "type", "id", "name", "worker", "test"}
+      {"event": "deleted", "type", "id", "name"}
+
+    Usage:
+        EntityRegistry.record_created("department", name=data["name"])
+    """
+
+    active = None  # Registry of the running session (set by conftest)
+
+    def __init__(self, journal_dir=JOURNAL_DIR):
+        self.journal_dir = Path(journal_dir)
+        self.worker = os.environ.get("PYTEST_XDIST_WORKER", "main")
+        self.path = self.journal_dir / f"{UniqueIds.prefix()}.jsonl"
+        self._context = threading.local()  # current_test is per thread (--tk-threads)
+        self._entries = []
+        self._lock = threading.Lock()
+        self._file = None
+
+    @property
+    def current_test(self):
+        """
+        Node id of the test running on the calling thread (None outside tests).
+        """
+        return getattr(self._context, "test", None)
+
+    @current_test.setter
+    def current_test(self, nodeid):
+        self._context.test = nodeid
+
+    @classmethod
+    def record_created(cls, entity_type, entity_id=None, name=None):
+        """
+        Records an entity in the active registry (no-op outside a session).
+        """
+        if cls.active is not None:
+            cls.active.record(entity_type, entity_id, name)
+
+    def open(self):
+        """
+        Creates the journal file for this worker. Returns self.
+        """
+        self.journal_dir.mkdir(parents=True, exist_ok=True)
+        self._file = open(self.path, "a", encoding="utf-8")
+        self._write({"event": "open", "host": socket.gethostname(), "pid": os.getpid(),
+                     "worker": self.worker, "started": time.time()})
+        return self
+
+    @property
+    def closed(self):
+        """
+        True once the journal is closed (cleanup ran, or the registry was never opened).
+        """
+        return self._file is None
+
+    def record(self, entity_type, entity_id=None, name=None):
+        """
+        Appends a created entity (by id, or by its name/email when created through the UI).
+        """
+        entry = {"event": "created", "type": entity_type, "id": entity_id, "name": name,
+                 "worker": self.worker, "test": self.current_test}
+        with self._lock:
+            self._entries.append(entry)
+            self._write(entry)
+
+    def pending(self):
+        """
+        Returns the created entries that have not been deleted yet.
+        """
+        with self._lock:
+            return list(self._entries)
+
+    def cleanup(self, backend, batch_size=50):
+        """
+        Deletes every recorded entity through `backend` (see EntityRegistry.purge)
+        and removes the journal when nothing is left.
+        Returns the number of entities deleted.
+        """
+        deleted, remaining = self.purge(backend, self.pending(), batch_size, self._write)
+        with self._lock:
+            self._entries = remaining
+        if not remaining:
+            self.close(remove=True)
+        else:
+            logger.warning(f"{len(remaining)} entities could not be cleaned up; kept in {self.path}")
+            self.close()
+        return deleted
+
+    def close(self, remove=False):
+        """
+        Closes the journal, deleting the file when remove is True.
+        """
+        with self._lock:
+            if self._file:
+                self._file.close()
+                self._file = None
+        if remove:
+            self.path.unlink(missing_ok=True)
+
+    @staticmethod
+    def purge(backend, entries, batch_size=50, journal=None):
+        """
+        Deletes entries grouped by type, in batches of batch_size; within a batch
+        the backend runs the deletes concurrently (or as one bulk call).
+        Entries without an id are resolved by name through backend.find_ids().
+
+        Returns:
+            (number deleted, entries that could not be deleted).
+        """
+        deleted = 0
+        remaining = []
+        by_type = {}
+        for entry in entries:
+            by_type.setdefault(entry["type"], []).append(entry)
+
+        for entity_type, typed_entries in by_type.items():
+            unresolved = [entry["name"] for entry in typed_entries if entry["id"] is None and entry["name"]]
+            ids_by_name = backend.find_ids(entity_type, unresolved) if unresolved else {}
+            targets = []
+            for entry in typed_entries:
+                entity_id = entry["id"] if entry["id"] is not None else ids_by_name.get(entry["name"])
+                if entity_id is None:
+                    # Never created (e.g. the form was rejected) or already gone
+                    continue
+                targets.append((entity_id, entry))
+
+            for start in range(0, len(targets), batch_size):
+                batch = targets[start:start + batch_size]
+                try:
+                    backend.delete_many(entity_type, [entity_id for entity_id, _ in batch])
+                except Exception as e:
+                    logger.warning(f"Cleanup of {len(batch)} {entity_type}(s) failed: {e}")
+                    remaining.extend(entry for _, entry in batch)
+                    continue
+                deleted += len(batch)
+                if journal:
+                    for entity_id, entry in batch:
+                        journal({"event": "deleted", "type": entity_type, "id": entity_id, "name": entry["name"]})
+        return deleted, remaining
+
+    @classmethod
+    def recover(cls, backend, journal_dir=JOURNAL_DIR, stale_after_hours=12, batch_size=50):
+        """
+        Cleans up journals left by runs that were killed before their cleanup:
+        same-host journals whose process is gone, or any journal older than
+        stale_after_hours. Each journal is claimed by an atomic rename
+        (<worker>.claimed-<host>-<pid>), so concurrent workers never process the
+        same one; claims whose process died (same host) or that are older than
+        stale_after_hours are taken over.
+
+        Args:
+            backend: SeedBackend, or a callable returning one; only called when
+                a journal actually needs cleaning (no API access otherwise).
+
+        Returns:
+            Number of entities deleted.
+        """
+        journal_dir = Path(journal_dir)
+        if not journal_dir.is_dir():
+            return 0
+        deleted = 0
+        for path in sorted(journal_dir.glob("*.jsonl")) + sorted(journal_dir.glob("*.claimed-*")):
+            header, entries = cls._read_journal(path)
+            if header is None or not cls._abandoned(path, header, stale_after_hours):
+                continue
+            journal = journal_dir / f"{path.name.split('.claimed-')[0].removesuffix('.jsonl')}.jsonl"
+            claimed = journal_dir / f"{journal.stem}.claimed-{socket.gethostname()}-{os.getpid()}"
+            try:
+                os.rename(path, claimed)
+                os.utime(claimed)  # Claim time, for taking over claims of dead hosts
+            except OSError:
+                continue  # Another worker claimed it first
+            if callable(backend):
+                backend = backend()
+            count, remaining = cls.purge(backend, entries, batch_size)
+            deleted += count
+            if remaining:
+                logger.warning(f"{len(remaining)} entities from {journal.name} could not be cleaned up")
+                os.rename(claimed, journal)
+            else:
+                claimed.unlink(missing_ok=True)
+            logger.info(f"Recovered journal {journal.name}: deleted {count} leftover entities")
+        return deleted
+
+    @staticmethod
+    def _abandoned(path, header, stale_after_hours):
+        """
+        Returns True for a journal (or claimed journal) whose writer (or claimer) is gone.
+        """
+        host = socket.gethostname()
+        if path.suffix == ".jsonl":
+            owner_host, owner_pid = header.get("host"), header.get("pid", 0)
+            age_hours = (time.time() - header.get("started", 0)) / 3600
+        else:
+            owner_host, _, owner_pid = path.name.split(".claimed-", 1)[1].rpartition("-")
+            try:
+                owner_pid = int(owner_pid)
+                age_hours = (time.time() - path.stat().st_mtime) / 3600
+            except (ValueError, OSError):
+                return False
+        if owner_host == host and owner_pid == os.getpid():
+            return False
+        return (owner_host == host and not _process_alive(owner_pid)) or age_hours >= stale_after_hours
+
+    @staticmethod
+    def _read_journal(path):
+        """
+        Returns (open header, created entries not yet deleted) from a journal.
+        A truncated last line (process killed mid-write) is ignored.
+        """
+        header = None
+        created = {}
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        continue
+                    key = (entry.get("type"), entry.get("id"), entry.get("name"))
+                    if entry.get("event") == "open":
+                        header = entry
+                    elif entry.get("event") == "created":
+                        created[key] = entry
+                    elif entry.get("event") == "deleted":
+                        created.pop(key, None)
+                        created.pop((entry.get("type"), None, entry.get("name")), None)
+        except OSError:
+            return None, []
+        return header, list(created.values())
+
+    def _write(self, entry):
+        if self._file is None:
+            return
+        self._file.write(json.dumps(entry) + "\n")
+        self._file.flush()
+        os.fsync(self._file.fileno())  # Survive a killed run
@@ -0,0 +1,73 @@
+"""
+Cross-process file lock for Trackora automation framework.
+Coordinates xdist workers (separate processes) that share files on disk,
+using fcntl on POSIX and msvcrt on Windows.
+"""
+
+import os
+import time
+from pathlib import Path
+
+if os.name == "nt":
+    import msvcrt
+else:
+    import fcntl
+
+
+class FileLock:
+    """
+    Exclusive lock on a lock file, held for the duration of a `with` block.
+
+    Usage:
+        with FileLock(".trackora/pool/run.lock", timeout=30):
+            ...  # only one worker at a time
+    """
+
+    def __init__(self, path, timeout=60, poll_interval=0.05):
+        """
+        Args:
+            path: Lock file path (created if missing).
+            timeout: Seconds to wait for the lock before raising TimeoutError.
+            poll_interval: Seconds between attempts.
+        """
+        self.path = Path(path)
+        self.timeout = timeout
+        self.poll_interval = poll_interval
+        self._fd = None
+
+    def acquire(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+        deadline = time.monotonic() + self.timeout
+        while True:
+            try:
+                if os.name == "nt":
+                    msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+                else:
+                    fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                self._fd = fd
+                return self
+            except OSError:
+                if time.monotonic() >= deadline:
+                    os.close(fd)
+                    raise TimeoutError(f"Could not lock {self.path} within {self.timeout}s")
+                time.sleep(self.poll_interval)
+
+    def release(self):
+        if self._fd is None:
+            return
+        try:
+            if os.name == "nt":
+                os.lseek(self._fd, 0, os.SEEK_SET)
+                msvcrt.locking(self._fd, msvcrt.LK_UNLCK, 1)
+            else:
+                fcntl.flock(self._fd, fcntl.LOCK_UN)
+        finally:
+            os.close(self._fd)
+            self._fd = None
+
+    def __enter__(self):
+        return self.acquire()
+
+    def __exit__(self, *exc):
+        self.release()
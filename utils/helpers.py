@@ -3,14 +3,15 @@ Helper utilities for Trackora automation framework.
 Contains common functions used across multiple test files.
 """
 
-import json
-import time
 import os
-from pathlib import Path
-from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.common.by import By
-from selenium.common.exceptions import TimeoutException, NoSuchElementException, WebDriverException
+from selenium.common.exceptions import TimeoutException, WebDriverException
+from utils.dom_settle import DomSettle
+from utils.app_idle import AppIdle
+from utils.animations import AnimationControl, InteractionTimings
+from utils.wait_policy import WaitPolicy
+from utils.test_data_store import TestDataStore
+from utils.unique_ids import UniqueIds
 
 class TestHelpers:
     """Common helper methods for tests and page objects."""
@@ -18,13 +19,12 @@ class TestHelpers:
     @staticmethod
     def load_test_data():
         """
-        Loads JSON test data file for fixture and test usage.
+        Returns the test data (data/testdata.json plus env/profile overlays).
         Provides user credentials, mock data, etc.
-        Returns a parsed Python dictionary.
+        Parsed once per process (re-read when the file changes) and returned as a
+        read-only view; use .copy() or thaw() from utils.test_data_store to modify.
         """
-        data_path = Path(__file__).parents[1] / "data" / "testdata.json"
-        with open(data_path, "r") as f:
-            return json.load(f)
+        return TestDataStore.get()
 
     @staticmethod
     def get_user_credentials(user_type="admin"):
@@ -32,8 +32,8 @@ class TestHelpers:
         Get user credentials (username/password) for the specified user type.
         Default is 'admin'. If not found, uses 'admin' credentials as fallback.
         """
-        test_data = TestHelpers.load_test_data()
-        return test_data["users"].get(user_type, test_data["users"]["admin"])
+        users = TestDataStore.section("users")
+        return users.get(user_type, users["admin"])
 
     @staticmethod
     def wait_for_element(driver, locator, timeout=10):
@@ -42,8 +42,8 @@ class TestHelpers:
         Returns the WebElement found. Raises TimeoutException if not found.
         """
         try:
-            element = WebDriverWait(driver, timeout).until(
-                EC.visibility_of_element_located(locator)
+            element = WaitPolicy(driver).until(
+                EC.visibility_of_element_located(locator), timeout, "visible", locator
             )
             return element
         except TimeoutException:
@@ -52,15 +52,21 @@ class TestHelpers:
     @staticmethod
     def wait_for_loading_overlay_to_disappear(driver, timeout=10):
         """
-        Waits until any loading spinner/overlay (class '.ant-spin') disappears.
-        If no spinner present or times out, proceeds without error.
+        Waits until the app has finished loading (see wait_until_idle), which also
+        covers '.ant-spin' spinners/overlays: they are shown while requests are in flight.
+        If the app does not go idle in time, proceeds without error.
         """
-        try:
-            WebDriverWait(driver, timeout).until(
-                EC.invisibility_of_element_located((By.CSS_SELECTOR, ".ant-spin"))
-            )
-        except TimeoutException:
-            pass
+        TestHelpers.wait_until_idle(driver, timeout)
+
+    @staticmethod
+    def wait_until_idle(driver, timeout=None):
+        """
+        Waits until no fetch/XHR request, short timer or animation has been pending
+        for a quiet window (config: app_idle), using counters injected into every document.
+        Call after actions that load data: filters, submits, navigation.
+        Returns True if idle, False on timeout (never raises).
+        """
+        return AppIdle.wait(driver, timeout)
 
     @staticmethod
     def wait_for_element_clickable(driver, locator, timeout=10):
@@ -69,8 +75,8 @@ class TestHelpers:
         Returns the WebElement found. Raises TimeoutException if not clickable.
         """
         try:
-            element = WebDriverWait(driver, timeout).until(
-                EC.element_to_be_clickable(locator)
+            element = WaitPolicy(driver).until(
+                EC.element_to_be_clickable(locator), timeout, "clickable", locator
             )
             return element
         except TimeoutException:
@@ -119,11 +125,7 @@ class TestHelpers:
         Returns True if found, False otherwise.
         Use for table rows, controls, or pre-click checks.
         """
-        try:
-            driver.find_element(*locator)
-            return True
-        except NoSuchElementException:
-            return False
+        return WaitPolicy(driver).is_present(locator)
 
     @staticmethod
     def select_dropdown_by_text(driver, dropdown_locator, option_text, timeout=10):
@@ -160,44 +162,39 @@ class TestHelpers:
         """
 
         # Wait for any loading overlays to disappear
-        try:
-            WebDriverWait(driver, timeout).until(
-                EC.invisibility_of_element_located((By.CSS_SELECTOR, ".ant-spin"))
-            )
-        except TimeoutException:
-            pass
+        TestHelpers.wait_for_loading_overlay_to_disappear(driver, timeout)
 
-        # Scroll to dropdown and wait until clickable
-        TestHelpers.scroll_to_element(driver, dropdown_locator)
-        dropdown_element = WebDriverWait(driver, timeout).until(
-            EC.element_to_be_clickable(dropdown_locator)
-        )
-        # Try normal click, fallback to JS click if intercepted
-        try:
-            dropdown_element.click()
-        except Exception:
-            driver.execute_script("arguments[0].click();", dropdown_element)
-        # Wait for UI animation/overlays (can be tuned)
-        time.sleep(0.5)
-        # Scroll and select desired option
-        TestHelpers.scroll_to_element(driver, option_locator)
-        option_element = WebDriverWait(driver, timeout).until(
-            EC.element_to_be_clickable(option_locator)
-        )
-        try:
-            option_element.click()
-        except Exception:
-            driver.execute_script("arguments[0].click();", option_element)
+        with InteractionTimings.measure("dropdown", driver):
+            # Scroll to dropdown and wait until clickable
+            TestHelpers.scroll_to_element(driver, dropdown_locator)
+            dropdown_element = TestHelpers.wait_for_element_clickable(driver, dropdown_locator, timeout)
+            # Try normal click, fallback to JS click if intercepted
+            try:
+                dropdown_element.click()
+            except Exception:
+                driver.execute_script("arguments[0].click();", dropdown_element)
+            # Wait for the dropdown open animation/overlay to finish rendering
+            WaitHelpers.wait_for_animation(driver, replaces=0.5)
+            # Scroll and select desired option
+            TestHelpers.scroll_to_element(driver, option_locator)
+            option_element = TestHelpers.wait_for_element_clickable(driver, option_locator, timeout)
+            try:
+                option_element.click()
+            except Exception:
+                driver.execute_script("arguments[0].click();", option_element)
 
     @staticmethod
-    def scroll_to_element(driver, locator):
+    def scroll_to_element(driver, locator, timeout=10):
         """
         Scrolls the browser viewport so that the targeted element is visible.
         Especially useful for elements that are off-screen due to long pages.
         """
-        element = driver.find_element(*locator)
-        driver.execute_script("arguments[0].scrollIntoView(true);", element)
-        time.sleep(1)  # Allow time for scroll/animation
+        with InteractionTimings.measure("scroll", driver):
+            element = WaitPolicy(driver).until(
+                EC.presence_of_element_located(locator), timeout, "present", locator
+            )
+            driver.execute_script("arguments[0].scrollIntoView(true);", element)
+            WaitHelpers.wait_for_animation(driver, replaces=1)  # Wait for scroll/animation to finish
 
     @staticmethod
     def wait_for_page_load(driver, timeout=30):
@@ -206,10 +203,32 @@ class TestHelpers:
         Ensures whole page has loaded before proceeding.
         Helpful after navigation, login, or page redirects.
         """
-        WebDriverWait(driver, timeout).until(
-            lambda driver: driver.execute_script("return document.readyState") == "complete"
+        WaitPolicy(driver).until(
+            lambda driver: driver.execute_script("return document.readyState") == "complete",
+            timeout, "page_load"
         )
 
+    @staticmethod
+    def add_init_script(driver, script):
+        """
+        Runs a JavaScript snippet in the current document and, on Chromium,
+        registers it (CDP Page.addScriptToEvaluateOnNewDocument) for every
+        document loaded afterwards, before any page script runs.
+        Returns True if registered for new documents, False if only applied now.
+        """
+        registered = False
+        if hasattr(driver, "execute_cdp_cmd"):
+            try:
+                driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {"source": script})
+                registered = True
+            except WebDriverException:
+                pass
+        try:
+            driver.execute_script(script)
+        except WebDriverException:
+            pass
+        return registered
+
 
 class DataHelpers:
     """
@@ -222,8 +241,7 @@ class DataHelpers:
         Returns department section test data from loaded testdata.json.
         Used to automate department add/edit/delete flows.
         """
-        test_data = TestHelpers.load_test_data()
-        return test_data["test_data"]["departments"]
+        return TestDataStore.section("test_data", "departments")
 
     @staticmethod
     def get_employee_test_data():
@@ -231,8 +249,7 @@ class DataHelpers:
         Returns employee section test data from loaded testdata.json.
         Used to automate employee add/edit/delete flows.
         """
-        test_data = TestHelpers.load_test_data()
-        return test_data["test_data"]["employees"]
+        return TestDataStore.section("test_data", "employees")
 
     @staticmethod
     def get_project_test_data():
@@ -240,27 +257,30 @@ class DataHelpers:
         Returns project section test data from loaded testdata.json.
         Used to automate project add/edit/delete flows.
         """
-        test_data = TestHelpers.load_test_data()
-        return test_data["test_data"]["projects"]
+        return TestDataStore.section("test_data", "projects")
 
     @staticmethod
     def generate_unique_name(base_name):
         """
-        Generates a unique name for test entities, appending a timestamp to avoid collisions.
-        Used for department/project/employee test data.
+        Generates a unique name for test entities, appending a run/worker-scoped unique ID.
+        Used for department/project/employee test data; safe across xdist workers and hosts.
         """
-        timestamp = int(time.time())
-        return f"{base_name}_{timestamp}"
+        return UniqueIds.name(base_name)
 
     @staticmethod
     def generate_unique_email(base_email):
         """
-        Generates a unique email address from a base email, using a timestamp.
-        Prevents duplicate user entries during repeated tests.
+        Generates a unique email address from a base email, using a run/worker-scoped unique ID.
+        Prevents duplicate user entries during repeated and parallel tests.
+        """
+        return UniqueIds.email(base_email)
+
+    @staticmethod
+    def generate_unique_names(base_name, count):
+        """
+        Generates `count` unique names at once (for data factories / bulk seeding).
         """
-        timestamp = int(time.time())
-        username, domain = base_email.split("@")
-        return f"{username}_{timestamp}@{domain}"
+        return UniqueIds.bulk(base_name, count)
 
 
 class WaitHelpers:
@@ -274,9 +294,11 @@ class WaitHelpers:
         Waits until the modal element is visible in the DOM (shown to user).
         Use before interacting with modal dialogs.
         """
-        return WebDriverWait(driver, timeout).until(
-            EC.visibility_of_element_located(modal_locator)
-        )
+        with InteractionTimings.measure("modal_open", driver):
+            return WaitPolicy(driver).until(
+                EC.visibility_of_element_located(modal_locator), timeout, "modal_visible", modal_locator,
+                poll=WaitHelpers.animation_poll(driver)
+            )
 
     @staticmethod
     def wait_for_modal_to_disappear(driver, modal_locator, timeout=10):
@@ -284,6 +306,43 @@ class WaitHelpers:
         Waits until the modal element is no longer visible in the DOM (closed/hidden).
         Use after submitting or canceling modal dialogs.
         """
-        return WebDriverWait(driver, timeout).until(
-            EC.invisibility_of_element_located(modal_locator)
-        )
+        with InteractionTimings.measure("modal_close", driver):
+            return WaitPolicy(driver).until(
+                EC.invisibility_of_element_located(modal_locator), timeout, "modal_invisible", modal_locator,
+                poll=WaitHelpers.animation_poll(driver)
+            )
+
+    @staticmethod
+    def wait_for_dom_to_settle(driver, locator=None, quiet_ms=None, timeout=None, replaces=0.0):
+        """
+        Waits until the DOM (or the subtree of `locator`) has had no mutations,
+        animations, transitions or scrolling for a quiet window (config: dom_settle).
+        Use instead of fixed time.sleep() after clicks that trigger re-rendering.
+        `replaces` is the fixed sleep being replaced, used for the time-saved report.
+        Returns True if settled, False on timeout.
+        """
+        root = None
+        if locator:
+            root = WaitPolicy(driver).until(EC.presence_of_element_located(locator), kind="present", locator=locator)
+        return DomSettle.wait(driver, root, quiet_ms, timeout, replaces)
+
+    @staticmethod
+    def wait_for_animation(driver, locator=None, replaces=0.0):
+        """
+        Waits for an open/close or scroll animation to finish.
+        With animations suppressed (config: animations.suppress) they finish
+        instantly, so this returns at once; otherwise it waits for the DOM to settle.
+        Returns True if settled (always True when suppressed).
+        """
+        if AnimationControl.suppressed(driver):
+            DomSettle.stats.record(replaces, 0.0)
+            return True
+        return WaitHelpers.wait_for_dom_to_settle(driver, locator, replaces=replaces)
+
+    @staticmethod
+    def animation_poll(driver):
+        """
+        Returns the poll interval (s) for waits on animated elements: short when
+        animations are suppressed (the change is immediate), WebDriverWait's default otherwise.
+        """
+        return 0.05 if AnimationControl.suppressed(driver) else 0.5
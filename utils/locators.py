@@ -4,8 +4,20 @@ Organized by page for easy maintenance, reusability, and readability.
 Provides all By-locators for Selenium page objects and modals.
 """
 
+from functools import partial
 from selenium.webdriver.common.by import By
 
+# ==========================
+# Shared Locator Helpers
+# ==========================
+def page_number_locator(page_number, pagination="//*[contains(@class, 'pagination')]"):
+    """
+    Locator for the direct link/button to page_number inside a pagination bar
+    (XPath of the bar; default: any element with a 'pagination' class).
+    Usage: locators.page_number_locator(3)
+    """
+    return (By.XPATH, f"{pagination}//*[self::a or self::button][normalize-space()='{page_number}']")
+
 # ==========================
 # Login Page Locators
 # ==========================
@@ -86,6 +98,7 @@ class RevenuePanelPageLocators:
     PREVIOUS_PAGE_BUTTON = (By.XPATH, "//a[@class='page-link' and text()='Previous']")
     PAGINATION_PAGE_NUMBERS = (By.XPATH, "//ul[@aria-label='Pagination']//li[@class='page-item']//a[@role='button' and not(contains(@aria-label, 'Next page')) and not(contains(@aria-label, 'Previous page'))]")
     PAGINATION_ACTIVE_PAGE_NUMBER = (By.XPATH, "//ul[@aria-label='Pagination']//li[@class='page-item active']//a[@role='button' and @aria-current='page']")
+    page_number_locator = staticmethod(partial(page_number_locator, pagination="//ul[@aria-label='Pagination']"))
     # EXPORT_SUCCESS_MESSAGE = (By.XPATH, "")     # Success message not yet implemented
 
 
@@ -124,6 +137,29 @@ class DepartmentPageLocators:
     EDIT_BUTTONS = (By.XPATH, "//button[contains(text(), 'Edit')]")
     DELETE_BUTTONS = (By.XPATH, "//button[contains(text(), 'Delete')]")
 
+    # ------- Dynamic locator methods for one department's row -------
+    @staticmethod
+    def department_row_locator(department_name):
+        """
+        Locator for the department table row with a cell matching department_name.
+        Usage: locators.department_row_locator("QA")
+        """
+        return (By.XPATH, f"//table//tr[td[normalize-space()='{department_name}']]")
+
+    @staticmethod
+    def edit_button_locator(department_name):
+        """
+        Locator for the Edit button in the row of department_name.
+        """
+        return (By.XPATH, f"//table//tr[td[normalize-space()='{department_name}']]//button[contains(text(), 'Edit')]")
+
+    @staticmethod
+    def delete_button_locator(department_name):
+        """
+        Locator for the Delete button in the row of department_name.
+        """
+        return (By.XPATH, f"//table//tr[td[normalize-space()='{department_name}']]//button[contains(text(), 'Delete')]")
+
 
 # ==========================
 # Timesheet Page Locators
@@ -173,9 +209,28 @@ class ProjectPageLocators:
     # Project list and pagination
     PROJECT_TABLE = (By.CLASS_NAME, "project-table")
     PROJECT_ROWS = (By.XPATH, "//table//tr")
+    PROJECT_DATA_TABLE = (By.XPATH, "//table")  # The <table> element itself (read via TableReader)
     PAGINATION_CONTROLS = (By.CLASS_NAME, "pagination")
     NEXT_BUTTON = (By.XPATH, "//button[contains(text(), 'Next')]")
     PREVIOUS_BUTTON = (By.XPATH, "//button[contains(text(), 'Previous')]")
+    PAGINATION_ACTIVE_PAGE_NUMBER = (By.CSS_SELECTOR, ".pagination .active")
+    page_number_locator = staticmethod(page_number_locator)
+
+    # ------- Dynamic locator methods for one project's row -------
+    @staticmethod
+    def project_edit_button_locator(project_name):
+        """
+        Locator for the Edit button in the row of project_name.
+        Usage: locators.project_edit_button_locator("TestProject_3f9a2cg010")
+        """
+        return (By.XPATH, f"//table//tr[td[normalize-space()='{project_name}']]//button[contains(., 'Edit')]")
+
+    @staticmethod
+    def manage_assigned_button_locator(project_name):
+        """
+        Locator for the button opening Manage Assigned Employees in the row of project_name.
+        """
+        return (By.XPATH, f"//table//tr[td[normalize-space()='{project_name}']]//button[contains(., 'Manage')]")
 
 
 # ==========================
@@ -224,6 +279,15 @@ class AddProjectModalLocators:
     ADD_PROJECT_BUTTON = (By.XPATH, "//button[contains(text(), 'Add Project')]")
     CANCEL_BUTTON = (By.XPATH, "//button[contains(text(), 'Cancel')]")
 
+class EditProjectModalLocators:
+    """Locators for the Edit Project modal dialog."""
+    MODAL = (By.CLASS_NAME, "edit-project-modal")
+    PROJECT_NAME_INPUT = (By.ID, "project-name")
+    PROJECT_DESCRIPTION_INPUT = (By.ID, "project-description")
+    UPDATE_BUTTON = (By.XPATH, "//button[contains(text(), 'Update')]")
+    DELETE_BUTTON = (By.XPATH, "//button[contains(text(), 'Delete')]")
+    CANCEL_BUTTON = (By.XPATH, "//button[contains(text(), 'Cancel')]")
+
 class ManageAssignedEmployeesModalLocators:
     """Locators for the Manage Assigned Employees modal dialog."""
     MODAL = (By.CLASS_NAME, "manage-employees-modal")
@@ -235,6 +299,13 @@ class ManageAssignedEmployeesModalLocators:
     REMOVE_BUTTON = (By.XPATH, "//button[contains(text(), 'Remove')]")
     CANCEL_BUTTON = (By.XPATH, "//button[contains(text(), 'Cancel')]")
 
+    @staticmethod
+    def employee_list_item_locator(employee_name):
+        """
+        Locator for an entry of the employee list whose text contains employee_name.
+        """
+        return (By.XPATH, f"//*[contains(@class, 'employee-list')]//*[contains(normalize-space(), '{employee_name}')]")
+
 
 # ==========================
 # Manager Employees Page Locators
@@ -251,6 +322,9 @@ class ManagerEmployeesPageLocators:
     EMPLOYEE_LIST = (By.CLASS_NAME, "employee-list")
     EMPLOYEE_CARDS = (By.CLASS_NAME, "employee-card")
     PAGINATION_CONTROLS = (By.CLASS_NAME, "pagination")
+    NEXT_BUTTON = (By.XPATH, "//*[contains(@class, 'pagination')]//*[self::a or self::button][normalize-space()='Next']")
+    PAGINATION_ACTIVE_PAGE_NUMBER = (By.CSS_SELECTOR, ".pagination .active")
+    page_number_locator = staticmethod(page_number_locator)
 
 
     # ==========================
@@ -275,6 +349,7 @@ class MangerProjectPageLocators:
     " flex-grow-1']/div[@class='container-"
     "fluid']/div[@class='card']/div[@class='card-body card-body']/div[1]")
     PROJECT_ROWS = (By.XPATH, "//table//tr")
+    PROJECT_DATA_TABLE = (By.XPATH, "//table")  # The <table> element itself (read via TableReader)
     PAGINATION_CONTROLS = (By.CLASS_NAME, "pagination")
     NEXT_BUTTON = (By.XPATH, "//button[contains(text(), 'Next')]")
     PREVIOUS_BUTTON = (By.XPATH, "//button[contains(text(), 'Previous')]")
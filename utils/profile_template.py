@@ -0,0 +1,357 @@
+"""
+Warm Chrome profile templates for Trackora automation framework.
+Instead of a cold --incognito start, every Chrome launch gets its own clone
+of a user-data-dir built once per run: base_url was loaded in it, so the
+HTTP cache, code cache and service worker are warm, while cookies, storage,
+saved logins and sessions were removed (no auth state).
+
+Clones live in tmpfs (/dev/shm when it has room) next to the template.
+Every file is an independent copy: Chrome rewrites cache entries in place,
+so clones never share inodes with the template or each other. Where the
+filesystem supports it (btrfs, XFS), copies are reflinks that share blocks
+until written; elsewhere files are copied. The template's files are made
+read-only once built. A clone is deleted in the background once its
+browser quits; the last worker of the run removes the template.
+"""
+
+import json
+import logging
+import os
+import queue
+import shutil
+import stat
+import socket
+import tempfile
+import threading
+import time
+from pathlib import Path
+from selenium.common.exceptions import WebDriverException
+from utils.driver_service import _process_alive
+from utils.file_lock import FileLock
+from utils.unique_ids import UniqueIds
+
+try:
+    import fcntl as _fcntl
+except ImportError:  # Windows: no reflinks, plain copies
+    _fcntl = None
+
+logger = logging.getLogger(__name__)
+
+TMPFS = Path("/dev/shm")
+MIN_TMPFS_FREE = 512 * 1024 * 1024
+STALE_RUN_AGE = 60  # Seconds before a run directory without live workers counts as abandoned
+
+# ioctl cloning a file's blocks into another (Linux FICLONE; btrfs, XFS, bcachefs)
+FICLONE = 0x40049409
+
+# Auth and session state removed from the template after warming (relative to the user-data-dir)
+AUTH_STATE = (
+    "Default/Cookies", "Default/Cookies-journal",
+    "Default/Network/Cookies", "Default/Network/Cookies-journal",
+    "Default/Login Data", "Default/Login Data-journal",
+    "Default/Login Data For Account", "Default/Login Data For Account-journal",
+    "Default/Web Data", "Default/Web Data-journal",
+    "Default/Local Storage", "Default/Session Storage", "Default/IndexedDB",
+    "Default/Sessions", "Default/Current Session", "Default/Current Tabs",
+    "Default/Last Session", "Default/Last Tabs",
+)
+# Process locks of the browser that built the template
+LOCK_FILES = ("SingletonLock", "SingletonSocket", "SingletonCookie", "lockfile")
+
+# Async script. Arguments: timeout in ms, Selenium callback.
+SERVICE_WORKER_READY_SCRIPT = """
+var done = arguments[arguments.length - 1];
+if (!('serviceWorker' in navigator)) { done('unsupported'); return; }
+var timer = setTimeout(function () { done('timeout'); }, arguments[0]);
+navigator.serviceWorker.getRegistrations().then(function (registrations) {
+    if (!registrations.length) { clearTimeout(timer); done('none'); return; }
+    navigator.serviceWorker.ready.then(function () { clearTimeout(timer); done('ready'); });
+}, function () { clearTimeout(timer); done('error'); });
+"""
+
+
+def default_root():
+    """
+    Returns the directory for templates and clones: /dev/shm when it exists
+    and has enough free space, otherwise the system temp directory.
+    """
+    try:
+        if TMPFS.is_dir() and os.access(TMPFS, os.W_OK) and shutil.disk_usage(TMPFS).free >= MIN_TMPFS_FREE:
+            return TMPFS / "trackora-profiles"
+    except OSError:
+        pass
+    return Path(tempfile.gettempdir()) / "trackora-profiles"
+
+
+def remove_tree(path):
+    """
+    Deletes a template/clone directory, including read-only template files
+    (which Windows refuses to delete as they are). Errors are ignored.
+    """
+    def make_writable(function, failed_path, _):
+        try:
+            os.chmod(failed_path, stat.S_IWRITE | stat.S_IREAD)
+            function(failed_path)
+        except OSError:
+            pass
+
+    shutil.rmtree(path, onerror=make_writable)
+
+
+class ProfileTemplate:
+    """
+    Builds the run's warm Chrome profile once and hands out clones.
+
+    - start(): builds the template (or waits for another worker building it)
+      and makes this the active template; DriverFactory then launches every
+      Chrome with clone() instead of --incognito
+    - clone(): new user-data-dir copied (reflinked where supported) from the template
+    - attach(driver, path): deletes the clone in the background when driver.quit() is called
+    - shutdown(): removes this worker's clones (and the template if it is the last worker)
+    """
+
+    active = None
+
+    def __init__(self, config, root=None, service_worker_timeout=10):
+        """
+        Args:
+            config: Framework config (base_url, browser profile, waits).
+            root: Directory for templates and clones (default: see default_root()).
+            service_worker_timeout: Seconds to wait for base_url's service worker to activate.
+        """
+        self.config = config
+        self.root = Path(root) if root else default_root()
+        self.run_dir = self.root / f"run-{UniqueIds.run_id()}"
+        self.template_dir = self.run_dir / "template"
+        self.clones_dir = self.run_dir / "clones" / UniqueIds.prefix()
+        self.worker_file = self.run_dir / "workers" / f"{UniqueIds.prefix()}.json"
+        self.service_worker_timeout = service_worker_timeout
+        self.reflink = _fcntl is not None
+        self.stats = {"clones": 0, "clone_s": 0.0, "reflinked": 0, "copied": 0}
+        self._lock = threading.Lock()
+        self._discarded = queue.Queue()
+        self._cleaner = None
+
+    @classmethod
+    def from_config(cls, config):
+        """
+        Builds the template manager from the profile_template section of config.yaml,
+        or returns None when disabled or the browser profile is not Chrome.
+        """
+        settings = config.get("profile_template") or {}
+        if not settings.get("enabled", False):
+            return None
+        from utils.driver_factory import DriverFactory
+        if DriverFactory.resolve_profile(config)["browser"] != "chrome":
+            logger.warning("Profile templates are only supported for Chrome; using the normal launch.")
+            return None
+        return cls(config, root=settings.get("root"),
+                   service_worker_timeout=settings.get("service_worker_timeout", 10))
+
+    def start(self):
+        """
+        Makes the run's template available (building it if no other worker did)
+        and starts the background clone cleanup. Returns self; if the template
+        cannot be built, browsers keep launching the normal way.
+        """
+        self._register_worker()
+        self._reap_stale_runs()
+        with FileLock(self.run_dir / "build.lock", timeout=300):
+            if not (self.template_dir / "ready.json").is_file():
+                try:
+                    self.build()
+                except Exception as e:
+                    logger.warning(f"Could not build the profile template, launching cold browsers: {e}")
+                    remove_tree(self.template_dir)
+                    return self
+        self._cleaner = threading.Thread(target=self._clean_loop, name="profile-clone-cleanup", daemon=True)
+        self._cleaner.start()
+        ProfileTemplate.active = self
+        return self
+
+    def build(self):
+        """
+        Launches Chrome on a new user-data-dir, loads base_url until the app is idle and
+        its service worker (if any) is active, removes auth state and quits.
+        """
+        from utils.driver_factory import DriverFactory
+        from utils.helpers import TestHelpers
+
+        remove_tree(self.template_dir)
+        self.template_dir.mkdir(parents=True)
+        started = time.perf_counter()
+        driver = DriverFactory.create_driver(self.config, user_data_dir=self.template_dir)
+        try:
+            TestHelpers.wait_until_idle(driver)
+            service_worker = driver.execute_async_script(SERVICE_WORKER_READY_SCRIPT,
+                                                         self.service_worker_timeout * 1000)
+            origin = DriverFactory.get_origin(self.config["base_url"])
+            # Keep HTTP cache, cache storage and service workers; drop everything that can hold auth
+            driver.execute_cdp_cmd("Storage.clearDataForOrigin", {
+                "origin": origin,
+                "storageTypes": "cookies,local_storage,indexeddb,websql,file_systems,shader_cache",
+            })
+            driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+        except WebDriverException as e:
+            service_worker = "error"
+            logger.warning(f"Warming the profile template was incomplete: {e}")
+        finally:
+            driver.quit()
+        for relative in AUTH_STATE + LOCK_FILES:
+            path = self.template_dir / relative
+            if path.is_dir() and not path.is_symlink():
+                shutil.rmtree(path, ignore_errors=True)
+            elif path.exists() or path.is_symlink():
+                path.unlink()
+        size = 0
+        for path in self.template_dir.rglob("*"):
+            if path.is_file() and not path.is_symlink():
+                size += path.stat().st_size
+                path.chmod(stat.S_IMODE(path.stat().st_mode) & ~(stat.S_IWUSR | stat.S_IWGRP | stat.S_IWOTH))
+        with open(self.template_dir / "ready.json", "w", encoding="utf-8") as f:
+            json.dump({"base_url": self.config["base_url"], "service_worker": service_worker, "bytes": size}, f)
+        logger.info(f"Profile template built in {time.perf_counter() - started:.1f}s at {self.template_dir} "
+                    f"({size // 1024} KiB, service worker: {service_worker}).")
+
+    def clone(self):
+        """
+        Returns the path of a new user-data-dir cloned from the template.
+        Every file is the clone's own (writable) copy.
+        """
+        started = time.perf_counter()
+        target = self.clones_dir / UniqueIds.next_id()
+        reflinked = copied = 0
+        for source_dir, dirs, files in os.walk(self.template_dir):
+            relative = Path(source_dir).relative_to(self.template_dir)
+            (target / relative).mkdir(parents=True, exist_ok=True)
+            for name in files:
+                if relative == Path(".") and name == "ready.json":
+                    continue
+                source, destination = Path(source_dir) / name, target / relative / name
+                if source.is_symlink():
+                    os.symlink(os.readlink(source), destination)
+                    copied += 1
+                elif self._copy_file(source, destination):
+                    reflinked += 1
+                else:
+                    copied += 1
+        with self._lock:
+            self.stats["clones"] += 1
+            self.stats["clone_s"] += time.perf_counter() - started
+            self.stats["reflinked"] += reflinked
+            self.stats["copied"] += copied
+        return target
+
+    def _copy_file(self, source, destination):
+        """
+        Copies one template file into a clone, as a reflink when the filesystem
+        supports it. Returns True for a reflink, False for a plain copy.
+        """
+        reflinked = False
+        if self.reflink:
+            try:
+                with open(source, "rb") as src, open(destination, "wb") as dst:
+                    _fcntl.ioctl(dst.fileno(), FICLONE, src.fileno())
+                reflinked = True
+            except OSError:
+                self.reflink = False  # e.g. tmpfs or ext4; copy from now on
+        if not reflinked:
+            shutil.copyfile(source, destination)
+        shutil.copystat(source, destination)
+        destination.chmod(stat.S_IMODE(destination.stat().st_mode) | stat.S_IWUSR)  # Template files are read-only
+        return reflinked
+
+    def discard(self, path):
+        """
+        Queues a clone for deletion by the cleanup thread.
+        """
+        self._discarded.put(Path(path))
+
+    @staticmethod
+    def attach(driver, path):
+        """
+        Makes driver.quit() also discard the browser's clone (in the background).
+        """
+        template = ProfileTemplate.active
+        quit_browser = driver.quit
+
+        def quit():
+            try:
+                quit_browser()
+            finally:
+                if template is not None:
+                    template.discard(path)
+                else:
+                    shutil.rmtree(path, ignore_errors=True)
+
+        driver.quit = quit
+        driver.profile_clone = str(path)
+
+    def summary(self):
+        """
+        Returns {"clones", "avg_clone_ms", "reflinked", "copied"} for this worker.
+        """
+        with self._lock:
+            stats = dict(self.stats)
+        clones = stats.pop("clones")
+        clone_s = stats.pop("clone_s")
+        return dict(stats, clones=clones, avg_clone_ms=round(clone_s / clones * 1000, 1) if clones else None)
+
+    def shutdown(self):
+        """
+        Finishes the pending clean-ups, removes this worker's clones and, if no
+        other worker of the run is still alive, the template.
+        """
+        if ProfileTemplate.active is self:
+            ProfileTemplate.active = None
+        if self._cleaner is not None:
+            self._discarded.put(None)
+            self._cleaner.join(timeout=60)
+        shutil.rmtree(self.clones_dir, ignore_errors=True)
+        self.worker_file.unlink(missing_ok=True)
+        summary = self.summary()
+        logger.info(f"Profile template: {summary['clones']} clone(s), {summary['avg_clone_ms']} ms on average.")
+        with FileLock(self.run_dir / "build.lock", timeout=60):
+            if not self._live_workers(self.run_dir):
+                remove_tree(self.run_dir)
+
+    def _clean_loop(self):
+        while True:
+            path = self._discarded.get()
+            if path is None:
+                return
+            shutil.rmtree(path, ignore_errors=True)
+
+    def _register_worker(self):
+        self.worker_file.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.worker_file, "w", encoding="utf-8") as f:
+            json.dump({"host": socket.gethostname(), "pid": os.getpid()}, f)
+
+    @staticmethod
+    def _live_workers(run_dir):
+        live = []
+        for path in (Path(run_dir) / "workers").glob("*.json"):
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    record = json.load(f)
+            except (OSError, ValueError):
+                continue
+            if record.get("host") != socket.gethostname() or _process_alive(record.get("pid", 0)):
+                live.append(path)
+        return live
+
+    def _reap_stale_runs(self):
+        """
+        Deletes template/clone directories of earlier runs on this host whose workers are all gone.
+        """
+        for run_dir in self.root.glob("run-*"):
+            if run_dir == self.run_dir:
+                continue
+            try:
+                if time.time() - run_dir.stat().st_mtime < STALE_RUN_AGE:
+                    continue
+            except FileNotFoundError:
+                continue  # Removed by another worker meanwhile
+            if not self._live_workers(run_dir):
+                logger.info(f"Removing abandoned profile template {run_dir}")
+                remove_tree(run_dir)
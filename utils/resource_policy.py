@@ -0,0 +1,275 @@
+"""
+Resource blocking for Trackora automation framework.
+Fresh incognito browsers download fonts, images, media and third-party
+scripts (analytics, tag managers, web fonts) that functional checks never
+look at. On Chromium, the URLs matching the configured deny lists are
+blocked before they leave the browser (CDP Network.setBlockedURLs), and
+the browser's network events (performance log) are read back to count
+blocked requests and the bytes they would have cost.
+
+Tests that check images or branding lift the blocking with
+@pytest.mark.allow_resources (everything) or
+@pytest.mark.allow_resources("image", "*fonts.gstatic.com*") (selected
+resource types / deny-list patterns).
+"""
+
+import json
+import logging
+import re
+import threading
+import weakref
+from pathlib import Path
+from urllib.parse import urlsplit
+from selenium.common.exceptions import WebDriverException
+from utils.file_lock import FileLock
+
+logger = logging.getLogger(__name__)
+
+SIZE_CACHE = Path(__file__).parents[1] / ".trackora" / "resource_sizes.json"
+
+# setBlockedURLs matches URLs only, so resource types are blocked by file extension
+RESOURCE_TYPE_EXTENSIONS = {
+    "font": ("woff", "woff2", "ttf", "otf", "eot"),
+    "image": ("png", "jpg", "jpeg", "gif", "webp", "avif", "svg", "ico", "bmp"),
+    "media": ("mp4", "webm", "ogg", "mp3", "wav", "m4a"),
+}
+
+
+def type_patterns(resource_type):
+    """
+    Returns the URL patterns blocking `resource_type` ("font", "image" or "media"),
+    with and without a query string.
+    """
+    if resource_type not in RESOURCE_TYPE_EXTENSIONS:
+        raise ValueError(f"Unknown resource type '{resource_type}' "
+                         f"(supported: {', '.join(RESOURCE_TYPE_EXTENSIONS)})")
+    patterns = []
+    for extension in RESOURCE_TYPE_EXTENSIONS[resource_type]:
+        patterns += [f"*.{extension}", f"*.{extension}?*"]
+    return patterns
+
+
+def _pattern_regex(pattern):
+    # Chromium's blocked-URL patterns only know '*' (any characters)
+    return re.compile(".*".join(re.escape(part) for part in pattern.split("*")), re.IGNORECASE)
+
+
+def _size_key(url):
+    parts = urlsplit(url)
+    return f"{parts.scheme}://{parts.netloc}{parts.path}"
+
+
+class ResourcePolicy:
+    """
+    Per-driver resource blocking and accounting (Chromium only).
+
+    - enable_logging(options, settings): turns on the network performance log at launch
+    - install(driver, settings): blocks the deny-listed URLs (done by DriverFactory)
+    - begin_test(driver, marker): applies the test's allow_resources override, resets counters
+    - collect(driver): counts blocked requests and saved bytes since begin_test()
+
+    Saved bytes use the sizes seen when the same URLs did load (allow-listed
+    tests), kept in .trackora/resource_sizes.json; blocked URLs never seen
+    loading are counted as "unsized".
+    """
+
+    _policies = weakref.WeakKeyDictionary()
+    _lock = threading.Lock()
+    _sizes = None
+    _sizes_changed = False
+    session = {"tests": 0, "blocked": 0, "saved_bytes": 0, "unsized": 0}
+
+    def __init__(self, driver, url_patterns, resource_types):
+        self.driver = driver
+        self.url_patterns = list(url_patterns)
+        self.resource_types = list(resource_types)
+        # Sizes are only learned for URLs the deny lists would block
+        self._blockable = [_pattern_regex(pattern) for pattern in self.patterns()]
+        self.active_patterns = None
+        self.allowed = None
+        self._requests = {}
+        self._reset_counters()
+
+    @staticmethod
+    def enabled(settings):
+        return bool((settings or {}).get("enabled", False))
+
+    @staticmethod
+    def enable_logging(chrome_options, settings):
+        """
+        Adds the network performance log to ChromeOptions when blocking is enabled.
+        """
+        if not ResourcePolicy.enabled(settings):
+            return
+        chrome_options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+        chrome_options.add_experimental_option("perfLoggingPrefs", {"enableNetwork": True, "enablePage": False})
+
+    @classmethod
+    def install(cls, driver, settings):
+        """
+        Blocks the configured URL patterns and resource types on a new browser.
+        Returns the driver's policy, or None when disabled or not on Chromium.
+        """
+        settings = settings or {}
+        if not cls.enabled(settings):
+            return None
+        if not hasattr(driver, "execute_cdp_cmd"):
+            logger.warning("Resource blocking needs Chromium (CDP); loading everything.")
+            return None
+        policy = cls(driver, settings.get("blocked_url_patterns") or [], settings.get("blocked_resource_types") or [])
+        try:
+            driver.execute_cdp_cmd("Network.enable", {})
+            policy.apply()
+        except WebDriverException as e:
+            logger.warning(f"Could not enable resource blocking: {e}")
+            return None
+        cls._policies[driver] = policy
+        return policy
+
+    @classmethod
+    def for_driver(cls, driver):
+        """
+        Returns the policy installed on a driver, or None.
+        """
+        return cls._policies.get(driver) if driver is not None else None
+
+    def patterns(self, allow=None):
+        """
+        Returns the blocked URL patterns after lifting `allow` (None: nothing
+        lifted; empty: everything lifted; otherwise resource types and/or
+        patterns from blocked_url_patterns).
+        """
+        if allow is not None and not allow:
+            return []
+        allow = set(allow or ())
+        unknown = allow - set(self.url_patterns) - set(RESOURCE_TYPE_EXTENSIONS)
+        if unknown:
+            logger.warning(f"allow_resources: {sorted(unknown)} is neither a resource type nor a blocked pattern")
+        patterns = [pattern for pattern in self.url_patterns if pattern not in allow]
+        for resource_type in self.resource_types:
+            if resource_type not in allow:
+                patterns += type_patterns(resource_type)
+        return patterns
+
+    def apply(self, allow=None):
+        """
+        Sets the blocked URL patterns for the current test (skipped if unchanged).
+        """
+        patterns = self.patterns(allow)
+        if patterns != self.active_patterns:
+            self.driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": patterns})
+            self.active_patterns = patterns
+        self.allowed = None if allow is None else (list(allow) or "all")
+
+    @classmethod
+    def begin_test(cls, driver, marker=None):
+        """
+        Applies the test's allow_resources marker (if any) and starts the per-test counters.
+        """
+        policy = cls.for_driver(driver)
+        if policy is None:
+            return
+        allow = None if marker is None else [str(arg) for arg in marker.args]
+        try:
+            policy._read_log()  # Events from before this test (pool idle time, warm-up)
+            policy.apply(allow)
+        except WebDriverException as e:
+            logger.warning(f"Could not apply resource policy for this test: {e}")
+        policy._requests.clear()  # Requests that never finished must not pile up across tests
+        policy._reset_counters()
+
+    @classmethod
+    def collect(cls, driver):
+        """
+        Returns {"blocked", "by_type", "saved_bytes", "unsized", "loaded_bytes",
+        "allowed"} for the test so far, or None without a policy.
+        """
+        policy = cls.for_driver(driver)
+        if policy is None:
+            return None
+        try:
+            policy._read_log()
+        except WebDriverException as e:
+            logger.debug(f"Could not read network log: {e}")
+        summary = dict(policy.counters, by_type=dict(policy.counters["by_type"]), allowed=policy.allowed)
+        with cls._lock:
+            cls.session["tests"] += 1
+            for key in ("blocked", "saved_bytes", "unsized"):
+                cls.session[key] += summary[key]
+        return summary
+
+    @classmethod
+    def session_summary(cls):
+        with cls._lock:
+            return dict(cls.session)
+
+    @classmethod
+    def save_sizes(cls, path=SIZE_CACHE):
+        """
+        Merges the resource sizes learned in this process into the size cache.
+        """
+        with cls._lock:
+            if not cls._sizes_changed:
+                return
+            learned = dict(cls._sizes)
+            cls._sizes_changed = False
+        path = Path(path)
+        with FileLock(path.with_suffix(".lock"), timeout=30):
+            sizes = cls._load_sizes(path)
+            sizes.update(learned)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(sizes, f)
+
+    def _reset_counters(self):
+        self.counters = {"blocked": 0, "by_type": {}, "saved_bytes": 0, "unsized": 0, "loaded_bytes": 0}
+
+    def _read_log(self):
+        """
+        Drains the browser's network events and updates the counters and known sizes.
+        """
+        sizes = self._known_sizes()
+        for entry in self.driver.get_log("performance"):
+            try:
+                message = json.loads(entry["message"])["message"]
+            except (KeyError, ValueError):
+                continue
+            method, params = message.get("method"), message.get("params", {})
+            request_id = params.get("requestId")
+            if method == "Network.requestWillBeSent":
+                self._requests[request_id] = (params["request"]["url"], params.get("type", "Other"))
+            elif method == "Network.loadingFinished":
+                url, _ = self._requests.pop(request_id, (None, None))
+                length = int(params.get("encodedDataLength", 0))
+                self.counters["loaded_bytes"] += length
+                if url and length and any(regex.fullmatch(url) for regex in self._blockable):
+                    with self._lock:
+                        sizes[_size_key(url)] = length
+                        ResourcePolicy._sizes_changed = True
+            elif method == "Network.loadingFailed":
+                url, resource_type = self._requests.pop(request_id, (None, params.get("type", "Other")))
+                if not params.get("blockedReason"):
+                    continue
+                self.counters["blocked"] += 1
+                by_type = self.counters["by_type"]
+                by_type[resource_type] = by_type.get(resource_type, 0) + 1
+                size = sizes.get(_size_key(url)) if url else None
+                if size:
+                    self.counters["saved_bytes"] += size
+                else:
+                    self.counters["unsized"] += 1
+
+    @classmethod
+    def _known_sizes(cls):
+        with cls._lock:
+            if cls._sizes is None:
+                cls._sizes = cls._load_sizes(SIZE_CACHE)
+            return cls._sizes
+
+    @staticmethod
+    def _load_sizes(path):
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
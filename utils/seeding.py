@@ -0,0 +1,250 @@
+"""
+API-backed test data seeding for Trackora automation framework.
+Creates departments, projects and employees through the REST API instead of
+clicking through the Add* modals, so only tests that cover those modals pay
+for the UI flow.
+"""
+
+import logging
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlencode
+from utils.api_client import ApiClient, ApiError
+from utils.test_data_store import TestDataStore, thaw
+from utils.unique_ids import UniqueIds
+from utils.entity_registry import EntityRegistry
+
+logger = logging.getLogger(__name__)
+
+ENTITY_TYPES = ("department", "project", "employee")
+
+# Field that identifies an entity created through the UI (no id known yet)
+NAME_FIELDS = {"department": "name", "project": "name", "employee": "email"}
+
+
+class SeedBackend(ABC):
+    """
+    Interface for seeding backends. Entities are plain dicts with an "id".
+    """
+
+    @abstractmethod
+    def create(self, entity_type, payload):
+        """
+        Creates one entity and returns it (including its id).
+        """
+
+    def create_many(self, entity_type, payloads):
+        return [self.create(entity_type, payload) for payload in payloads]
+
+    @abstractmethod
+    def delete(self, entity_type, entity_id):
+        """
+        Deletes one entity; an entity that is already gone is not an error.
+        """
+
+    def delete_many(self, entity_type, entity_ids):
+        for entity_id in entity_ids:
+            self.delete(entity_type, entity_id)
+
+    @abstractmethod
+    def find_ids(self, entity_type, names):
+        """
+        Returns {name: id} for existing entities whose NAME_FIELDS value is in names.
+        """
+
+
+class HttpSeedBackend(SeedBackend):
+    """
+    Seeds through the Trackora REST API (or the local stub server) using the
+    worker's pooled ApiClient.
+
+    - create_many(): one POST to the bulk endpoint when configured, otherwise
+      concurrent single POSTs over the shared keep-alive pool
+    - delete_many(): bulk-delete endpoint when configured, otherwise concurrent DELETEs
+    - find_ids(): server-side search when search_param is configured, otherwise
+      walks the collection page by page (page_param / page_size_param)
+    """
+
+    def __init__(self, client, endpoints, concurrency=None):
+        """
+        Args:
+            client: ApiClient instance.
+            endpoints: {entity_type: {"path": ..., "bulk_path": ..., "bulk_delete_path": ...,
+                "search_param": ..., "page_param": ..., "page_size_param": ..., "page_size": ...}}.
+            concurrency: Parallel requests when no bulk endpoint exists
+                (defaults to the client's pool size).
+        """
+        self.client = client
+        self.endpoints = endpoints
+        self.concurrency = concurrency or client.pool_size
+
+    def create(self, entity_type, payload):
+        return self.client.post(self._endpoint(entity_type)["path"], payload)
+
+    def create_many(self, entity_type, payloads):
+        endpoint = self._endpoint(entity_type)
+        if not payloads:
+            return []
+        if endpoint.get("bulk_path"):
+            return self.client.post(endpoint["bulk_path"], list(payloads))
+        return self._parallel(lambda payload: self.create(entity_type, payload), payloads)
+
+    def delete(self, entity_type, entity_id):
+        path = self._endpoint(entity_type)["path"].rstrip("/")
+        try:
+            self.client.delete(f"{path}/{entity_id}")
+        except ApiError as e:
+            if e.status != 404:  # Already gone is fine
+                raise
+
+    def delete_many(self, entity_type, entity_ids):
+        endpoint = self._endpoint(entity_type)
+        if not entity_ids:
+            return
+        if endpoint.get("bulk_delete_path"):
+            self.client.post(endpoint["bulk_delete_path"], {"ids": list(entity_ids)})
+            return
+        self._parallel(lambda entity_id: self.delete(entity_type, entity_id), entity_ids)
+
+    def find_ids(self, entity_type, names):
+        wanted = set(names)
+        if not wanted:
+            return {}
+        field = NAME_FIELDS.get(entity_type, "name")
+        endpoint = self._endpoint(entity_type)
+        if endpoint.get("search_param"):
+            pages = self._parallel(lambda name: self._get_page(endpoint, {endpoint["search_param"]: name})[0],
+                                   sorted(wanted))
+        else:
+            pages = self._pages(endpoint)
+        found = {}
+        for entities in pages:
+            found.update((entity[field], entity["id"]) for entity in entities
+                         if entity.get(field) in wanted and "id" in entity)
+            if len(found) == len(wanted):
+                break
+        return found
+
+    def _get_page(self, endpoint, params):
+        """
+        Returns (entities, has_next) for one GET of the collection with query params.
+        """
+        response = self.client.get(f"{endpoint['path']}?{urlencode(params)}") or []
+        if isinstance(response, dict):
+            entities = response.get("data") or response.get("items") or response.get("results") or []
+            return entities, response.get("next") is not None if "next" in response else None
+        return response, None
+
+    def _pages(self, endpoint):
+        """
+        Yields the collection page by page until a short or empty page, a null
+        "next" link, or a page with nothing new (an API that ignores paging).
+        """
+        page_size = endpoint.get("page_size", 100)
+        seen = set()
+        page = 1
+        while True:
+            entities, has_next = self._get_page(endpoint, {endpoint.get("page_param", "page"): page,
+                                                           endpoint.get("page_size_param", "page_size"): page_size})
+            new = [entity for entity in entities if entity.get("id") not in seen]
+            seen.update(entity.get("id") for entity in new)
+            if new:
+                yield new
+            if not new or has_next is False or (has_next is None and len(entities) < page_size):
+                return
+            page += 1
+
+    def _endpoint(self, entity_type):
+        try:
+            return self.endpoints[entity_type]
+        except KeyError:
+            raise ValueError(f"No API endpoint configured for entity type '{entity_type}'")
+
+    def _parallel(self, call, items):
+        items = list(items)
+        if len(items) == 1 or self.concurrency <= 1:
+            return [call(item) for item in items]
+        with ThreadPoolExecutor(max_workers=min(self.concurrency, len(items))) as executor:
+            return list(executor.map(call, items))
+
+
+class DataSeeder:
+    """
+    Builds entity payloads from data/testdata.json (with unique names) and
+    creates them through a SeedBackend.
+
+    Usage:
+        department = seeder.department()
+        projects = seeder.projects(20, department=department["name"])
+    """
+
+    def __init__(self, backend):
+        self.backend = backend
+        self.created = []  # (entity_type, id) of everything this seeder created
+
+    @classmethod
+    def for_config(cls, config, base_url=None):
+        """
+        Returns a seeder using the HTTP backend described by the `api` section
+        of config.yaml. `base_url` points it elsewhere (e.g. the stub server).
+        """
+        api = config.get("api", {}) or {}
+        client = ApiClient.for_config(config, base_url)
+        return cls(HttpSeedBackend(client, api.get("endpoints", {}), api.get("concurrency")))
+
+    @staticmethod
+    def payload(entity_type, **overrides):
+        """
+        Returns a new-entity payload: the testdata.json template with a unique
+        name (and email for employees), updated with overrides.
+        """
+        template = thaw(TestDataStore.section("test_data", f"{entity_type}s")[f"new_{entity_type}"])
+        if entity_type == "employee":
+            template["email"] = UniqueIds.email(template["email"])
+            template["first_name"] = UniqueIds.name(template["first_name"])
+        else:
+            template["name"] = UniqueIds.name(template["name"])
+        template.update(overrides)
+        return template
+
+    def create(self, entity_type, **overrides):
+        """
+        Creates one entity and returns it (API response, including its id).
+        """
+        entity = self.backend.create(entity_type, self.payload(entity_type, **overrides))
+        self._track(entity_type, [entity])
+        return entity
+
+    def create_many(self, entity_type, count, **overrides):
+        """
+        Creates `count` entities in as few requests as the backend allows.
+        """
+        payloads = [self.payload(entity_type, **overrides) for _ in range(count)]
+        entities = self.backend.create_many(entity_type, payloads)
+        self._track(entity_type, entities)
+        return entities
+
+    def department(self, **overrides):
+        return self.create("department", **overrides)
+
+    def project(self, **overrides):
+        return self.create("project", **overrides)
+
+    def employee(self, **overrides):
+        return self.create("employee", **overrides)
+
+    def departments(self, count, **overrides):
+        return self.create_many("department", count, **overrides)
+
+    def projects(self, count, **overrides):
+        return self.create_many("project", count, **overrides)
+
+    def employees(self, count, **overrides):
+        return self.create_many("employee", count, **overrides)
+
+    def _track(self, entity_type, entities):
+        for entity in entities:
+            if isinstance(entity, dict) and "id" in entity:
+                self.created.append((entity_type, entity["id"]))
+                EntityRegistry.record_created(entity_type, entity["id"],
+                                              entity.get(NAME_FIELDS.get(entity_type, "name")))
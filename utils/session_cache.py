@@ -0,0 +1,224 @@
+"""
+Authenticated session cache for Trackora automation framework.
+Logs in through the UI once per user type, captures the resulting auth state
+(cookies, localStorage, sessionStorage) and injects it into later browsers,
+so role fixtures do not have to drive the login form for every test.
+"""
+
+import base64
+import json
+import logging
+import threading
+import time
+from urllib.parse import urlparse
+from selenium.common.exceptions import TimeoutException, WebDriverException
+from pages.base_page import BasePage
+from pages.login_page import LoginPage
+from utils.helpers import TestHelpers
+from utils.wait_policy import WaitPolicy
+
+logger = logging.getLogger(__name__)
+
+READ_STORAGE_SCRIPT = """
+var dump = function (storage) {
+    var out = {};
+    for (var i = 0; i < storage.length; i++) {
+        var key = storage.key(i);
+        out[key] = storage.getItem(key);
+    }
+    return out;
+};
+return {local: dump(window.localStorage), session: dump(window.sessionStorage)};
+"""
+
+WRITE_STORAGE_SCRIPT = """
+var state = arguments[0];
+Object.keys(state.local).forEach(function (k) { window.localStorage.setItem(k, state.local[k]); });
+Object.keys(state.session).forEach(function (k) { window.sessionStorage.setItem(k, state.session[k]); });
+"""
+
+# Cookie keys accepted by WebDriver's add_cookie command
+COOKIE_KEYS = ("name", "value", "path", "domain", "secure", "httpOnly", "expiry", "sameSite")
+
+
+class AuthState:
+    """
+    Snapshot of an authenticated browser session for one user type.
+    """
+
+    def __init__(self, user_type, credentials, cookies, local_storage, session_storage, landing_url):
+        self.user_type = user_type
+        self.credentials = credentials
+        self.cookies = cookies
+        self.local_storage = local_storage
+        self.session_storage = session_storage
+        self.landing_url = landing_url
+        self.captured_at = time.time()
+        self.expires_at = self._compute_expiry()
+
+    def is_expired(self, margin=60):
+        """
+        Returns True if any auth cookie or storage token expires within `margin` seconds.
+        """
+        return self.expires_at is not None and time.time() + margin >= self.expires_at
+
+    def _compute_expiry(self):
+        """
+        Earliest expiry among persistent cookies and JWT 'exp' claims in storage.
+        Returns None when nothing carries an expiry.
+        """
+        expiries = [cookie["expiry"] for cookie in self.cookies if cookie.get("expiry")]
+        for value in list(self.local_storage.values()) + list(self.session_storage.values()):
+            exp = _jwt_expiry(value)
+            if exp:
+                expiries.append(exp)
+        return min(expiries) if expiries else None
+
+
+def _jwt_expiry(value):
+    """
+    Extracts the 'exp' claim from a JWT-looking string (bare or JSON-wrapped).
+    Returns None if the value is not a decodable JWT.
+    """
+    if not isinstance(value, str):
+        return None
+    token = value.strip().strip('"')
+    if token.lower().startswith("bearer "):
+        token = token[7:]
+    parts = token.split(".")
+    if len(parts) != 3:
+        return None
+    try:
+        payload = parts[1] + "=" * (-len(parts[1]) % 4)
+        claims = json.loads(base64.urlsafe_b64decode(payload))
+        return float(claims["exp"])
+    except (ValueError, KeyError, TypeError):
+        return None
+
+
+class AuthSessionCache:
+    """
+    Per-worker cache of authenticated sessions keyed by user type.
+
+    - First request for a user type logs in through the UI and captures the state
+    - Later requests inject the cached cookies/storage into the browser
+    - Expired or rejected state is dropped and the UI login runs again
+    """
+
+    def __init__(self, config, expiry_margin=60):
+        """
+        Args:
+            config: Framework config (base_url is used as the login route).
+            expiry_margin: Seconds before token expiry at which a fresh login is forced.
+        """
+        self.base_url = config["base_url"]
+        self.login_path = urlparse(self.base_url).path.rstrip("/")
+        self.expiry_margin = expiry_margin
+        self._states = {}
+        self._lock = threading.Lock()
+        self.ui_logins = 0
+        self.injected_logins = 0
+
+    def login(self, driver, user_type="admin"):
+        """
+        Authenticates the browser as `user_type`, preferring cached state.
+        Expects the browser to be on the app origin (e.g. the login route).
+
+        Returns:
+            The credentials dictionary used for the user type.
+        """
+        with self._lock:
+            state = self._states.get(user_type)
+        if state and state.is_expired(self.expiry_margin):
+            logger.info(f"Cached session for '{user_type}' expired; re-authenticating.")
+            self.invalidate(user_type)
+            state = None
+
+        if state:
+            try:
+                if self._inject(driver, state):
+                    self.injected_logins += 1
+                    return state.credentials
+            except WebDriverException as e:
+                logger.warning(f"Injecting cached session for '{user_type}' failed: {e}")
+            logger.info(f"Cached session for '{user_type}' was rejected; re-authenticating.")
+            self.invalidate(user_type)
+            self._clear_auth(driver)
+
+        return self._ui_login(driver, user_type)
+
+    def invalidate(self, user_type=None):
+        """
+        Drops the cached state for one user type (or all when None).
+        """
+        with self._lock:
+            if user_type is None:
+                self._states.clear()
+            else:
+                self._states.pop(user_type, None)
+
+    def is_authenticated(self, driver):
+        """
+        Returns True when the browser is past the login route and no login form is shown.
+        """
+        current_path = urlparse(driver.current_url).path.rstrip("/")
+        if current_path == self.login_path:
+            return False
+        # Checked in-page so the implicit wait does not apply to the (expected) absence
+        return not driver.execute_script("return !!document.querySelector('input[type=password]');")
+
+    def wait_until_authenticated(self, driver, timeout=None):
+        """
+        Waits (explicit wait policy) for the app to redirect away from the login
+        route after the login form was submitted.
+        Returns True once authenticated, False on timeout (never raises).
+        """
+        try:
+            return WaitPolicy(driver).until(self.is_authenticated, timeout, kind="login_redirect",
+                                            message="login did not leave the login page")
+        except TimeoutException:
+            return False
+
+    def _ui_login(self, driver, user_type):
+        login_page = LoginPage(driver)
+        credentials = login_page.login_as_user_type(user_type)
+        authenticated = self.wait_until_authenticated(driver)
+        alert_text = BasePage(driver).handle_login_popup_alert()
+        if alert_text:
+            logger.info(f"Login popup alert dismissed with text: {alert_text}")
+        self.ui_logins += 1
+
+        if not authenticated:
+            logger.warning(f"UI login as '{user_type}' did not leave the login page; not caching session.")
+            return credentials
+
+        storage = driver.execute_script(READ_STORAGE_SCRIPT)
+        state = AuthState(
+            user_type,
+            credentials,
+            driver.get_cookies(),
+            storage["local"],
+            storage["session"],
+            driver.current_url,
+        )
+        with self._lock:
+            self._states[user_type] = state
+        return credentials
+
+    def _inject(self, driver, state):
+        host = urlparse(driver.current_url).hostname or ""
+        for cookie in state.cookies:
+            domain = (cookie.get("domain") or host).lstrip(".")
+            if not host.endswith(domain):
+                continue
+            driver.add_cookie({key: cookie[key] for key in COOKIE_KEYS if key in cookie})
+        driver.execute_script(WRITE_STORAGE_SCRIPT, {"local": state.local_storage, "session": state.session_storage})
+        driver.get(state.landing_url)
+        TestHelpers.wait_for_page_load(driver)
+        return self.is_authenticated(driver)
+
+    def _clear_auth(self, driver):
+        driver.delete_all_cookies()
+        driver.execute_script("window.localStorage.clear(); window.sessionStorage.clear();")
+        driver.get(self.base_url)
+        TestHelpers.wait_for_page_load(driver)
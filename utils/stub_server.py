@@ -0,0 +1,189 @@
+"""
+Local stand-in for the Trackora REST API.
+An in-memory HTTP server implementing the endpoints used for data seeding
+and cleanup, so the seeding subsystem can run offline (no QA environment).
+It can also serve fixed static assets (e.g. hash-named JS/CSS bundles) for
+offline checks of the asset proxy.
+"""
+
+import collections
+import itertools
+import json
+import logging
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+logger = logging.getLogger(__name__)
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    """
+    Routes:
+      POST   /<login path>            -> {"token": ...}
+      GET    /<collection>            -> [entity, ...] (?page=&page_size= for one page)
+      POST   /<collection>            -> entity (with "id")
+      POST   /<collection>/bulk       -> [entity, ...]
+      POST   /<collection>/bulk-delete {"ids": [...]} -> {"deleted": n}
+      GET    /<collection>/<id>       -> entity
+      DELETE /<collection>/<id>       -> 204
+      GET    /<asset path>            -> asset body
+    Collections are created on first use.
+    """
+
+    protocol_version = "HTTP/1.1"  # Keep-alive, like the real API
+
+    def log_message(self, format, *args):
+        logger.debug("stub api: " + format % args)
+
+    def do_GET(self):
+        store = self.server.store
+        path = self.path.split("?")[0]
+        with store.lock:
+            store.requests[path] += 1
+            asset = store.assets.get(path)
+        if asset is not None:
+            return self._send_asset(*asset)
+        collection, entity_id, _ = self._route()
+        with store.lock:
+            items = store.collections.get(collection, {})
+            if entity_id is None:
+                return self._send(200, self._page(list(items.values())))
+            if entity_id in items:
+                return self._send(200, items[entity_id])
+        self._send(404, {"error": "not found"})
+
+    def do_POST(self):
+        collection, entity_id, action = self._route()
+        payload = self._read_json()
+        store = self.server.store
+        with store.lock:
+            store.requests[self.path.split("?")[0]] += 1
+        if collection == store.login_path.strip("/"):
+            return self._send(200, {store.token_field: "stub-token"})
+        with store.lock:
+            if entity_id == "bulk":
+                return self._send(201, [store.create(collection, item) for item in payload])
+            if entity_id == "bulk-delete":
+                deleted = sum(1 for item_id in payload.get("ids", []) if store.delete(collection, str(item_id)))
+                return self._send(200, {"deleted": deleted})
+            return self._send(201, store.create(collection, payload))
+
+    def do_DELETE(self):
+        collection, entity_id, _ = self._route()
+        with self.server.store.lock:
+            deleted = self.server.store.delete(collection, entity_id)
+        self._send(204 if deleted else 404, None)
+
+    def _route(self):
+        parts = [part for part in self.path.split("?")[0].strip("/").split("/") if part]
+        # Collection paths may be nested (e.g. api/departments); the last segment
+        # is an id/action when it is numeric or one of the bulk actions.
+        if parts and (parts[-1].isdigit() or parts[-1] in ("bulk", "bulk-delete")):
+            return "/".join(parts[:-1]), parts[-1], None
+        return "/".join(parts), None, None
+
+    def _page(self, entities):
+        query = parse_qs(urlsplit(self.path).query)
+        if "page" not in query:
+            return entities
+        size = int(query.get("page_size", ["100"])[0])
+        start = (int(query["page"][0]) - 1) * size
+        return entities[start:start + size]
+
+    def _read_json(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        return json.loads(self.rfile.read(length)) if length else {}
+
+    def _send(self, status, body):
+        data = json.dumps(body).encode("utf-8") if body is not None else b""
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _send_asset(self, content_type, data):
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+
+class _StubStore:
+    """
+    Thread-safe in-memory entity store shared by the handler threads.
+    """
+
+    def __init__(self, login_path, token_field, assets=None):
+        self.login_path = login_path or "/auth/login"
+        self.token_field = token_field
+        self.collections = {}
+        self.assets = dict(assets or {})
+        self.requests = collections.Counter()  # GET/POST requests per path
+        self.lock = threading.Lock()
+        self._ids = itertools.count(1)
+
+    def create(self, collection, payload):
+        entity = dict(payload, id=next(self._ids))
+        self.collections.setdefault(collection, {})[str(entity["id"])] = entity
+        return entity
+
+    def delete(self, collection, entity_id):
+        return self.collections.get(collection, {}).pop(entity_id, None) is not None
+
+
+class StubApiServer:
+    """
+    Runs the stand-in API on 127.0.0.1 in a background thread.
+
+    Usage:
+        with StubApiServer() as server:
+            client = ApiClient(server.base_url)
+    """
+
+    def __init__(self, port=0, login_path="/auth/login", token_field="token", assets=None, ssl_context=None):
+        """
+        Args:
+            port: Port to listen on (0 picks a free one).
+            login_path: Path answering token requests.
+            token_field: Key of the token in the login response.
+            assets: Optional {path: (content_type, bytes)} served as static files.
+            ssl_context: Optional server-side ssl.SSLContext to serve HTTPS.
+        """
+        self.store = _StubStore(login_path, token_field, assets)
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", port), _StubHandler)
+        if ssl_context is not None:
+            self.httpd.socket = ssl_context.wrap_socket(self.httpd.socket, server_side=True)
+        self.scheme = "https" if ssl_context is not None else "http"
+        self.httpd.daemon_threads = True
+        self.httpd.store = self.store
+        self._thread = None
+
+    @property
+    def base_url(self):
+        host, port = self.httpd.server_address[:2]
+        return f"{self.scheme}://{host}:{port}"
+
+    def start(self):
+        """
+        Starts serving in a daemon thread. Returns self.
+        """
+        self._thread = threading.Thread(target=self.httpd.serve_forever, name="stub-api", daemon=True)
+        self._thread.start()
+        logger.info(f"Stub Trackora API listening on {self.base_url}")
+        return self
+
+    def stop(self):
+        """
+        Stops the server and closes its socket.
+        """
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
@@ -0,0 +1,219 @@
+"""
+Test data store for Trackora automation framework.
+Parses data/testdata.json (plus env/profile overlays) once per process and
+serves read-only views of it; the files are re-read only when their mtime
+changes. Large side datasets are streamed lazily from JSONL files.
+"""
+
+import json
+import logging
+import os
+import threading
+from pathlib import Path
+from types import MappingProxyType
+
+logger = logging.getLogger(__name__)
+
+DATA_DIR = Path(__file__).parents[1] / "data"
+
+
+def freeze(value):
+    """
+    Returns a read-only view of parsed JSON: dicts become MappingProxyType,
+    lists become tuples. Use thaw() to get a mutable copy.
+    """
+    if isinstance(value, dict):
+        return MappingProxyType({key: freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(freeze(item) for item in value)
+    return value
+
+
+def thaw(value):
+    """
+    Returns a mutable deep copy (dicts/lists) of a frozen view.
+    """
+    if isinstance(value, (dict, MappingProxyType)):
+        return {key: thaw(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [thaw(item) for item in value]
+    return value
+
+
+def deep_merge(base, override):
+    """
+    Merges override into base (both plain dicts); nested dicts are merged,
+    everything else is replaced. Returns a new dict.
+    """
+    merged = dict(base)
+    for key, value in override.items():
+        if isinstance(value, dict) and isinstance(merged.get(key), dict):
+            merged[key] = deep_merge(merged[key], value)
+        else:
+            merged[key] = value
+    return merged
+
+
+def _file_stamp(path):
+    """
+    Returns (mtime_ns, size) for path, or None if it does not exist.
+    """
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+class JsonlDataset:
+    """
+    Lazily loaded JSONL dataset (one JSON record per line).
+
+    - Iterating streams records from disk; nothing is kept in memory
+    - len() and indexing build a byte-offset index on first use
+    - The index is rebuilt when the file's mtime changes
+    """
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self._offsets = None
+        self._stamp = None
+        self._lock = threading.Lock()
+
+    def __iter__(self):
+        with open(self.path, "rb") as f:
+            for line in f:
+                if line.strip():
+                    yield freeze(json.loads(line))
+
+    def __len__(self):
+        return len(self._index())
+
+    def __getitem__(self, position):
+        offsets = self._index()
+        with open(self.path, "rb") as f:
+            f.seek(offsets[position])
+            return freeze(json.loads(f.readline()))
+
+    def _index(self):
+        with self._lock:
+            stamp = _file_stamp(self.path)
+            if self._offsets is None or stamp != self._stamp:
+                offsets = []
+                with open(self.path, "rb") as f:
+                    offset = 0
+                    for line in f:
+                        if line.strip():
+                            offsets.append(offset)
+                        offset += len(line)
+                self._offsets, self._stamp = offsets, stamp
+            return self._offsets
+
+
+class TestDataStore:
+    """
+    Process-wide cache of the framework's test data.
+
+    Layers (later ones override earlier ones, nested keys are merged):
+      1. data/testdata.json
+      2. data/testdata.<env>.json      (env: TRACKORA_ENV or config.yaml `env`)
+      3. data/testdata.<profile>.json  (profile: TRACKORA_DATA_PROFILE)
+
+    Usage:
+        users = TestDataStore.get()["users"]
+        orders = TestDataStore.dataset("orders")   # data/datasets/orders.jsonl
+    """
+
+    __test__ = False  # Not a pytest test class
+
+    data_dir = DATA_DIR
+    env = os.environ.get("TRACKORA_ENV")
+    profile = os.environ.get("TRACKORA_DATA_PROFILE")
+    _data = None
+    _stamps = None
+    _datasets = {}
+    _lock = threading.RLock()
+
+    @classmethod
+    def configure(cls, env=None, profile=None, data_dir=None):
+        """
+        Sets the overlay env/profile (environment variables take precedence)
+        and optionally a different data directory. Clears the cache.
+        """
+        with cls._lock:
+            cls.env = os.environ.get("TRACKORA_ENV") or env or cls.env
+            cls.profile = os.environ.get("TRACKORA_DATA_PROFILE") or profile or cls.profile
+            if data_dir is not None:
+                cls.data_dir = Path(data_dir)
+            cls.invalidate()
+
+    @classmethod
+    def layer_paths(cls):
+        """
+        Returns the data files that make up the merged view, in override order.
+        """
+        paths = [cls.data_dir / "testdata.json"]
+        for name in (cls.env, cls.profile):
+            if name:
+                paths.append(cls.data_dir / f"testdata.{str(name).lower()}.json")
+        return paths
+
+    @classmethod
+    def get(cls):
+        """
+        Returns the merged test data as a read-only view.
+        Parses the files only on first use or after one of them changed.
+        """
+        paths = cls.layer_paths()
+        stamps = tuple(_file_stamp(path) for path in paths)
+        with cls._lock:
+            if cls._data is None or stamps != cls._stamps:
+                cls._data = cls._load(paths)
+                cls._stamps = stamps
+            return cls._data
+
+    @classmethod
+    def section(cls, *keys):
+        """
+        Returns a nested section, e.g. section("test_data", "projects").
+        """
+        value = cls.get()
+        for key in keys:
+            value = value[key]
+        return value
+
+    @classmethod
+    def dataset(cls, name):
+        """
+        Returns the lazily loaded JSONL dataset data/datasets/<name>.jsonl.
+        """
+        with cls._lock:
+            if name not in cls._datasets:
+                path = cls.data_dir / "datasets" / f"{name}.jsonl"
+                if not path.exists():
+                    raise FileNotFoundError(f"Dataset not found: {path}")
+                cls._datasets[name] = JsonlDataset(path)
+            return cls._datasets[name]
+
+    @classmethod
+    def invalidate(cls):
+        """
+        Drops the cached data so the next get() re-reads the files.
+        """
+        with cls._lock:
+            cls._data = None
+            cls._stamps = None
+            cls._datasets = {}
+
+    @classmethod
+    def _load(cls, paths):
+        merged = {}
+        for path in paths:
+            if not path.exists():
+                if path != paths[0]:
+                    logger.debug(f"Test data overlay not found, skipping: {path}")
+                    continue
+            with open(path, "r") as f:
+                merged = deep_merge(merged, json.load(f))
+        logger.debug(f"Loaded test data from {[str(path) for path in paths if path.exists()]}")
+        return freeze(merged)
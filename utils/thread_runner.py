@@ -0,0 +1,481 @@
+"""
+Thread-based test runner for Trackora automation framework.
+Runs the collected tests on N threads inside one pytest process
+(--tk-threads N). Test time is almost all spent waiting on the browser, so
+threads overlap that waiting without the memory cost of extra xdist
+interpreters (each worker re-imports Selenium, pytest-html and every page
+object). Combine with -n to run threads inside each xdist worker.
+
+Per thread:
+  - setup state and function-scoped fixture values (so its own WebDriver
+    from the worker's driver pool and its own page objects)
+  - captured log (attached to each test's report section) and thread name
+    in console log lines
+  - screenshot folder (reports/screenshots/<thread>/)
+Module/class fixtures keep one value per module/class, shared by the
+threads running its tests; they are created under a lock and torn down as
+soon as the module's/class's last test has finished (package fixtures once
+the package's last test has). Session fixtures are torn down once every
+thread has finished.
+
+pytest has no public API for any of this, so the runner hooks into its
+internals (SetupState, FixtureDef) while the run lasts, restores them
+afterwards and refuses to start on a pytest whose internals do not match.
+"""
+
+import logging
+import threading
+import weakref
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+import pytest
+from _pytest import fixtures
+from _pytest.runner import SetupState, check_interactive_exception
+from _pytest.scope import Scope
+
+logger = logging.getLogger(__name__)
+
+THREAD_NAME_PREFIX = "tk-thread"
+THREAD_LOG_FORMAT = "%(asctime)s [%(levelname)s] [%(threadName)s] %(name)s: %(message)s"
+REPORT_LOG_FORMAT = "%(asctime)s [%(levelname)s] %(name)s: %(message)s"
+
+_local = threading.local()          # Per runner thread: current item, log buffer, fixture values
+_shared_fixture_lock = threading.RLock()
+_node_fixture_values = {}           # (FixtureDef, module/class node) -> attribute values
+
+# Collector type whose node holds the value of a fixture of each scope
+_SCOPE_NODE_TYPES = {
+    Scope.Module: pytest.Module,
+    Scope.Class: pytest.Class,
+}
+
+
+def _in_runner_thread():
+    return getattr(_local, "runner", False)
+
+
+def _scope_node(fixturedef):
+    """
+    Returns the module/class node a shared fixture's value belongs to,
+    seen from the fixture request being executed/finished (or the thread's
+    current test), falling back to that node itself as pytest does; None
+    outside a request and a runner thread.
+    """
+    node = getattr(_local, "request_node", None) or getattr(_local, "item", None)
+    if node is None:
+        return None
+    return node.getparent(_SCOPE_NODE_TYPES[fixturedef.__dict__["_scope"]]) or node
+
+
+class _ThreadLocalFixtureAttribute:
+    """
+    Replaces FixtureDef.cached_result / FixtureDef._finalizers while the
+    runner is installed: function-scoped fixtures keep one value per runner
+    thread, module/class fixtures one value per node of that scope. Session
+    and package fixtures and the main thread keep using the instance attribute.
+    """
+
+    def __init__(self, name, default):
+        self.name = name
+        self.default = default
+
+    def _values(self, fixturedef):
+        scope = fixturedef.__dict__.get("_scope")
+        if scope not in _SCOPE_NODE_TYPES and scope is not Scope.Function:
+            return None
+        if isinstance(fixturedef, getattr(fixtures, "RequestFixtureDef", ())):
+            return None  # Request fixtures are created per request, never shared between threads
+        if scope is Scope.Function:
+            return _local.fixture_values.setdefault(fixturedef, {}) if _in_runner_thread() else None
+        node = _scope_node(fixturedef)
+        if node is None:
+            return None
+        return _node_fixture_values.setdefault((fixturedef, node), {})
+
+    def __get__(self, fixturedef, owner=None):
+        if fixturedef is None:
+            return self
+        values = self._values(fixturedef)
+        if values is None:
+            return fixturedef.__dict__[self.name]
+        if self.name not in values:
+            values[self.name] = self.default()
+        return values[self.name]
+
+    def __set__(self, fixturedef, value):
+        values = self._values(fixturedef)
+        if values is None:
+            fixturedef.__dict__[self.name] = value
+        else:
+            values[self.name] = value
+
+
+def _run_finalizers(finalizers, errors):
+    while finalizers:
+        try:
+            finalizers.pop()()
+        except Exception as e:
+            errors.append(e)
+
+
+def _raise_errors(errors, message):
+    if len(errors) == 1:
+        raise errors[0]
+    if errors:
+        raise BaseExceptionGroup(message, errors)
+
+
+class _SharedNodes:
+    """
+    Tears down package/module/class nodes once no test still needs them.
+
+    Counts the tests left under every node; a node's finalizers stay on the
+    stack of the thread that set its fixtures up, are handed over here when
+    that thread moves on, and run when the node's last test has finished.
+    """
+
+    def __init__(self, items):
+        self.remaining = Counter(node for item in items for node in self.shared_nodes(item))
+        self.finalizers = {}
+        self.errors = []        # (node, exception) from teardowns run outside a test's teardown phase
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def shared_nodes(item):
+        """
+        Returns the item's ancestors below the session, innermost first.
+        """
+        return list(reversed(item.listchain()[1:-1]))
+
+    def hand_over(self, node, finalizers):
+        """
+        Takes the finalizers of a node a thread no longer needs; runs them at
+        once if the node's tests are already done.
+        """
+        with self._lock:
+            if self.remaining[node] > 0:
+                self.finalizers.setdefault(node, []).append(finalizers)
+                return
+        errors = []
+        with _shared_fixture_lock:
+            _run_finalizers(finalizers, errors)
+        self.errors += [(node, e) for e in errors]
+
+    def finished(self, item, state):
+        """
+        Called after an item's teardown: tears down every ancestor whose last
+        test this was, including the thread's own stack entries for them.
+        """
+        done = []
+        with self._lock:
+            for node in self.shared_nodes(item):
+                self.remaining[node] -= 1
+                if self.remaining[node] == 0:
+                    done.append((node, self.finalizers.pop(node, [])))
+        errors = []
+        with _shared_fixture_lock:
+            for node, handed_over in done:
+                if state.stack and list(state.stack)[-1] is node:
+                    handed_over.append(state.stack.popitem()[1][0])
+                for finalizers in reversed(handed_over):
+                    _run_finalizers(finalizers, errors)
+        _raise_errors(errors, "errors while tearing down shared fixtures")
+
+    def teardown_all(self):
+        """
+        Runs finalizers still handed over (tests that never ran, e.g. after -x).
+        """
+        errors = []
+        with self._lock:
+            pending, self.finalizers = self.finalizers, {}
+        for node in reversed(list(pending)):
+            for finalizers in reversed(pending[node]):
+                _run_finalizers(finalizers, errors)
+        _raise_errors(errors, "errors while tearing down shared fixtures")
+
+
+class _ThreadSetupState(SetupState):
+    """
+    SetupState of one runner thread. Wider-scoped nodes are not torn down
+    when the thread moves to another module/class: their finalizers are
+    handed over to _SharedNodes, which runs them when no thread needs them.
+    """
+
+    def __init__(self, nodes):
+        super().__init__()
+        self.nodes = nodes
+        self.last_item = None
+
+    def setup(self, item):
+        needed = item.listchain()
+        while self.stack and list(self.stack)[-1] not in needed:
+            node, (finalizers, _) = self.stack.popitem()
+            self.nodes.hand_over(node, finalizers)
+        super().setup(item)
+
+    def teardown_all(self):
+        """
+        Tears down what is left on the stack (session and unfinished nodes).
+        """
+        self.teardown_exact(None)
+
+
+class _ThreadSetupStates:
+    """
+    Stands in for session._setupstate: forwards to the calling thread's SetupState.
+    """
+
+    def __init__(self, main_state, nodes):
+        self.main_state = main_state
+        self.nodes = nodes
+        self.states = []
+        self._lock = threading.Lock()
+
+    def current(self):
+        if not _in_runner_thread():
+            return self.main_state
+        state = getattr(_local, "setup_state", None)
+        if state is None:
+            state = _local.setup_state = _ThreadSetupState(self.nodes)
+            with self._lock:
+                self.states.append(state)
+        return state
+
+    def __getattr__(self, name):
+        return getattr(self.current(), name)
+
+
+class _ThreadLogCapture(logging.Handler):
+    """
+    Root handler that keeps each runner thread's records for its current test phase.
+    """
+
+    def emit(self, record):
+        buffer = getattr(_local, "log_buffer", None)
+        if buffer is not None:
+            buffer.append(self.format(record))
+
+
+class ThreadedRunner:
+    """
+    Runs session.items on a thread pool (see module docstring).
+
+    Usage (conftest.py):
+        def pytest_runtestloop(session):
+            return ThreadedRunner(session, threads=4).run()
+    """
+
+    def __init__(self, session, threads):
+        """
+        Args:
+            session: The pytest session.
+            threads: Number of tests run at the same time (one browser each).
+        """
+        self.session = session
+        self.config = session.config
+        self.threads = threads
+        self._report_lock = threading.Lock()
+
+    @staticmethod
+    def current_thread_name():
+        """
+        Returns the runner thread's name (e.g. "tk-thread_0"), or None outside runner threads.
+        """
+        return threading.current_thread().name if _in_runner_thread() else None
+
+    def run(self):
+        """
+        Runs every collected test and tears down shared fixtures. Returns True
+        (pytest_runtestloop result); raises session.Failed/Interrupted like pytest's own loop.
+        """
+        session = self.session
+        if session.testsfailed and not self.config.option.continue_on_collection_errors:
+            raise session.Interrupted(
+                f"{session.testsfailed} error{'s' if session.testsfailed != 1 else ''} during collection")
+
+        logger.info(f"Running {len(session.items)} test(s) on {self.threads} thread(s).")
+        self._check_pytest_internals()
+        self.nodes = _SharedNodes(session.items)
+        states = _ThreadSetupStates(session._setupstate, self.nodes)
+        restore = self._install(states)
+        try:
+            with ThreadPoolExecutor(max_workers=self.threads, thread_name_prefix=THREAD_NAME_PREFIX) as pool:
+                futures = [pool.submit(self._run_item, item) for item in session.items]
+                try:
+                    for future in futures:
+                        future.result()
+                except BaseException:
+                    for future in futures:
+                        future.cancel()
+                    raise
+            self._teardown_shared(states)
+        finally:
+            restore()
+
+        if session.shouldfail:
+            raise session.Failed(session.shouldfail)
+        if session.shouldstop:
+            raise session.Interrupted(session.shouldstop)
+        return True
+
+    @staticmethod
+    def _check_pytest_internals():
+        """
+        Raises pytest.UsageError if this pytest lacks the internals the runner replaces.
+        """
+        missing = [f"FixtureDef.{name}" for name in ("execute", "finish", "cache_key")
+                   if not hasattr(fixtures.FixtureDef, name)]
+        if not isinstance(getattr(SetupState(), "stack", None), dict):
+            missing.append("SetupState.stack")
+        if missing:
+            raise pytest.UsageError(f"--tk-threads does not support pytest {pytest.__version__} "
+                                    f"(missing {', '.join(missing)}); run without it.")
+
+    def _install(self, states):
+        """
+        Swaps in the thread-aware pytest internals and log handling.
+        Returns a callable undoing it.
+        """
+        session = self.session
+        original_setupstate = session._setupstate
+        original_execute = fixtures.FixtureDef.execute
+        original_finish = fixtures.FixtureDef.finish
+
+        def for_request_node(method, fixturedef, request):
+            # Shared values are looked up from the request's node: a module fixture
+            # finished while the thread already runs a test of another module stays its own
+            previous, _local.request_node = getattr(_local, "request_node", None), request.node
+            try:
+                return method(fixturedef, request)
+            finally:
+                _local.request_node = previous
+
+        def execute(fixturedef, request):
+            if fixturedef._scope is Scope.Function or not _in_runner_thread():
+                return original_execute(fixturedef, request)
+            with _shared_fixture_lock:  # Create each shared fixture once per node
+                return for_request_node(original_execute, fixturedef, request)
+
+        def finish(fixturedef, request):  # Also on the main thread, for the final teardown
+            if fixturedef._scope is Scope.Function:
+                return original_finish(fixturedef, request)
+            return for_request_node(original_finish, fixturedef, request)
+
+        session._setupstate = states
+        fixtures.FixtureDef.execute = execute
+        fixtures.FixtureDef.finish = finish
+        fixtures.FixtureDef.cached_result = _ThreadLocalFixtureAttribute("cached_result", lambda: None)
+        fixtures.FixtureDef._finalizers = _ThreadLocalFixtureAttribute("_finalizers", list)
+
+        # pytest's log capture shares one handler between tests; use a per-thread one instead
+        logging_plugin = self.config.pluginmanager.get_plugin("logging-plugin")
+        if logging_plugin is not None:
+            self.config.pluginmanager.unregister(logging_plugin, "logging-plugin")
+        capture = _ThreadLogCapture()
+        capture.setFormatter(logging.Formatter(REPORT_LOG_FORMAT))
+        root = logging.getLogger()
+        root.addHandler(capture)
+        console_handlers = [(handler, handler.formatter) for handler in root.handlers
+                            if type(handler) is logging.StreamHandler]
+        for handler, _ in console_handlers:
+            handler.setFormatter(logging.Formatter(THREAD_LOG_FORMAT))
+
+        def restore():
+            session._setupstate = original_setupstate
+            fixtures.FixtureDef.execute = original_execute
+            fixtures.FixtureDef.finish = original_finish
+            del fixtures.FixtureDef.cached_result
+            del fixtures.FixtureDef._finalizers
+            root.removeHandler(capture)
+            for handler, formatter in console_handlers:
+                handler.setFormatter(formatter)
+            if logging_plugin is not None:
+                self.config.pluginmanager.register(logging_plugin, "logging-plugin")
+            _node_fixture_values.clear()
+
+        return restore
+
+    def _run_item(self, item):
+        """
+        Runs setup/call/teardown of one test on the calling thread and logs its reports.
+        Mirrors _pytest.runner.runtestprotocol, except that teardown stops at the
+        test itself so fixtures shared with other threads stay up.
+        """
+        if self.session.shouldfail or self.session.shouldstop:
+            return
+        _local.runner = True
+        _local.item = item
+        if not hasattr(_local, "fixture_values"):
+            _local.fixture_values = weakref.WeakKeyDictionary()
+        state = self.session._setupstate.current()
+        state.last_item = item
+        if hasattr(item, "_request") and not item._request:
+            item._initrequest()
+        results = []
+        try:
+            results.append(self._call(item, "setup"))
+            if results[0][0].passed and not self.config.getoption("setuponly", False):
+                results.append(self._call(item, "call"))
+            results.append(self._call(item, "teardown", after=lambda: self.nodes.finished(item, state),
+                                      nextitem=item.parent))
+        finally:
+            if hasattr(item, "_request"):
+                item._request = False
+                item.funcargs = None
+            with self._report_lock:
+                item.ihook.pytest_runtest_logstart(nodeid=item.nodeid, location=item.location)
+                for report, call in results:
+                    item.ihook.pytest_runtest_logreport(report=report)
+                    if check_interactive_exception(call, report):
+                        item.ihook.pytest_exception_interact(node=item, call=call, report=report)
+                item.ihook.pytest_runtest_logfinish(nodeid=item.nodeid, location=item.location)
+
+    def _call(self, item, when, after=None, **kwargs):
+        hook = getattr(item.ihook, f"pytest_runtest_{when}")
+
+        def run():
+            try:
+                hook(item=item, **kwargs)
+            finally:
+                if after is not None:
+                    after()  # Part of the phase (e.g. tearing down the class/module the test was last of)
+
+        reraise = (pytest.exit.Exception,)
+        if not self.config.getoption("usepdb", False):
+            reraise += (KeyboardInterrupt,)
+        _local.log_buffer = []
+        try:
+            call = pytest.CallInfo.from_call(run, when=when, reraise=reraise)
+        finally:
+            records, _local.log_buffer = _local.log_buffer, None
+        if records:
+            item.add_report_section(when, "log", "\n".join(records))
+        return item.ihook.pytest_runtest_makereport(item=item, call=call), call
+
+    def _teardown_shared(self, states):
+        """
+        Tears down the fixtures each thread set up (session, and nodes whose tests
+        did not all run) after all threads are done. Failures are reported on the
+        thread's last test; late node teardown failures on the session's last test.
+        """
+        last_item = self.session.items[-1] if self.session.items else None
+        calls = [(last_item, pytest.CallInfo.from_call(self.nodes.teardown_all, when="teardown"))]
+        for _, error in self.nodes.errors:
+            calls.append((last_item, pytest.CallInfo.from_call(lambda error=error: self._reraise(error),
+                                                               when="teardown")))
+        for item, call in calls:
+            if call.excinfo is None or item is None:
+                continue
+            report = item.ihook.pytest_runtest_makereport(item=item, call=call)
+            item.ihook.pytest_runtest_logreport(report=report)
+        for state in states.states:
+            item = state.last_item
+            call = pytest.CallInfo.from_call(state.teardown_all, when="teardown")
+            if call.excinfo is None or item is None:
+                continue
+            report = item.ihook.pytest_runtest_makereport(item=item, call=call)
+            item.ihook.pytest_runtest_logreport(report=report)
+
+    @staticmethod
+    def _reraise(error):
+        raise error
@@ -0,0 +1,146 @@
+"""
+Unique ID generation for Trackora automation framework.
+IDs combine a short run id, the xdist worker (or host + process) and a
+per-process counter, so names created in the same second, on different
+workers or on different machines never collide.
+"""
+
+import hashlib
+import itertools
+import os
+import secrets
+import socket
+import threading
+
+ALPHABET = "0123456789abcdefghijklmnopqrstuvwxyz"
+
+
+def to_base36(number):
+    """
+    Encodes a non-negative integer in lowercase base36 (compact, URL/email safe).
+    """
+    digits = ""
+    while True:
+        number, remainder = divmod(number, 36)
+        digits = ALPHABET[remainder] + digits
+        if not number:
+            return digits
+
+
+class UniqueIds:
+    """
+    Collision-free ID service: <run id><source><counter>, e.g. "3f9a2c" + "g01" + "a".
+
+    - run id: shared by every worker of one pytest-xdist run (PYTEST_XDIST_TESTRUNUID),
+      or TRACKORA_RUN_ID, or random per process
+    - source: "g<n>" for xdist worker gw<n>; otherwise a host hash plus the pid
+      (fixed width, so the variable-length counter after it stays unambiguous)
+    - counter: monotonic per process, thread-safe; bulk() reserves whole ranges
+
+    Usage:
+        UniqueIds.name("Dept")            -> "Dept_3f9a2cg010"
+        UniqueIds.email("qa@trackora.io") -> "qa_3f9a2cg011@trackora.io"
+        UniqueIds.bulk("Proj", 500)       -> ["Proj_3f9a2cg012", ...]
+    """
+
+    _lock = threading.Lock()
+    _counter = itertools.count()
+    _prefix = None
+    _run = None
+
+    @classmethod
+    def run_id(cls):
+        """
+        Returns the short run id shared by all workers of this run.
+        """
+        if cls._run is None:
+            with cls._lock:
+                if cls._run is None:
+                    cls._run = cls._run_id()
+        return cls._run
+
+    @classmethod
+    def prefix(cls):
+        """
+        Returns the run id + source part shared by every ID from this process.
+        """
+        if cls._prefix is None:
+            with cls._lock:
+                if cls._prefix is None:
+                    cls._prefix = (cls._run or cls._run_id()) + cls._source()
+                    cls._run = cls._prefix[:6]
+        return cls._prefix
+
+    @classmethod
+    def next_id(cls):
+        """
+        Returns a new unique ID token (lowercase letters and digits).
+        """
+        with cls._lock:
+            number = next(cls._counter)
+        return cls.prefix() + to_base36(number)
+
+    @classmethod
+    def reserve(cls, count):
+        """
+        Reserves `count` consecutive counter values in one locked step.
+        Returns the list of ID tokens.
+        """
+        with cls._lock:
+            start = next(cls._counter)
+            cls._counter = itertools.count(start + count)
+        prefix = cls.prefix()
+        return [prefix + to_base36(number) for number in range(start, start + count)]
+
+    @classmethod
+    def name(cls, base_name, separator="_"):
+        """
+        Returns base_name with a unique suffix.
+        """
+        return f"{base_name}{separator}{cls.next_id()}"
+
+    @classmethod
+    def email(cls, base_email):
+        """
+        Returns base_email with a unique suffix on the local part.
+        """
+        username, domain = base_email.split("@")
+        return f"{username}_{cls.next_id()}@{domain}"
+
+    @classmethod
+    def bulk(cls, base_name, count, separator="_"):
+        """
+        Returns `count` unique names for data factories (one lock acquisition).
+        """
+        return [f"{base_name}{separator}{token}" for token in cls.reserve(count)]
+
+    @classmethod
+    def reset(cls):
+        """
+        Forgets the prefix and restarts the counter (after fork, or in a new run).
+        """
+        cls._lock = threading.Lock()
+        cls._counter = itertools.count()
+        cls._prefix = None
+        cls._run = None
+
+    @staticmethod
+    def _run_id():
+        run_uid = os.environ.get("TRACKORA_RUN_ID") or os.environ.get("PYTEST_XDIST_TESTRUNUID")
+        if run_uid:
+            return hashlib.sha1(run_uid.encode()).hexdigest()[:6]
+        return secrets.token_hex(3)
+
+    @staticmethod
+    def _source():
+        worker = os.environ.get("PYTEST_XDIST_WORKER", "")
+        if worker.startswith("gw") and worker[2:].isdigit() and not os.environ.get("TRACKORA_RUN_ID"):
+            return "g" + to_base36(int(worker[2:])).zfill(2)
+        # Not an xdist worker (or a run id shared outside xdist): host + process
+        host = hashlib.sha1(socket.gethostname().encode()).hexdigest()[:3]
+        return "h" + host + to_base36(os.getpid()).zfill(5)
+
+
+if hasattr(os, "register_at_fork"):
+    # A forked child must not reuse the parent's prefix/counter
+    os.register_at_fork(after_in_child=UniqueIds.reset)
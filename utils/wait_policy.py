@@ -0,0 +1,161 @@
+"""
+Wait policy for Trackora automation framework.
+The browser runs with implicit wait 0; every wait is an explicit, timed call
+recorded in a per-test ledger, so hidden implicit waits cannot slow down
+negative checks or stack on top of WebDriverWait.
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import TimeoutException, WebDriverException
+
+
+class WaitLedger(threading.local):
+    """
+    Per-test record of every wait: kind, locator, timeout, time spent and outcome.
+    Reset before each test and attached to the report afterwards.
+    Kept per thread, so threaded runs (--tk-threads) get one ledger per running test.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        """
+        Clears recorded waits (called before each test).
+        """
+        with self._lock:
+            self.calls = []
+            self.implicit_wait = None
+
+    def record(self, kind, locator, timeout, elapsed, outcome):
+        """
+        Records one wait call.
+        """
+        with self._lock:
+            self.calls.append({
+                "kind": kind,
+                "locator": str(locator) if locator else None,
+                "timeout_s": timeout,
+                "elapsed_s": round(elapsed, 3),
+                "outcome": outcome,
+            })
+
+    def summary(self):
+        """
+        Returns totals for the current test: number of waits, timeout budget,
+        time actually waited, timeouts hit, the slowest call and the
+        implicit wait observed on the driver at the end of the test.
+        """
+        with self._lock:
+            calls = list(self.calls)
+            implicit_wait = self.implicit_wait
+        slowest = max(calls, key=lambda call: call["elapsed_s"]) if calls else None
+        return {
+            "calls": len(calls),
+            "timeout_budget_s": round(sum(call["timeout_s"] for call in calls), 3),
+            "waited_s": round(sum(call["elapsed_s"] for call in calls), 3),
+            "timeouts": sum(1 for call in calls if call["outcome"] == "timeout"),
+            "slowest": slowest,
+            "implicit_wait_s": implicit_wait,
+        }
+
+
+class WaitPolicy:
+    """
+    Explicit-only waiting for a driver.
+
+    - until(): WebDriverWait with accounting
+    - no_wait(): context manager for instant presence checks
+    - find_all() / is_present(): element lookups that never block on implicit waits
+    """
+
+    implicit_wait = 0       # Implicit wait the framework applies to every browser (config)
+    default_timeout = 10    # Default explicit wait in seconds (config)
+    ledger = WaitLedger()
+
+    def __init__(self, driver):
+        self.driver = driver
+
+    @classmethod
+    def configure(cls, implicit_wait=None, default_timeout=None):
+        """
+        Sets the implicit wait applied to browsers and the default explicit timeout.
+        """
+        if implicit_wait is not None:
+            cls.implicit_wait = implicit_wait
+        if default_timeout is not None:
+            cls.default_timeout = default_timeout
+
+    def until(self, condition, timeout=None, kind="wait", locator=None, message="", poll=0.5):
+        """
+        Waits up to `timeout` seconds for `condition` (checked every `poll` seconds)
+        and records the call.
+        Returns the condition's result; raises TimeoutException on timeout.
+        """
+        timeout = self.default_timeout if timeout is None else timeout
+        started = time.perf_counter()
+        outcome = "ok"
+        try:
+            return WebDriverWait(self.driver, timeout, poll_frequency=poll).until(condition, message)
+        except TimeoutException:
+            outcome = "timeout"
+            raise
+        finally:
+            self.ledger.record(kind, locator, timeout, time.perf_counter() - started, outcome)
+
+    @contextmanager
+    def no_wait(self):
+        """
+        Runs the block with implicit wait 0, so find_element(s) return immediately.
+        Only touches the driver when a non-zero implicit wait is configured.
+        Usage:
+            with page.no_wait():
+                buttons = driver.find_elements(*locator)
+        """
+        if self.implicit_wait:
+            self.driver.implicitly_wait(0)
+        try:
+            yield
+        finally:
+            if self.implicit_wait:
+                self.driver.implicitly_wait(self.implicit_wait)
+
+    def find_all(self, locator, timeout=0):
+        """
+        Returns all elements matching locator.
+        With timeout > 0, first waits (explicitly) for at least one match;
+        returns an empty list if none appear in time.
+        """
+        if timeout:
+            try:
+                self.until(EC.presence_of_element_located(locator), timeout, "find_all", locator)
+            except TimeoutException:
+                return []
+        started = time.perf_counter()
+        with self.no_wait():
+            elements = self.driver.find_elements(*locator)
+        self.ledger.record("presence", locator, 0, time.perf_counter() - started,
+                           "found" if elements else "absent")
+        return elements
+
+    def is_present(self, locator):
+        """
+        Returns True if at least one element matches locator right now (no waiting).
+        """
+        return bool(self.find_all(locator))
+
+    def verify_no_implicit_wait(self):
+        """
+        Reads the browser's implicit wait and stores it in the ledger.
+        Returns True when it is 0, i.e. no hidden implicit waits are active.
+        """
+        try:
+            self.ledger.implicit_wait = self.driver.timeouts.implicit_wait
+        except WebDriverException:
+            return False
+        return self.ledger.implicit_wait == 0
@@ -0,0 +1,184 @@
+"""
+Pre-warmed browsers for Trackora automation framework.
+A background thread keeps one or two browsers launched, on the login route
+and fully loaded, so the next browser launch overlaps with the running test
+instead of blocking the next one.
+"""
+
+import logging
+import queue
+import threading
+import time
+from selenium.common.exceptions import WebDriverException
+from utils.driver_factory import DriverFactory
+
+logger = logging.getLogger(__name__)
+
+
+class WarmBrowserStats:
+    """
+    Hit/miss counters and time spent waiting for a browser.
+    A hit is a browser that was already warming; a miss is a synchronous launch.
+    Session counters are shared; per-test counters are kept per thread (--tk-threads).
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self.session = {"hits": 0, "misses": 0, "wait_s": 0.0}
+        self.reset()
+
+    @property
+    def test(self):
+        if not hasattr(self._local, "test"):
+            self.reset()
+        return self._local.test
+
+    def reset(self):
+        """
+        Clears the per-test counters (called before each test).
+        """
+        with self._lock:
+            self._local.test = {"hits": 0, "misses": 0, "wait_s": 0.0}
+
+    def record(self, hit, waited):
+        test = self.test
+        with self._lock:
+            for counters in (self.session, test):
+                counters["hits" if hit else "misses"] += 1
+                counters["wait_s"] += waited
+
+    def summary(self, scope="test"):
+        """
+        Returns {"hits", "misses", "wait_s", "hit_rate"} for "test" or "session".
+        """
+        test = self.test
+        with self._lock:
+            counters = dict(test if scope == "test" else self.session)
+        total = counters["hits"] + counters["misses"]
+        counters["wait_s"] = round(counters["wait_s"], 3)
+        counters["hit_rate"] = round(counters["hits"] / total, 2) if total else None
+        return counters
+
+
+class WarmBrowserFactory:
+    """
+    Keeps `spares` browsers ready in the background (one factory per xdist worker).
+
+    - start(): begins warming
+    - get(): returns a warm browser (waiting for one that is still starting)
+      or, if warming is not keeping up or failing, launches one synchronously
+    - shutdown(): quits the spare browsers
+
+    Usage:
+        factory = WarmBrowserFactory(config, spares=1).start()
+        driver = factory.get()
+    """
+
+    stats = WarmBrowserStats()
+
+    def __init__(self, config, spares=1, launch_timeout=60):
+        """
+        Args:
+            config: Framework config (browser, base_url, waits, browser profile).
+            spares: Number of browsers kept ready.
+            launch_timeout: Seconds get() waits for a browser that is still warming.
+        """
+        self.config = config
+        self.spares = max(1, spares)
+        self.launch_timeout = launch_timeout
+        self._ready = queue.Queue()
+        self._demand = threading.Event()
+        self._stop = threading.Event()
+        self._thread = None
+        self.failures = 0
+
+    def start(self):
+        """
+        Starts the warming thread. Returns self.
+        """
+        self._demand.set()
+        self._thread = threading.Thread(target=self._warm_loop, name="warm-browsers", daemon=True)
+        self._thread.start()
+        return self
+
+    def get(self):
+        """
+        Returns a browser on the login route with the page loaded.
+        Caller owns it (quit() or hand it to the driver pool).
+        """
+        started = time.perf_counter()
+        while True:
+            try:
+                driver = self._ready.get_nowait()
+            except queue.Empty:
+                driver = None
+            if driver is None and self._warming_healthy():
+                # A browser is already on its way; waiting beats launching another
+                self._demand.set()
+                try:
+                    driver = self._ready.get(timeout=self.launch_timeout)
+                except queue.Empty:
+                    pass
+            self._demand.set()  # Start warming the replacement right away
+            if driver is None:
+                driver = DriverFactory.create_driver(self.config)
+                self.stats.record(hit=False, waited=time.perf_counter() - started)
+                return driver
+            if self._is_ready(driver):
+                self.stats.record(hit=True, waited=time.perf_counter() - started)
+                return driver
+            logger.warning("Warm browser is no longer responsive; discarding it.")
+            self._quit(driver)
+
+    def shutdown(self):
+        """
+        Stops warming and quits the spare browsers.
+        """
+        self._stop.set()
+        self._demand.set()
+        if self._thread:
+            self._thread.join(timeout=self.launch_timeout)
+        while True:
+            try:
+                self._quit(self._ready.get_nowait())
+            except queue.Empty:
+                break
+        summary = self.stats.summary("session")
+        logger.info(f"Warm browsers: {summary['hits']} hit(s), {summary['misses']} miss(es), "
+                    f"waited {summary['wait_s']}s in total.")
+
+    def _warm_loop(self):
+        while not self._stop.is_set():
+            self._demand.wait()
+            self._demand.clear()
+            while not self._stop.is_set() and self._ready.qsize() < self.spares:
+                try:
+                    driver = DriverFactory.create_driver(self.config)
+                    if self._stop.is_set():
+                        self._quit(driver)
+                        return
+                    self._ready.put(driver)
+                    self.failures = 0
+                except Exception as e:
+                    self.failures += 1
+                    logger.warning(f"Warming a browser failed ({self.failures} in a row): {e}")
+                    self._stop.wait(min(30, 2 ** self.failures))
+
+    def _warming_healthy(self):
+        # After repeated launch failures, stop waiting on the warming thread
+        return self._thread is not None and self._thread.is_alive() and self.failures < 3
+
+    @staticmethod
+    def _is_ready(driver):
+        try:
+            return driver.execute_script("return document.readyState") == "complete"
+        except WebDriverException:
+            return False
+
+    @staticmethod
+    def _quit(driver):
+        try:
+            driver.quit()
+        except Exception as e:
+            logger.warning(f"Error while quitting browser: {e}")